@@ -10,6 +10,17 @@ class Config:
         self.fullscreen = False
         self.vsync = True
         self.show_fps = True  # Debug
+        self.starfield_backend = 'layers'  # 'layers' (texturas) ou 'numpy' (milhares de estrelas)
+        self.starfield_star_count = 200
+        self.dirty_rects = False           # Atualiza só as áreas alteradas (fundo estático)
+        self.dirty_rect_threshold = 0.5    # Fração da tela acima da qual faz flip completo
+        self.render_resolution = None      # Resolução interna, ex: (960, 540) (None = nativa)
+        self.render_smooth = False         # Upscale com smoothscale em vez de scale
+        self.render_hud_native = True      # HUD/menus desenhados na resolução da janela
+        self.asset_memory_budget_mb = 256  # Limite das imagens carregadas (LRU)
+        self.asset_disk_cache = True       # Guarda pixels decodificados em .cache/assets
+        self.particle_capacity = 4096      # Máximo de partículas vivas
+        self.particle_spawn_budget = 600   # Máximo de partículas criadas por frame renderizado
         
         # Áudio
         self.master_volume = 0.8
@@ -20,6 +31,11 @@ class Config:
         self.debug_mode = True
         self.show_hitboxes = True  # ← ADICIONE ESTA LINHA
         
+        # Profiler de frame
+        self.profiler_enabled = True  # Mede as fases de cada frame
+        self.show_profiler = False    # Gráfico (F3)
+        self.profiler_dump = None     # Caminho .csv/.json salvo ao sair
+    
     def load(self):
         """Carrega configurações de arquivo (implementar depois)"""
         pass
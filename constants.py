@@ -7,6 +7,11 @@ SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 FPS = 60
 
+# Simulação em passo fixo (independente do FPS da tela)
+SIMULATION_RATE = 120
+SIMULATION_DT = 1.0 / SIMULATION_RATE
+MAX_SIMULATION_STEPS = 8  # Passos por frame antes de descartar o atraso
+
 # Cores (RGB)
 COLOR_BLACK = (0, 0, 0)
 COLOR_WHITE = (255, 255, 255)
@@ -5,18 +5,36 @@ Um shoot 'em up roguelike espacial
 Sprint 1: Core Gameplay - Movimento, Tiro, Input, Background
 """
 
+import argparse
 import pygame
 import sys
 from constants import *
 from config import config
 from src.states.game_state import GameState
+from src.core.dirty_rects import DirtyRectTracker
+from src.core.resource_manager import asset_manager
+from src.core.replay import (
+    RecordingInputManager, ReplayInputManager, ReplayRecorder, ReplayPlayer
+)
 
 
 class Game:
     """Classe principal do jogo"""
     
-    def __init__(self):
-        """Inicializa o jogo"""
+    def __init__(self, seed=None, record=None, replay=None, uncapped=False, profile_dump=None,
+                 dirty_rects=None, resolution=None):
+        """
+        Inicializa o jogo
+        
+        Args:
+            seed (int): Seed da run (None = aleatória)
+            record (str): Grava o input da run neste arquivo
+            replay (str): Reproduz um replay gravado (usa a seed dele)
+            uncapped (bool): Replay sem limite de FPS (fast-forward)
+            profile_dump (str): Salva o trace do profiler ao sair (.csv/.json)
+            dirty_rects (bool): Força o modo dirty rects (None = config)
+            resolution (tuple): Resolução interna do mundo (None = config)
+        """
         # Inicializar Pygame
         pygame.init()
         
@@ -41,13 +59,49 @@ class Game:
         self.running = True
         self.dt = 0
         
+        # Passo fixo: tempo real ainda não simulado e atraso descartado
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+        
+        # Dirty rects (opcional): só as áreas alteradas vão para o display
+        if dirty_rects is not None:
+            config.dirty_rects = dirty_rects
+        
+        # Resolução interna reduzida (o upscale repinta a janela toda)
+        if resolution is not None:
+            config.render_resolution = resolution
+        if config.render_resolution and config.dirty_rects:
+            print("⚠️ Dirty rects desativado: resolução interna reduzida")
+            config.dirty_rects = False
+        self.dirty_tracker = DirtyRectTracker(threshold=config.dirty_rect_threshold)
+        
+        # Profiler
+        if profile_dump:
+            config.profiler_dump = profile_dump
+        
+        # Replay / gravação
+        self.replay = ReplayPlayer(replay) if replay else None
+        self.recorder = None
+        self.uncapped = uncapped
+        
+        input_manager = None
+        if self.replay:
+            input_manager = ReplayInputManager()
+            seed = self.replay.seed
+        elif record:
+            input_manager = RecordingInputManager()
+        
         # Estado de gameplay
-        self.game_state = GameState(self.screen)
+        self.game_state = GameState(self.screen, input_manager=input_manager, seed=seed)
+        
+        if record and not self.replay:
+            self.recorder = ReplayRecorder(record, self.game_state.seed)
         
         print(f"✓ {GAME_TITLE} inicializado!")
         print(f"✓ Pygame versão: {pygame.version.ver}")
         print(f"✓ Resolução: {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
         print(f"✓ FPS alvo: {FPS}")
+        print(f"✓ Simulação: {SIMULATION_RATE} Hz (passo fixo)")
     
     def handle_events(self):
         """Processa eventos de input"""
@@ -72,26 +126,145 @@ class Game:
                     config.show_fps = not config.show_fps
                     print(f"Show FPS: {config.show_fps}")
                 
-                # K para kill player (teste game over)
-                if event.key == pygame.K_k:
-                    self.game_state.player.take_damage(999)
-                    print("Player killed (test)")
+                # F3 para toggle do profiler
+                if event.key == pygame.K_F3:
+                    config.show_profiler = not config.show_profiler
+                    print(f"Show Profiler: {config.show_profiler}")
+        
+        # Eventos de gameplay do replay são entregues a cada passo gravado
+        if self.replay:
+            return
+        
+        if self.recorder:
+            self.recorder.add_events(events)
         
         # Passar eventos para o game state
         self.game_state.handle_events(events)
     
-    def update(self):
-        """Atualiza lógica do jogo"""
+    def update(self, dt):
+        """
+        Avança a simulação um passo
+        
+        Args:
+            dt (float): Passo em segundos (SIMULATION_DT, ou o do replay)
+        """
         fps = self.clock.get_fps()
-        self.game_state.update(self.dt, fps)
+        
+        if self.replay:
+            self.game_state.input_manager.pending_state = self.replay.state
+        
+        self.game_state.update(dt, fps)
+        
+        if self.recorder:
+            self.recorder.end_frame(dt, self.game_state.input_manager.state)
     
-    def render(self):
-        """Renderiza o jogo na tela"""
-        # GameState renderiza tudo
-        self.game_state.render()
+    def simulate(self, frame_time):
+        """
+        Roda quantos passos fixos couberem no tempo real acumulado
+        
+        O resto fica no acumulador para o próximo frame. Se um travamento
+        pedir mais que MAX_SIMULATION_STEPS passos, o atraso é descartado
+        (o jogo desacelera por um instante em vez de entrar em espiral).
+        
+        Args:
+            frame_time (float): Tempo real desde o último frame (segundos)
+        
+        Returns:
+            float: Fração do próximo passo já decorrida (alpha do render)
+        """
+        self.accumulator += frame_time
+        
+        steps = 0
+        while self.accumulator >= SIMULATION_DT and steps < MAX_SIMULATION_STEPS:
+            self.update(SIMULATION_DT)
+            self.accumulator -= SIMULATION_DT
+            steps += 1
         
-        # Atualizar display
-        pygame.display.flip()
+        if self.accumulator >= SIMULATION_DT:
+            dropped = self.accumulator - self.accumulator % SIMULATION_DT
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+        
+        return self.accumulator / SIMULATION_DT
+    
+    def replay_step(self):
+        """
+        Avança um passo gravado (eventos do passo + update com o dt gravado)
+        
+        Returns:
+            bool: False se o replay terminou
+        """
+        if not self.replay.next_frame():
+            return False
+        
+        self.game_state.handle_events(self.replay.events)
+        self.update(self.replay.dt)
+        return True
+    
+    def simulate_replay(self, frame_time):
+        """
+        Consome os passos gravados que couberem no tempo real acumulado
+        
+        Mesmo acumulador do simulate(), mas cada passo usa o dt gravado
+        (replays antigos podem ter dt variável).
+        
+        Args:
+            frame_time (float): Tempo real desde o último frame (segundos)
+        
+        Returns:
+            float: Alpha do render, ou None se o replay terminou
+        """
+        self.accumulator += frame_time
+        
+        steps = 0
+        while steps < MAX_SIMULATION_STEPS:
+            # dt do próximo passo gravado (testado e descontado o mesmo valor)
+            step_dt = self.replay.peek_dt()
+            if step_dt is None:
+                return None
+            if self.accumulator < step_dt:
+                break
+            
+            self.replay_step()
+            self.accumulator -= step_dt
+            steps += 1
+        
+        step_dt = self.replay.peek_dt() or SIMULATION_DT
+        if self.accumulator >= step_dt:
+            dropped = self.accumulator - self.accumulator % step_dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+        
+        return self.accumulator / step_dt
+    
+    def render(self, alpha=1.0):
+        """
+        Renderiza o jogo na tela
+        
+        Args:
+            alpha (float): Fração do passo de simulação (interpolação)
+        """
+        if not config.dirty_rects:
+            # GameState renderiza tudo
+            self.game_state.render(alpha=alpha)
+            
+            # Atualizar display
+            pygame.display.flip()
+            return
+        
+        # Dirty rects: restaura/desenha só o que mudou
+        tracker = self.dirty_tracker
+        drawn, repainted = self.game_state.render(
+            dirty=True,
+            restore_rects=tracker.get_restore_rects(),
+            alpha=alpha
+        )
+        update_rects = tracker.end_frame(drawn, repainted)
+        
+        if update_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(update_rects)
     
     def run(self):
         """Loop principal do jogo"""
@@ -110,6 +283,7 @@ class Game:
         print("  -/+: Densidade de Estrelas (50-500)")
         print("  H: Toggle Hitbox")
         print("  F: Toggle FPS")
+        print("  F3: Profiler (tempo por subsistema)")
         print("  K: Kill Player (testar Game Over)")
         print()
         print("  ESC: Sair")
@@ -118,23 +292,57 @@ class Game:
         print()
         
         while self.running:
-            # Delta time (em segundos)
-            self.dt = self.clock.tick(FPS) / 1000.0
+            # Tempo real do frame (em segundos); replay uncapped sem limite
+            if self.replay and self.uncapped:
+                self.dt = self.clock.tick(0) / 1000.0
+            else:
+                self.dt = self.clock.tick(FPS) / 1000.0
+            
+            profiler = self.game_state.profiler
+            if config.profiler_enabled:
+                profiler.begin_frame()
             
             # Processar eventos
             self.handle_events()
+            profiler.lap('events')
             
-            # Atualizar
-            self.update()
+            # Orçamento de partículas vale para o frame (todos os passos dele)
+            self.game_state.particles.begin_frame()
             
-            # Renderizar
-            self.render()
+            # Atualizar (passos fixos; o replay consome os passos gravados)
+            if not self.replay:
+                alpha = self.simulate(self.dt)
+            elif self.uncapped:
+                # Uncapped: um passo gravado por frame, o mais rápido possível
+                alpha = 1.0 if self.replay_step() else None
+            else:
+                alpha = self.simulate_replay(self.dt)
+            
+            if alpha is None:
+                print(f"🎬 Replay terminado ({self.replay.frames} frames)")
+                break
+            
+            # Renderizar (entre o penúltimo e o último passo)
+            self.render(alpha)
+            profiler.lap('present')
+            profiler.end_frame()
         
         # Cleanup
         self.quit()
     
     def quit(self):
         """Encerra o jogo"""
+        if self.recorder:
+            self.recorder.close()
+        
+        if config.profiler_dump:
+            self.game_state.profiler.dump(config.profiler_dump)
+        
+        asset_manager.shutdown()
+        
+        if self.dropped_time > 0:
+            print(f"⚠️ Atraso descartado pela simulação: {self.dropped_time:.2f}s")
+        
         print("\n" + "="*50)
         print("  Encerrando Plane Free")
         print("  Obrigado por jogar!")
@@ -145,8 +353,32 @@ class Game:
 
 def main():
     """Função principal"""
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument('--seed', type=int, default=None, help="Seed da run (reprodutível)")
+    parser.add_argument('--record', default=None, help="Grava o input da run (ex: run.pfr)")
+    parser.add_argument('--replay', default=None, help="Reproduz um replay gravado")
+    parser.add_argument('--uncapped', action='store_true', help="Replay sem limite de FPS")
+    parser.add_argument('--profile-dump', default=None, help="Salva o trace do profiler ao sair (.csv/.json)")
+    parser.add_argument('--dirty-rects', action='store_true', default=None,
+                        help="Atualiza só as áreas alteradas (fundo estático)")
+    parser.add_argument('--resolution', default=None,
+                        help="Resolução interna do mundo, ex: 960x540 (modo performance)")
+    args = parser.parse_args()
+    
+    resolution = None
+    if args.resolution:
+        resolution = tuple(int(value) for value in args.resolution.lower().split('x'))
+    
     # Criar e executar jogo
-    game = Game()
+    game = Game(
+        seed=args.seed,
+        record=args.record,
+        replay=args.replay,
+        uncapped=args.uncapped,
+        profile_dump=args.profile_dump,
+        dirty_rects=args.dirty_rects,
+        resolution=resolution
+    )
     game.run()
 
 
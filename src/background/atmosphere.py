@@ -0,0 +1,292 @@
+"""
+Atmosphere - Fundos por setor (gradiente, nebulosa e paleta de estrelas)
+"""
+
+import json
+import random
+import pygame
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+from src.core.render_target import ScaledView
+
+
+ATMOSPHERES_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..', 'data', 'atmospheres.json'))
+
+# Crossfade: duração padrão e quantos passos de alpha (cada passo = uma mistura)
+CROSSFADE_DURATION = 3.0
+CROSSFADE_STEPS = 8
+
+# Nebulosa desenhada N vezes menor e esticada (bordas suaves de graça)
+NEBULA_SCALE = 16
+
+
+def load_atmospheres(path=ATMOSPHERES_PATH):
+    """
+    Carrega as atmosferas do JSON
+    
+    Args:
+        path (str): Caminho do atmospheres.json
+    
+    Returns:
+        tuple: (lista de atmosferas ordenada por from_sector, duração do crossfade)
+    """
+    if not os.path.exists(path):
+        print(f"❌ ERRO: {path} não encontrado!")
+        return [], CROSSFADE_DURATION
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    atmospheres = sorted(data.get('atmospheres', []), key=lambda a: a.get('from_sector', 1))
+    print(f"✅ {len(atmospheres)} atmosferas carregadas")
+    return atmospheres, data.get('crossfade_duration', CROSSFADE_DURATION)
+
+
+def bake_backdrop(atmosphere, size):
+    """
+    Desenha o fundo de uma atmosfera (gradiente + nebulosa) em uma superfície
+    
+    A nebulosa é sorteada com um Random próprio (semente = id), então a
+    mesma atmosfera sempre tem o mesmo visual e não consome o visual_rng.
+    
+    Args:
+        atmosphere (dict): Definição da atmosfera
+        size (tuple): Tamanho da superfície (largura, altura)
+    
+    Returns:
+        pygame.Surface: Fundo opaco (convert se já houver display)
+    """
+    width, height = size
+    top, bottom = atmosphere['gradient']
+    
+    # Gradiente vertical: uma coluna de 1 px esticada na largura
+    column = pygame.Surface((1, height))
+    for y in range(height):
+        t = y / max(1, height - 1)
+        column.set_at((0, y), tuple(round(a + (b - a) * t) for a, b in zip(top, bottom)))
+    surface = pygame.transform.scale(column, size)
+    
+    # Nebulosa: manchas concêntricas em baixa resolução, esticadas com smoothscale
+    nebula = atmosphere.get('nebula')
+    if nebula and nebula.get('blobs', 0) > 0:
+        rng = random.Random(atmosphere['id'])
+        small_w = max(1, width // NEBULA_SCALE)
+        small_h = max(1, height // NEBULA_SCALE)
+        small = pygame.Surface((small_w, small_h), pygame.SRCALPHA)
+        r, g, b = nebula['color']
+        rings = 12
+        
+        for _ in range(nebula['blobs']):
+            radius = rng.randint(small_h // 6, small_h // 2) + 1
+            center = (rng.randrange(small_w), rng.randrange(small_h))
+            
+            # Anéis de fora para dentro, cada um somando um pouco de alpha
+            blob = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            for ring in range(rings):
+                alpha = nebula['alpha'] * (ring + 1) // rings
+                ring_radius = max(1, radius * (rings - ring) // rings)
+                pygame.draw.circle(blob, (r, g, b, alpha), (radius, radius), ring_radius)
+            small.blit(blob, (center[0] - radius, center[1] - radius))
+        
+        surface.blit(pygame.transform.smoothscale(small, size), (0, 0))
+    
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+
+class AtmosphereRenderer:
+    """
+    Fundo da atmosfera atual com crossfade entre setores
+    
+    Cada atmosfera é desenhada uma vez (bake_backdrop) e guardada. O
+    crossfade não mistura pixels a cada frame: o progresso é quantizado
+    em CROSSFADE_STEPS passos e a mistura só é refeita quando o passo
+    muda; nos outros frames o fundo é um único blit opaco.
+    """
+    
+    def __init__(self, atmospheres=None, crossfade_duration=None):
+        """
+        Inicializa o renderer
+        
+        Args:
+            atmospheres (list): Definições (None = carrega data/atmospheres.json)
+            crossfade_duration (float): Duração do crossfade (None = do JSON)
+        """
+        if atmospheres is None:
+            atmospheres, duration = load_atmospheres()
+            if crossfade_duration is None:
+                crossfade_duration = duration
+        
+        self.atmospheres = atmospheres
+        self.by_id = {atmosphere['id']: atmosphere for atmosphere in atmospheres}
+        self.crossfade_duration = crossfade_duration or CROSSFADE_DURATION
+        
+        # Estado do crossfade
+        self.current = None   # id da atmosfera atual
+        self.previous = None  # id da anterior (None = sem crossfade)
+        self.progress = 1.0   # 0 → 1 ao longo do crossfade
+        self.step = CROSSFADE_STEPS
+        
+        # Superfícies prontas (no tamanho do último render)
+        self.size = None
+        self.backdrops = {}  # id -> Surface
+        self.prefetched = None
+        self.blend = None
+        self.blend_key = None
+        
+        # Muda sempre que o fundo desenhado muda (snapshot do modo dirty rects)
+        self.generation = 0
+    
+    def for_sector(self, sector):
+        """
+        Atmosfera de um setor (a última com from_sector <= setor)
+        
+        Args:
+            sector (int): Número do setor
+        
+        Returns:
+            str: id da atmosfera (None se não há atmosferas)
+        """
+        chosen = None
+        for atmosphere in self.atmospheres:
+            if atmosphere.get('from_sector', 1) <= sector:
+                chosen = atmosphere['id']
+        return chosen
+    
+    def get_star_palette(self):
+        """
+        Paleta de estrelas em uso (troca na metade do crossfade)
+        
+        Returns:
+            list: Cores [far, mid, near] (None = estrelas brancas)
+        """
+        atmosphere_id = self.current
+        if self.previous is not None and self.progress < 0.5:
+            atmosphere_id = self.previous
+        
+        atmosphere = self.by_id.get(atmosphere_id)
+        return atmosphere.get('star_palette') if atmosphere else None
+    
+    def set_atmosphere(self, atmosphere_id, instant=False):
+        """
+        Troca de atmosfera (com crossfade)
+        
+        Args:
+            atmosphere_id (str): id da nova atmosfera
+            instant (bool): Troca sem crossfade
+        
+        Returns:
+            bool: True se a atmosfera mudou
+        """
+        if atmosphere_id == self.current or atmosphere_id not in self.by_id:
+            return False
+        
+        if instant or self.current is None:
+            self.previous = None
+            self.progress = 1.0
+            self.step = CROSSFADE_STEPS
+        else:
+            self.previous = self.current
+            self.progress = 0.0
+            self.step = 0
+        
+        self.current = atmosphere_id
+        self.generation += 1
+        print(f"🌌 Atmosfera: {self.by_id[atmosphere_id]['name']}")
+        return True
+    
+    def prefetch(self, atmosphere_id):
+        """
+        Desenha antes o fundo de uma atmosfera (ex: durante o countdown)
+        
+        Só funciona depois do primeiro render (tamanho conhecido).
+        
+        Args:
+            atmosphere_id (str): id da atmosfera
+        """
+        if self.size is None or atmosphere_id not in self.by_id:
+            return
+        
+        self.prefetched = atmosphere_id
+        self._get_backdrop(atmosphere_id)
+    
+    def _get_backdrop(self, atmosphere_id):
+        """Fundo pronto de uma atmosfera (desenha na primeira vez)"""
+        backdrop = self.backdrops.get(atmosphere_id)
+        if backdrop is None:
+            backdrop = bake_backdrop(self.by_id[atmosphere_id], self.size)
+            self.backdrops[atmosphere_id] = backdrop
+        return backdrop
+    
+    def update(self, dt):
+        """
+        Avança o crossfade
+        
+        Args:
+            dt (float): Delta time
+        """
+        if self.previous is None:
+            return
+        
+        self.progress = min(1.0, self.progress + dt / self.crossfade_duration)
+        step = min(int(self.progress * CROSSFADE_STEPS), CROSSFADE_STEPS)
+        if step != self.step:
+            self.step = step
+            self.generation += 1
+        
+        if self.progress >= 1.0:
+            # Fim do crossfade: libera o que não é mais usado
+            self.previous = None
+            self.blend = None
+            self.blend_key = None
+            keep = (self.current, self.prefetched)
+            for atmosphere_id in list(self.backdrops):
+                if atmosphere_id not in keep:
+                    del self.backdrops[atmosphere_id]
+    
+    def render(self, screen):
+        """
+        Desenha o fundo (um blit; uma mistura extra quando o passo muda)
+        
+        Args:
+            screen: Pygame surface ou ScaledView (desenha na resolução interna)
+        """
+        if isinstance(screen, ScaledView):
+            screen = screen.surface
+        
+        size = screen.get_size()
+        if size != self.size:
+            self.size = size
+            self.backdrops.clear()
+            self.blend = None
+            self.blend_key = None
+        
+        if self.current is None:
+            screen.fill(COLOR_BLACK)
+            return
+        
+        backdrop = self._get_backdrop(self.current)
+        if self.previous is None:
+            screen.blit(backdrop, (0, 0))
+            return
+        
+        # Crossfade: mistura refeita só quando o passo muda
+        key = (self.previous, self.current, self.step)
+        if key != self.blend_key:
+            if self.blend is None:
+                self.blend = pygame.Surface(size)
+                if pygame.display.get_surface() is not None:
+                    self.blend = self.blend.convert()
+            
+            self.blend.blit(self._get_backdrop(self.previous), (0, 0))
+            backdrop.set_alpha(255 * self.step // CROSSFADE_STEPS)
+            self.blend.blit(backdrop, (0, 0))
+            backdrop.set_alpha(None)
+            self.blend_key = key
+        
+        screen.blit(self.blend, (0, 0))
@@ -3,17 +3,26 @@ Starfield - Campo de estrelas animado
 """
 
 import pygame
-import random
+import numpy as np
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from constants import *
+from config import config
+from src.core.run_context import run_context
+from src.core.render_target import ScaledView
+from src.background.atmosphere import AtmosphereRenderer
 
 
 class Star:
-    """Uma estrela individual"""
+    """
+    Uma estrela individual
+    
+    Só guarda os dados usados para desenhar a textura da camada
+    (StarLayer.bake); o movimento é o scroll da camada.
+    """
     
     def __init__(self, x, y, size, speed, brightness):
         """
@@ -32,50 +41,120 @@ class Star:
         self.speed = speed
         self.brightness = brightness
         self.color = (brightness, brightness, brightness)
+
+
+# Faixas de profundidade: (nome, probabilidade acumulada, velocidade da camada)
+# A velocidade da camada é a média da faixa de velocidades das estrelas
+STAR_BANDS = (
+    ('far', 0.60, 30),    # Distantes (lentas, pequenas, escuras)
+    ('mid', 0.85, 60),    # Médias
+    ('near', 1.00, 115),  # Próximas (rápidas, grandes, brilhantes)
+)
+
+
+class StarLayer:
+    """
+    Uma faixa de profundidade pré-renderizada
+    
+    As estrelas da faixa são desenhadas uma única vez em uma textura do
+    tamanho da tela que se repete na vertical; o scroll é feito com dois
+    blits (a textura e a cópia logo acima).
+    """
+    
+    def __init__(self, name, speed):
+        """
+        Inicializa a camada
+        
+        Args:
+            name (str): Nome da faixa ('far', 'mid', 'near')
+            speed (float): Velocidade de descida (pixels/s)
+        """
+        self.name = name
+        self.speed = speed
+        self.scroll_speed_multiplier = 1.0
+        self.offset = 0.0
+        self.surface = None
+    
+    def bake(self, stars, tint=None):
+        """
+        Desenha as estrelas em uma textura para a camada
+        
+        Args:
+            stars (list): Estrelas desta faixa
+            tint (tuple): Cor da faixa na atmosfera (None = branco)
+        
+        Returns:
+            pygame.Surface: Textura (colorkey preto)
+        """
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(COLOR_BLACK)
+        
+        for star in stars:
+            x = int(star.x)
+            y = int(star.y) % SCREEN_HEIGHT
+            color = star.color
+            if tint is not None:
+                color = tuple(max(1, c * star.brightness // 255) for c in tint)
+            
+            # Estrelas na borda aparecem também do outro lado (textura contínua)
+            for wrap_y in (y - SCREEN_HEIGHT, y, y + SCREEN_HEIGHT):
+                if -star.size <= wrap_y < SCREEN_HEIGHT + star.size:
+                    if star.size == 1:
+                        surface.set_at((x, wrap_y), color)
+                    else:
+                        pygame.draw.circle(surface, color, (x, wrap_y), star.size)
+        
+        # Preto é transparente (RLE acelera o blit de texturas esparsas)
+        surface.set_colorkey(COLOR_BLACK, pygame.RLEACCEL)
+        return surface
     
     def update(self, dt, scroll_speed_multiplier=1.0):
         """
-        Atualiza posição da estrela
+        Avança o scroll da camada
         
         Args:
             dt (float): Delta time
-            scroll_speed_multiplier (float): Multiplicador de velocidade
+            scroll_speed_multiplier (float): Multiplicador global de velocidade
         """
-        self.y += self.speed * scroll_speed_multiplier * dt
-        
-        # Se sair da tela, reposicionar no topo
-        if self.y > SCREEN_HEIGHT + 10:
-            self.y = -10
-            self.x = random.randint(0, SCREEN_WIDTH)
+        speed = self.speed * self.scroll_speed_multiplier * scroll_speed_multiplier
+        self.offset = (self.offset + speed * dt) % SCREEN_HEIGHT
     
     def render(self, screen):
-        """Renderiza a estrela"""
-        if self.size == 1:
-            # Estrela pequena (1 pixel)
-            screen.set_at((int(self.x), int(self.y)), self.color)
-        else:
-            # Estrela maior (círculo)
-            pygame.draw.circle(
-                screen,
-                self.color,
-                (int(self.x), int(self.y)),
-                self.size
-            )
+        """Renderiza a camada (dois blits)"""
+        y = int(self.offset)
+        screen.blit(self.surface, (0, y))
+        screen.blit(self.surface, (0, y - SCREEN_HEIGHT))
 
 
 class Starfield:
     """Campo de estrelas com múltiplas camadas"""
     
-    def __init__(self, star_count=200):
+    # Limites das teclas de densidade (-/+)
+    max_star_count = 500
+    density_step = 50
+    
+    def __init__(self, star_count=200, rng=None):
         """
         Inicializa o starfield
         
         Args:
             star_count (int): Quantidade total de estrelas
+            rng (random.Random): RNG visual (padrão: run_context.visual_rng)
         """
+        self.rng = rng or run_context.visual_rng
         self.stars = []
         self.star_count = star_count
         self.scroll_speed_multiplier = 1.0
+        self.palette = None  # Cores [far, mid, near] da atmosfera
+        self.textures = {}   # Paleta -> texturas das camadas (atual e pré-carregada)
+        self.prefetched = None
+        
+        # Camadas (texturas geradas no primeiro render após mudanças)
+        self.layers = [StarLayer(name, speed) for name, _, speed in STAR_BANDS]
+        self.dirty = True
+        self.generation = 0  # Muda quando as estrelas são refeitas
         
         # Criar estrelas
         self.generate_stars()
@@ -83,58 +162,305 @@ class Starfield:
     def generate_stars(self):
         """Gera estrelas com diferentes camadas de profundidade"""
         self.stars = []
+        rng = self.rng
         
         for i in range(self.star_count):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_HEIGHT)
             
             # Probabilidade de diferentes tipos
-            rand = random.random()
+            rand = rng.random()
             
             if rand < 0.60:  # 60% - Estrelas distantes (lentas, pequenas, escuras)
                 size = 1
-                speed = random.randint(20, 40)
-                brightness = random.randint(80, 120)
+                speed = rng.randint(20, 40)
+                brightness = rng.randint(80, 120)
             
             elif rand < 0.85:  # 25% - Estrelas médias
-                size = random.choice([1, 2])
-                speed = random.randint(40, 80)
-                brightness = random.randint(120, 180)
+                size = rng.choice([1, 2])
+                speed = rng.randint(40, 80)
+                brightness = rng.randint(120, 180)
             
             else:  # 15% - Estrelas próximas (rápidas, grandes, brilhantes)
-                size = random.choice([2, 3])
-                speed = random.randint(80, 150)
-                brightness = random.randint(180, 255)
+                size = rng.choice([2, 3])
+                speed = rng.randint(80, 150)
+                brightness = rng.randint(180, 255)
             
             star = Star(x, y, size, speed, brightness)
+            star.band = next(index for index, band in enumerate(STAR_BANDS) if rand < band[1])
             self.stars.append(star)
+        
+        # Texturas precisam ser refeitas
+        self.textures = {}
+        self.dirty = True
+        self.generation += 1
+    
+    def _palette_key(self, palette):
+        """Chave de cache de uma paleta (None = branco)"""
+        return tuple(tuple(color) for color in palette) if palette else None
+    
+    def _get_textures(self, palette):
+        """
+        Texturas das camadas para uma paleta (desenhadas na primeira vez)
+        
+        Args:
+            palette (list): Cores [far, mid, near] (None = branco)
+        
+        Returns:
+            list: Uma textura por camada
+        """
+        key = self._palette_key(palette)
+        textures = self.textures.get(key)
+        if textures is None:
+            textures = [
+                layer.bake(
+                    [star for star in self.stars if star.band == index],
+                    palette[index] if palette else None
+                )
+                for index, layer in enumerate(self.layers)
+            ]
+            self.textures[key] = textures
+        return textures
+    
+    def bake_layers(self):
+        """Pré-renderiza as texturas das camadas"""
+        for layer, texture in zip(self.layers, self._get_textures(self.palette)):
+            layer.surface = texture
+        self.dirty = False
+        
+        # Guarda só a paleta atual e a pré-carregada
+        keep = (self._palette_key(self.palette), self.prefetched)
+        self.textures = {key: value for key, value in self.textures.items() if key in keep}
+    
+    def prefetch_palette(self, palette):
+        """
+        Desenha antes as texturas de uma paleta (troca de atmosfera sem travada)
+        
+        Args:
+            palette (list): Cores [far, mid, near] (None = branco)
+        """
+        self.prefetched = self._palette_key(palette)
+        self._get_textures(palette)
     
     def update(self, dt):
         """
-        Atualiza todas as estrelas
+        Atualiza o scroll das camadas
         
         Args:
             dt (float): Delta time
         """
-        for star in self.stars:
-            star.update(dt, self.scroll_speed_multiplier)
+        for layer in self.layers:
+            layer.update(dt, self.scroll_speed_multiplier)
     
     def render(self, screen):
         """
-        Renderiza todas as estrelas
+        Renderiza todas as camadas (do fundo para a frente)
         
         Args:
             screen: Pygame surface
         """
-        for star in self.stars:
-            star.render(screen)
+        if self.dirty:
+            self.bake_layers()
+        
+        for layer in self.layers:
+            layer.render(screen)
+    
+    def set_scroll_speed(self, multiplier, band=None):
+        """
+        Ajusta velocidade de scroll
+        
+        Args:
+            multiplier (float): Multiplicador (1.0 = normal, 2.0 = 2x mais rápido)
+            band (str): Apenas uma camada ('far', 'mid', 'near'); None = todas
+        """
+        if band is None:
+            self.scroll_speed_multiplier = multiplier
+            return
+        
+        for layer in self.layers:
+            if layer.name == band:
+                layer.scroll_speed_multiplier = multiplier
+    
+    def set_density(self, star_count):
+        """
+        Ajusta densidade de estrelas
+        
+        Args:
+            star_count (int): Nova quantidade de estrelas
+        """
+        self.star_count = star_count
+        self.generate_stars()
+    
+    def set_palette(self, palette):
+        """
+        Muda as cores das estrelas (texturas refeitas no próximo render)
+        
+        Args:
+            palette (list): Cores [far, mid, near] (None = branco)
+        """
+        self.palette = palette
+        self.invalidate()
+    
+    def invalidate(self):
+        """Força re-renderizar as texturas (ex: mudança de atmosfera)"""
+        self.dirty = True
+        self.generation += 1
+
+
+def _disk_offsets(radius):
+    """Offsets (dx, dy) dos pixels de um disco (como pygame.draw.circle)"""
+    span = np.arange(-radius + 1, radius)
+    dx, dy = np.meshgrid(span, span, indexing='ij')
+    inside = dx * dx + dy * dy < radius * radius
+    return dx[inside], dy[inside]
+
+
+class NumpyStarfield:
+    """
+    Campo de estrelas em arrays NumPy (backend alternativo)
+    
+    Posição, velocidade, tamanho e brilho ficam em arrays; update é uma
+    soma vetorizada + máscara de wrap, e render escreve os pixels direto
+    na tela com surfarray.pixels2d. Aguenta milhares de estrelas (ex:
+    atmosferas densas) sem custo perceptível.
+    """
+    
+    # Limites das teclas de densidade (-/+)
+    max_star_count = 10000
+    density_step = 500
+    
+    def __init__(self, star_count=200, rng=None):
+        """
+        Inicializa o starfield
+        
+        Args:
+            star_count (int): Quantidade total de estrelas
+            rng (random.Random): RNG visual (padrão: run_context.visual_rng)
+        """
+        self.rng = rng or run_context.visual_rng
+        self.np_rng = np.random.default_rng(self.rng.randrange(1 << 32))
+        self.star_count = star_count
+        self.scroll_speed_multiplier = 1.0
+        self.generation = 0  # Muda quando as estrelas são refeitas
+        
+        # Offsets dos tamanhos 2 e 3 (tamanho 1 = um pixel)
+        self.stencils = {size: _disk_offsets(size) for size in (2, 3)}
+        
+        # Cores mapeadas para o formato da tela ([faixa, brilho] -> pixel)
+        self.tints = None  # Cores [far, mid, near] da atmosfera (None = branco)
+        self.palette = None
+        self.palette_format = None
+        
+        self.generate_stars()
+    
+    def generate_stars(self):
+        """Gera estrelas com as mesmas faixas de profundidade do Starfield"""
+        rng = self.np_rng
+        count = self.star_count
+        
+        self.x = rng.integers(0, SCREEN_WIDTH, count).astype(np.float64)
+        self.y = rng.integers(0, SCREEN_HEIGHT, count).astype(np.float64)
+        
+        rand = rng.random(count)
+        far = rand < 0.60
+        near = rand >= 0.85
+        mid = ~far & ~near
+        
+        self.speed = np.where(
+            far, rng.integers(20, 41, count),
+            np.where(mid, rng.integers(40, 81, count), rng.integers(80, 151, count))
+        ).astype(np.float64)
+        self.brightness = np.where(
+            far, rng.integers(80, 121, count),
+            np.where(mid, rng.integers(120, 181, count), rng.integers(180, 256, count))
+        ).astype(np.uint8)
+        self.size = np.where(
+            far, 1,
+            np.where(mid, rng.integers(1, 3, count), rng.integers(2, 4, count))
+        ).astype(np.int8)
+        self.band = np.where(far, 0, np.where(mid, 1, 2)).astype(np.int8)
+        
+        self.generation += 1
     
-    def set_scroll_speed(self, multiplier):
+    def update(self, dt):
+        """
+        Move todas as estrelas de uma vez
+        
+        Args:
+            dt (float): Delta time
+        """
+        self.y += self.speed * (self.scroll_speed_multiplier * dt)
+        
+        # Saíram por baixo: voltam ao topo em um X novo
+        wrapped = self.y > SCREEN_HEIGHT + 10
+        count = np.count_nonzero(wrapped)
+        if count:
+            self.y[wrapped] = -10
+            self.x[wrapped] = self.np_rng.integers(0, SCREEN_WIDTH + 1, count)
+    
+    def _get_palette(self, screen):
+        """Mapeia os 256 brilhos de cada faixa para o formato de pixel da tela"""
+        surface_format = (screen.get_bitsize(), screen.get_masks())
+        if surface_format != self.palette_format:
+            tints = self.tints or ((255, 255, 255),) * len(STAR_BANDS)
+            self.palette = np.array(
+                [[screen.map_rgb(tuple(c * b // 255 for c in tint)) for b in range(256)]
+                 for tint in tints],
+                dtype=np.uint32
+            )
+            self.palette_format = surface_format
+        return self.palette
+    
+    def render(self, screen):
+        """
+        Escreve todas as estrelas na tela em uma passada
+        
+        Args:
+            screen: Pygame surface (8+ bits por pixel) ou ScaledView
+        """
+        # Resolução interna reduzida: escreve direto na superfície pequena
+        scale_x = scale_y = 1.0
+        if isinstance(screen, ScaledView):
+            scale_x, scale_y = screen.scale
+            screen = screen.surface
+        
+        palette = self._get_palette(screen)
+        width, height = screen.get_size()
+        
+        xs = (self.x * scale_x).astype(np.int32)
+        ys = (self.y * scale_y).astype(np.int32)
+        colors = palette[self.band, self.brightness]
+        
+        pixels = pygame.surfarray.pixels2d(screen)
+        try:
+            # Tamanho 1: um pixel
+            small = self.size == 1
+            px, py, pc = xs[small], ys[small], colors[small]
+            visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            pixels[px[visible], py[visible]] = pc[visible]
+            
+            # Tamanhos 2 e 3: disco (stencil aplicado a todas de uma vez)
+            for size, (dx, dy) in self.stencils.items():
+                group = self.size == size
+                if not group.any():
+                    continue
+                
+                px = (xs[group][:, None] + dx[None, :]).ravel()
+                py = (ys[group][:, None] + dy[None, :]).ravel()
+                pc = np.repeat(colors[group], len(dx))
+                visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+                pixels[px[visible], py[visible]] = pc[visible]
+        finally:
+            # Libera o lock da surface
+            del pixels
+    
+    def set_scroll_speed(self, multiplier, band=None):
         """
         Ajusta velocidade de scroll
         
         Args:
             multiplier (float): Multiplicador (1.0 = normal, 2.0 = 2x mais rápido)
+            band (str): Ignorado (velocidade é por estrela neste backend)
         """
         self.scroll_speed_multiplier = multiplier
     
@@ -147,21 +473,63 @@ class Starfield:
         """
         self.star_count = star_count
         self.generate_stars()
+    
+    def set_palette(self, palette):
+        """
+        Muda as cores das estrelas
+        
+        Args:
+            palette (list): Cores [far, mid, near] (None = branco)
+        """
+        self.tints = palette
+        self.palette_format = None  # Refaz a tabela no próximo render
+        self.invalidate()
+    
+    def prefetch_palette(self, palette):
+        """Nada a preparar neste backend (a tabela de cores é barata)"""
+        pass
+    
+    def invalidate(self):
+        """Nada pré-renderizado neste backend (só avisa quem usa snapshot)"""
+        self.generation += 1
+
+
+# Backends disponíveis (config.starfield_backend)
+STARFIELD_BACKENDS = {
+    'layers': Starfield,
+    'numpy': NumpyStarfield,
+}
 
 
 class Background:
     """Gerenciador de background completo"""
     
-    def __init__(self):
-        """Inicializa o background"""
+    def __init__(self, rng=None):
+        """
+        Inicializa o background
+        
+        Args:
+            rng (random.Random): RNG visual (padrão: run_context.visual_rng)
+        """
         # Cor de fundo base
         self.bg_color = COLOR_BLACK
         
-        # Starfield
-        self.starfield = Starfield(star_count=200)
+        # Starfield (backend escolhido na config)
+        starfield_class = STARFIELD_BACKENDS[config.starfield_backend]
+        self.starfield = starfield_class(star_count=config.starfield_star_count, rng=rng)
+        
+        # Atmosfera (gradiente + nebulosa + cor das estrelas), começa na do setor 1
+        self.atmosphere = AtmosphereRenderer()
+        self.star_palette = None
+        self.atmosphere.set_atmosphere(self.atmosphere.for_sector(1), instant=True)
+        self._sync_star_palette()
         
         # Efeitos adicionais (para depois)
         self.effects = []
+        
+        # Fundo estático para o modo dirty rects
+        self.backdrop = None
+        self.backdrop_generation = None
     
     def update(self, dt):
         """
@@ -171,6 +539,15 @@ class Background:
             dt (float): Delta time
         """
         self.starfield.update(dt)
+        self.atmosphere.update(dt)
+        self._sync_star_palette()
+    
+    def _sync_star_palette(self):
+        """Repassa a paleta da atmosfera para o starfield quando ela muda"""
+        palette = self.atmosphere.get_star_palette()
+        if palette is not self.star_palette:
+            self.star_palette = palette
+            self.starfield.set_palette(palette)
     
     def render(self, screen):
         """
@@ -179,18 +556,68 @@ class Background:
         Args:
             screen: Pygame surface
         """
-        # Limpar com cor base
-        screen.fill(self.bg_color)
+        # Fundo da atmosfera (cor base se não há atmosferas)
+        if self.atmosphere.current is None:
+            screen.fill(self.bg_color)
+        else:
+            self.atmosphere.render(screen)
         
         # Renderizar starfield
         self.starfield.render(screen)
     
-    def set_atmosphere(self, atmosphere_name):
+    def render_static(self, screen, rects=None):
+        """
+        Renderiza o fundo estático (modo dirty rects)
+        
+        No modo dirty rects o starfield não rola: um snapshot dele é
+        guardado e apenas as áreas sujas são restauradas a partir dele.
+        
+        Args:
+            screen: Pygame surface
+            rects (list): Áreas a restaurar (None = tela inteira)
+        
+        Returns:
+            bool: True se a tela inteira foi repintada
+        """
+        generation = (self.starfield.generation, self.atmosphere.generation)
+        if self.backdrop is None or self.backdrop_generation != generation:
+            self.backdrop = pygame.Surface(screen.get_size()).convert()
+            self.render(self.backdrop)
+            self.backdrop_generation = generation
+            rects = None
+        
+        if rects is None:
+            screen.blit(self.backdrop, (0, 0))
+            return True
+        
+        backdrop = self.backdrop
+        screen.blits([(backdrop, rect, rect) for rect in rects], doreturn=False)
+        return False
+    
+    def set_atmosphere(self, atmosphere_name, instant=False):
         """
-        Muda atmosfera (para implementar depois)
+        Muda atmosfera (crossfade de atmospheres.json 'crossfade_duration')
         
         Args:
-            atmosphere_name (str): Nome da atmosfera
+            atmosphere_name (str): id da atmosfera
+            instant (bool): Troca sem crossfade
+        
+        Returns:
+            bool: True se a atmosfera mudou
+        """
+        return self.atmosphere.set_atmosphere(atmosphere_name, instant)
+    
+    def prefetch_atmosphere(self, atmosphere_name):
         """
-        # TODO: Implementar mudança de atmosfera
-        pass
\ No newline at end of file
+        Prepara o fundo de uma atmosfera antes da troca
+        
+        Args:
+            atmosphere_name (str): id da atmosfera
+        """
+        if atmosphere_name == self.atmosphere.prefetched:
+            return
+        
+        self.atmosphere.prefetch(atmosphere_name)
+        atmosphere = self.atmosphere.by_id.get(atmosphere_name)
+        if atmosphere and self.atmosphere.size is not None:
+            self.starfield.prefetch_palette(atmosphere.get('star_palette'))
\ No newline at end of file
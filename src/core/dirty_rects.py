@@ -0,0 +1,88 @@
+"""
+Dirty Rects - Controle das áreas da tela alteradas a cada frame
+"""
+
+import pygame
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+
+
+class DirtyRectTracker:
+    """
+    Decide o que restaurar e o que enviar ao display a cada frame
+    
+    Fluxo por frame:
+        1. get_restore_rects(): áreas desenhadas no frame anterior, que o
+           fundo deve restaurar (None = repintar tudo)
+        2. o estado desenha e devolve as áreas que tocou sobre o fundo
+           (None = tela toda, ex: overlay de menu)
+        3. end_frame(rects, repainted): retorna a lista para
+           display.update(), ou None quando precisa/compensa um flip()
+    """
+    
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), threshold=0.5):
+        """
+        Inicializa o tracker
+        
+        Args:
+            size (tuple): Tamanho da tela
+            threshold (float): Fração da tela acima da qual usa flip()
+        """
+        self.screen_rect = pygame.Rect(0, 0, *size)
+        self.threshold = threshold
+        self.previous = None  # None = frame anterior foi completo
+        
+        # Estatísticas
+        self.full_frames = 0
+        self.partial_frames = 0
+    
+    def get_restore_rects(self):
+        """
+        Áreas sujas do frame anterior
+        
+        Returns:
+            list: Rects a restaurar (None = tela inteira)
+        """
+        return self.previous
+    
+    def end_frame(self, rects, repainted=False):
+        """
+        Fecha o frame
+        
+        Args:
+            rects (list): Áreas desenhadas sobre o fundo (None = tela toda)
+            repainted (bool): O fundo foi repintado inteiro neste frame
+        
+        Returns:
+            list: Rects para pygame.display.update (None = usar flip)
+        """
+        previous = self.previous
+        
+        if rects is None:
+            self.previous = None
+        else:
+            screen_rect = self.screen_rect
+            self.previous = [rect.clip(screen_rect) for rect in rects if rect]
+        
+        if repainted or rects is None or previous is None:
+            self.full_frames += 1
+            return None
+        
+        # Áreas antigas (apagadas) + novas (desenhadas)
+        update = previous + self.previous
+        area = sum(rect.width * rect.height for rect in update)
+        
+        if area > self.threshold * self.screen_rect.width * self.screen_rect.height:
+            self.full_frames += 1
+            return None
+        
+        self.partial_frames += 1
+        return update
+    
+    def reset(self):
+        """Força o próximo frame a ser completo"""
+        self.previous = None
@@ -0,0 +1,301 @@
+"""
+Headless - Simulação do GameState sem janela, com timestep fixo
+
+Uso:
+    python src/core/headless.py --sectors 20 --script strafe
+    python src/core/headless.py --replay run.pfr
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from constants import *
+from src.core.input_manager import InputManager
+from src.core.replay import ReplayInputManager, ReplayPlayer
+
+
+class ScriptedKeys:
+    """Substitui pygame.key.get_pressed() com um conjunto de teclas"""
+    
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+    
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class ScriptedInputManager(InputManager):
+    """
+    Input dirigido por script (sem teclado nem gamepad)
+    
+    O script é chamado a cada update() com (frame, game_state) e retorna
+    as teclas pressionadas naquele frame. As consultas (get_movement,
+    get_button, is_key_pressed) continuam sendo as do InputManager.
+    """
+    
+    def __init__(self, script=None):
+        """
+        Inicializa o input scriptado
+        
+        Args:
+            script (callable): script(frame, game_state) -> teclas pressionadas
+        """
+        super().__init__()
+        self.script = script
+        self.game_state = None
+        self.frame = 0
+        self.keys = ScriptedKeys()
+    
+    def detect_joysticks(self):
+        """Simulação nunca usa gamepads"""
+        self.joysticks = []
+        return 0
+    
+    def update(self):
+        """Avalia o script para o frame atual"""
+        pressed = ()
+        if self.script:
+            pressed = self.script(self.frame, self.game_state) or ()
+        
+        self.keys = ScriptedKeys(pressed)
+        self.frame += 1
+
+
+def script_idle(frame, game_state):
+    """Não aperta nada (só tiro automático)"""
+    return ()
+
+
+def script_strafe(frame, game_state):
+    """Vai e volta na horizontal e coleta cartas próximas"""
+    direction = pygame.K_a if (frame // 120) % 2 == 0 else pygame.K_d
+    return (direction, pygame.K_e)
+
+
+SCRIPTS = {
+    'idle': script_idle,
+    'strafe': script_strafe,
+}
+
+
+class HeadlessRunner:
+    """Roda o GameState sem renderizar, o mais rápido possível"""
+    
+    def __init__(self, dt=SIMULATION_DT, script=None, quiet=True, seed=None, input_manager=None):
+        """
+        Inicializa a simulação
+        
+        Args:
+            dt (float): Timestep fixo em segundos (padrão: o mesmo do jogo)
+            script (callable): Script de input (ver ScriptedInputManager)
+            quiet (bool): Silencia os prints do jogo durante a simulação
+            seed (int): Seed da run (mesma seed + mesmo script = mesma run)
+            input_manager: InputManager alternativo (ex: ReplayInputManager)
+        """
+        # Driver dummy: não abre janela nem dispositivo de áudio
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        
+        pygame.init()
+        
+        # Display mínimo (alguns sprites usam convert_alpha)
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+        
+        self.dt = dt
+        self.quiet = quiet
+        self.input_manager = input_manager or ScriptedInputManager(script)
+        
+        with self._output():
+            from src.states.game_state import GameState
+            
+            # Sem surface: a simulação nunca chama render()
+            self.game_state = GameState(None, input_manager=self.input_manager, seed=seed)
+        
+        self.input_manager.game_state = self.game_state
+        self.frames = 0
+        self.sim_time = 0.0
+    
+    @contextlib.contextmanager
+    def _output(self):
+        """Redireciona stdout para /dev/null no modo quiet"""
+        if not self.quiet:
+            yield
+            return
+        
+        with open(os.devnull, 'w') as devnull:
+            with contextlib.redirect_stdout(devnull):
+                yield
+    
+    def step(self, frames=1):
+        """
+        Avança a simulação
+        
+        Args:
+            frames (int): Quantidade de frames de dt fixo
+        """
+        game_state = self.game_state
+        dt = self.dt
+        
+        with self._output():
+            for _ in range(frames):
+                game_state.particles.begin_frame()
+                game_state.update(dt, FPS)
+                self.frames += 1
+                self.sim_time += dt
+    
+    def run(self, max_frames=None, max_sectors=None, stop_on_game_over=True):
+        """
+        Roda até atingir um dos limites
+        
+        Args:
+            max_frames (int): Limite de frames (opcional)
+            max_sectors (int): Para ao chegar neste setor (opcional)
+            stop_on_game_over (bool): Para quando o player morre
+        
+        Returns:
+            dict: Resultado da simulação
+        """
+        game_state = self.game_state
+        wave_manager = game_state.wave_manager
+        dt = self.dt
+        
+        start = time.perf_counter()
+        
+        with self._output():
+            while True:
+                if max_frames is not None and self.frames >= max_frames:
+                    break
+                if max_sectors is not None and wave_manager.current_sector > max_sectors:
+                    break
+                if stop_on_game_over and game_state.game_over:
+                    break
+                
+                game_state.particles.begin_frame()
+                game_state.update(dt, FPS)
+                self.frames += 1
+                self.sim_time += dt
+        
+        wall_time = time.perf_counter() - start
+        return self.get_results(wall_time)
+    
+    def run_replay(self, replay):
+        """
+        Reproduz um replay gravado, sem limite de velocidade
+        
+        O runner precisa ter sido criado com a seed do replay e um
+        ReplayInputManager (ver from_replay).
+        
+        Args:
+            replay (ReplayPlayer): Replay carregado
+        
+        Returns:
+            dict: Resultado da simulação
+        """
+        game_state = self.game_state
+        input_manager = self.input_manager
+        
+        start = time.perf_counter()
+        
+        with self._output():
+            while replay.next_frame():
+                input_manager.pending_state = replay.state
+                game_state.handle_events(replay.events)
+                game_state.particles.begin_frame()
+                game_state.update(replay.dt, FPS)
+                self.frames += 1
+                self.sim_time += replay.dt
+        
+        wall_time = time.perf_counter() - start
+        return self.get_results(wall_time)
+    
+    @classmethod
+    def from_replay(cls, replay, quiet=True):
+        """
+        Cria um runner pronto para reproduzir um replay
+        
+        Args:
+            replay (ReplayPlayer): Replay carregado
+            quiet (bool): Silencia os prints do jogo
+        
+        Returns:
+            HeadlessRunner: Runner com a seed e o input do replay
+        """
+        return cls(quiet=quiet, seed=replay.seed, input_manager=ReplayInputManager())
+    
+    def get_results(self, wall_time=0.0):
+        """
+        Resume o estado da simulação
+        
+        Args:
+            wall_time (float): Tempo real gasto (segundos)
+        
+        Returns:
+            dict: Estatísticas da run
+        """
+        game_state = self.game_state
+        sim_time = self.sim_time
+        
+        return {
+            'seed': game_state.seed,
+            'frames': self.frames,
+            'sim_time': sim_time,
+            'wall_time': wall_time,
+            'speedup': sim_time / wall_time if wall_time > 0 else 0.0,
+            'sector': game_state.wave_manager.current_sector,
+            'minerals': game_state.player_minerals,
+            'player_hp': game_state.player.hp,
+            'player_alive': game_state.player.alive,
+            'game_over': game_state.game_over,
+            'cards': [card.id for card in game_state.player.equipped_cards],
+        }
+
+
+def print_results(results):
+    """Mostra o resumo de uma simulação"""
+    print(f"✓ {results['frames']} frames ({results['sim_time']:.1f}s simulados) "
+          f"em {results['wall_time']:.2f}s → {results['speedup']:.1f}x tempo real")
+    print(f"✓ Seed {results['seed']} | Setor {results['sector']} | Minérios: {results['minerals']} | "
+          f"HP: {int(results['player_hp'])} | Game Over: {results['game_over']}")
+
+
+def main():
+    """Executa uma simulação pela linha de comando"""
+    parser = argparse.ArgumentParser(description="Simulação headless do Plane Free")
+    parser.add_argument('--frames', type=int, default=None, help="Limite de frames")
+    parser.add_argument('--sectors', type=int, default=None, help="Para ao passar deste setor")
+    parser.add_argument('--dt', type=float, default=SIMULATION_DT, help="Timestep fixo (s)")
+    parser.add_argument('--seed', type=int, default=None, help="Seed da run (reprodutível)")
+    parser.add_argument('--script', choices=sorted(SCRIPTS), default='strafe', help="Script de input")
+    parser.add_argument('--replay', default=None, help="Reproduz um replay gravado (ignora script/seed)")
+    parser.add_argument('--verbose', action='store_true', help="Mostra os prints do jogo")
+    args = parser.parse_args()
+    
+    if args.replay:
+        replay = ReplayPlayer(args.replay)
+        runner = HeadlessRunner.from_replay(replay, quiet=not args.verbose)
+        results = runner.run_replay(replay)
+        print_results(results)
+        return
+    
+    if args.frames is None and args.sectors is None:
+        args.frames = SIMULATION_RATE * 60 * 5  # 5 minutos de jogo
+    
+    runner = HeadlessRunner(
+        dt=args.dt,
+        script=SCRIPTS[args.script],
+        quiet=not args.verbose,
+        seed=args.seed
+    )
+    results = runner.run(max_frames=args.frames, max_sectors=args.sectors)
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
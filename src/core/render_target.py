@@ -0,0 +1,200 @@
+"""
+Render Target - Resolução interna reduzida com upscale para a janela
+"""
+
+import math
+import pygame
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+
+
+class ScaledView:
+    """
+    Superfície de baixa resolução vista em coordenadas lógicas (1920x1080)
+    
+    Imita a parte da API de pygame.Surface usada no desenho do mundo
+    (blit, blits, fill, get_rect...): as posições chegam em coordenadas
+    lógicas e as fontes são redimensionadas uma vez e guardadas em cache.
+    pygame.draw.* precisa de uma Surface de verdade, então linhas e
+    círculos de debug vão para a janela nativa (render_overlay).
+    """
+    
+    def __init__(self, surface, smooth=False, max_cached=512):
+        """
+        Inicializa a view
+        
+        Args:
+            surface (pygame.Surface): Superfície de baixa resolução
+            smooth (bool): Redimensiona sprites com smoothscale
+            max_cached (int): Sprites redimensionados guardados
+        """
+        self.surface = surface
+        self.smooth = smooth
+        self.scale = (
+            surface.get_width() / SCREEN_WIDTH,
+            surface.get_height() / SCREEN_HEIGHT,
+        )
+        self.max_cached = max_cached
+        
+        # id(fonte) -> (fonte, redimensionada); a fonte fica guardada para o
+        # id não ser reaproveitado por outra superfície
+        self.scaled = {}
+    
+    def get_scaled(self, source):
+        """
+        Retorna a versão redimensionada de uma superfície (cache por objeto)
+        
+        Args:
+            source (pygame.Surface): Superfície em resolução lógica
+        
+        Returns:
+            pygame.Surface: Superfície na resolução interna
+        """
+        entry = self.scaled.get(id(source))
+        if entry is not None and entry[0] is source:
+            scaled = entry[1]
+        else:
+            if len(self.scaled) >= self.max_cached:
+                self.scaled.clear()
+            
+            scale_x, scale_y = self.scale
+            size = (
+                max(1, round(source.get_width() * scale_x)),
+                max(1, round(source.get_height() * scale_y)),
+            )
+            if self.smooth and source.get_bitsize() >= 24:
+                scaled = pygame.transform.smoothscale(source, size)
+            else:
+                scaled = pygame.transform.scale(source, size)
+            self.scaled[id(source)] = (source, scaled)
+        
+        # Fades (set_alpha) mudam a fonte depois do cache
+        alpha = source.get_alpha()
+        if scaled.get_alpha() != alpha:
+            scaled.set_alpha(alpha)
+        
+        return scaled
+    
+    def _to_surface(self, dest):
+        """Converte uma posição lógica (x, y) ou Rect para a resolução interna"""
+        scale_x, scale_y = self.scale
+        x, y = dest[0], dest[1]
+        return (math.floor(x * scale_x), math.floor(y * scale_y))
+    
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Desenha uma superfície em coordenadas lógicas
+        
+        Args:
+            source (pygame.Surface): Superfície (resolução lógica)
+            dest: Posição (x, y) ou Rect lógico
+            area: Ignorado (não usado no desenho do mundo)
+            special_flags (int): Flags de blend
+        
+        Returns:
+            pygame.Rect: Área lógica aproximada desenhada
+        """
+        scaled = self.get_scaled(source)
+        self.surface.blit(scaled, self._to_surface(dest), None, special_flags)
+        return pygame.Rect(dest[0], dest[1], source.get_width(), source.get_height())
+    
+    def blits(self, blit_sequence, doreturn=True):
+        """
+        Desenha várias superfícies (um único blits() na resolução interna)
+        
+        Args:
+            blit_sequence: Sequência de (superfície, destino)
+            doreturn (bool): Retorna as áreas lógicas desenhadas
+        
+        Returns:
+            list: Áreas lógicas (None se doreturn=False)
+        """
+        get_scaled = self.get_scaled
+        to_surface = self._to_surface
+        self.surface.blits(
+            [(get_scaled(item[0]), to_surface(item[1])) for item in blit_sequence],
+            doreturn=False
+        )
+        
+        if not doreturn:
+            return None
+        return [
+            pygame.Rect(item[1][0], item[1][1], item[0].get_width(), item[0].get_height())
+            for item in blit_sequence
+        ]
+    
+    def fill(self, color, rect=None, special_flags=0):
+        """Preenche a superfície (rect em coordenadas lógicas)"""
+        if rect is not None:
+            rect = pygame.Rect(rect)
+            x, y = self._to_surface(rect.topleft)
+            right, bottom = self._to_surface(rect.bottomright)
+            rect = pygame.Rect(x, y, right - x, bottom - y)
+        return self.surface.fill(color, rect, special_flags)
+    
+    def get_rect(self, **kwargs):
+        """Retângulo lógico da tela (aceita os mesmos kwargs de Surface.get_rect)"""
+        rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+    
+    def get_size(self):
+        """Tamanho lógico da tela"""
+        return (SCREEN_WIDTH, SCREEN_HEIGHT)
+    
+    def get_width(self):
+        """Largura lógica"""
+        return SCREEN_WIDTH
+    
+    def get_height(self):
+        """Altura lógica"""
+        return SCREEN_HEIGHT
+
+
+class RenderTarget:
+    """
+    Onde o mundo é desenhado antes de ir para a janela
+    
+    Na resolução nativa o alvo é a própria janela (nada muda). Com uma
+    resolução interna menor, o mundo é desenhado em uma superfície
+    pequena (via ScaledView) e present() a estica para a janela com
+    transform.scale (ou smoothscale). O gameplay continua todo em
+    coordenadas lógicas.
+    """
+    
+    def __init__(self, window, resolution=None, smooth=False):
+        """
+        Inicializa o alvo
+        
+        Args:
+            window (pygame.Surface): Superfície da janela
+            resolution (tuple): Resolução interna (None = nativa)
+            smooth (bool): Upscale com smoothscale (mais lento, sem serrilhado)
+        """
+        self.window = window
+        self.resolution = tuple(resolution) if resolution else window.get_size()
+        self.scaled = self.resolution != window.get_size()
+        self.smooth = smooth
+        
+        if self.scaled:
+            self.surface = pygame.Surface(self.resolution).convert(window)
+            self.view = ScaledView(self.surface, smooth)
+        else:
+            self.surface = window
+            self.view = window
+    
+    def present(self):
+        """Estica a superfície interna para a janela (nada na resolução nativa)"""
+        if not self.scaled:
+            return
+        
+        size = self.window.get_size()
+        if self.smooth:
+            pygame.transform.smoothscale(self.surface, size, self.window)
+        else:
+            pygame.transform.scale(self.surface, size, self.window)
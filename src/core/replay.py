@@ -0,0 +1,334 @@
+"""
+Replay - Gravação de input por frame e reprodução determinística
+
+Formato (little-endian):
+    Cabeçalho: b'PFRP' | versão (u8) | seed (u64)
+    Frame:     flags (u8) + apenas os campos que mudaram
+        FLAG_DT_MS   → u16 dt em milissegundos inteiros
+        FLAG_DT      → f64 dt (quando não é ms inteiro, ex: timestep fixo)
+        FLAG_MOVE    → int8 move_x, int8 move_y (-127..127)
+        FLAG_BUTTONS → u16 máscara de botões/teclas
+        FLAG_EVENTS  → u8 quantidade + u8 código de cada KEYDOWN
+
+Um frame sem mudanças ocupa 1 byte. Como a run é determinística pela
+seed (run_context), seed + log reproduzem a partida inteira.
+"""
+
+import struct
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from src.core.input_manager import InputManager
+
+
+REPLAY_MAGIC = b'PFRP'
+REPLAY_VERSION = 1
+
+FLAG_DT_MS = 1 << 0
+FLAG_DT = 1 << 1
+FLAG_MOVE = 1 << 2
+FLAG_BUTTONS = 1 << 3
+FLAG_EVENTS = 1 << 4
+
+# Escala da quantização do movimento (int8)
+MOVE_SCALE = 127
+
+# Botões consultados pelo gameplay (bits 0-5)
+REPLAY_BUTTONS = ('A', 'B', 'X', 'Y', 'START', 'BACK')
+
+# Teclas consultadas com is_key_pressed (bits seguintes)
+REPLAY_KEYS = (pygame.K_e, pygame.K_r, pygame.K_TAB)
+
+# KEYDOWN que afetam o jogo (GameState.handle_events e Game.handle_events)
+REPLAY_EVENT_KEYS = (
+    pygame.K_TAB, pygame.K_PAUSE, pygame.K_k,
+    pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+    pygame.K_MINUS, pygame.K_KP_MINUS, pygame.K_EQUALS, pygame.K_KP_PLUS,
+)
+EVENT_CODES = {key: code for code, key in enumerate(REPLAY_EVENT_KEYS)}
+
+# Estado vazio: (move_x, move_y, máscara)
+EMPTY_STATE = (0, 0, 0)
+
+
+class SnapshotInputManager(InputManager):
+    """
+    InputManager que responde a partir de um snapshot por frame
+    
+    O snapshot guarda o resultado das consultas do gameplay (movimento
+    quantizado + máscara de botões/teclas). Gravação e reprodução usam
+    esta mesma classe base, então o jogo vê exatamente os mesmos valores
+    ao vivo e no replay.
+    """
+    
+    def __init__(self):
+        """Inicializa com estado vazio"""
+        super().__init__()
+        self.state = EMPTY_STATE
+    
+    def get_movement(self, player_index=0):
+        """Movimento do snapshot (apenas player 1 é gravado)"""
+        if player_index != 0:
+            return 0, 0
+        
+        move_x, move_y, _ = self.state
+        return move_x / MOVE_SCALE, move_y / MOVE_SCALE
+    
+    def get_button(self, button_name, player_index=0):
+        """Botão do snapshot (apenas player 1 é gravado)"""
+        if player_index != 0 or button_name not in REPLAY_BUTTONS:
+            return False
+        
+        return bool(self.state[2] & (1 << REPLAY_BUTTONS.index(button_name)))
+    
+    def is_key_pressed(self, key):
+        """Tecla do snapshot (apenas as de REPLAY_KEYS)"""
+        if key not in REPLAY_KEYS:
+            return False
+        
+        bit = len(REPLAY_BUTTONS) + REPLAY_KEYS.index(key)
+        return bool(self.state[2] & (1 << bit))
+
+
+class RecordingInputManager(SnapshotInputManager):
+    """Input ao vivo (teclado/gamepad) convertido em snapshot gravável"""
+    
+    def update(self):
+        """Lê o input real e gera o snapshot do frame"""
+        super().update()
+        self.state = self.capture()
+    
+    def capture(self):
+        """
+        Consulta o InputManager real e quantiza o resultado
+        
+        Returns:
+            tuple: (move_x, move_y, máscara)
+        """
+        move_x, move_y = InputManager.get_movement(self, 0)
+        
+        mask = 0
+        for bit, name in enumerate(REPLAY_BUTTONS):
+            if InputManager.get_button(self, name, 0):
+                mask |= 1 << bit
+        
+        offset = len(REPLAY_BUTTONS)
+        for bit, key in enumerate(REPLAY_KEYS):
+            if InputManager.is_key_pressed(self, key):
+                mask |= 1 << (offset + bit)
+        
+        return (
+            int(round(move_x * MOVE_SCALE)),
+            int(round(move_y * MOVE_SCALE)),
+            mask
+        )
+
+
+class ReplayInputManager(SnapshotInputManager):
+    """Input lido de um replay (sem teclado nem gamepad)"""
+    
+    def __init__(self):
+        """Inicializa sem estado pendente"""
+        super().__init__()
+        self.pending_state = EMPTY_STATE
+    
+    def detect_joysticks(self):
+        """Replay nunca usa gamepads"""
+        self.joysticks = []
+        return 0
+    
+    def update(self):
+        """Aplica o snapshot do frame atual do replay"""
+        self.state = self.pending_state
+
+
+class ReplayRecorder:
+    """Grava o input de cada frame em um log binário delta-encoded"""
+    
+    def __init__(self, path, seed):
+        """
+        Abre o arquivo de replay
+        
+        Args:
+            path (str): Caminho do arquivo
+            seed (int): Seed da run
+        """
+        self.path = path
+        self.file = open(path, 'wb')
+        self.file.write(REPLAY_MAGIC + struct.pack('<BQ', REPLAY_VERSION, seed))
+        
+        self.frames = 0
+        self.pending_events = []
+        
+        # Último valor escrito de cada campo
+        self.last_dt = None
+        self.last_move = (0, 0)
+        self.last_mask = 0
+    
+    def add_events(self, events):
+        """
+        Guarda os KEYDOWN relevantes para o próximo frame
+        
+        Args:
+            events (list): Eventos do pygame
+        """
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key in EVENT_CODES:
+                self.pending_events.append(EVENT_CODES[event.key])
+    
+    def end_frame(self, dt, state):
+        """
+        Escreve um frame
+        
+        Args:
+            dt (float): Delta time passado ao GameState.update
+            state (tuple): Snapshot do SnapshotInputManager ao fim do frame
+        """
+        move = (state[0], state[1])
+        mask = state[2]
+        
+        flags = 0
+        payload = b''
+        
+        if dt != self.last_dt:
+            ms = round(dt * 1000)
+            if 0 <= ms <= 0xFFFF and ms / 1000.0 == dt:
+                flags |= FLAG_DT_MS
+                payload += struct.pack('<H', ms)
+            else:
+                flags |= FLAG_DT
+                payload += struct.pack('<d', dt)
+            self.last_dt = dt
+        
+        if move != self.last_move:
+            flags |= FLAG_MOVE
+            payload += struct.pack('<bb', *move)
+            self.last_move = move
+        
+        if mask != self.last_mask:
+            flags |= FLAG_BUTTONS
+            payload += struct.pack('<H', mask)
+            self.last_mask = mask
+        
+        if self.pending_events:
+            events = self.pending_events[:255]
+            flags |= FLAG_EVENTS
+            payload += struct.pack('<B', len(events)) + bytes(events)
+            self.pending_events = self.pending_events[255:]
+        
+        self.file.write(bytes((flags,)) + payload)
+        self.frames += 1
+    
+    def close(self):
+        """Fecha o arquivo"""
+        if not self.file.closed:
+            self.file.close()
+            print(f"🎬 Replay salvo: {self.path} ({self.frames} frames)")
+
+
+class ReplayPlayer:
+    """Lê um replay e entrega dt, input e eventos frame a frame"""
+    
+    def __init__(self, path):
+        """
+        Carrega o replay
+        
+        Args:
+            path (str): Caminho do arquivo
+        """
+        with open(path, 'rb') as f:
+            self.data = f.read()
+        
+        header_size = len(REPLAY_MAGIC) + struct.calcsize('<BQ')
+        if self.data[:len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+            raise ValueError(f"Arquivo não é um replay: {path}")
+        
+        version, self.seed = struct.unpack_from('<BQ', self.data, len(REPLAY_MAGIC))
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Versão de replay não suportada: {version}")
+        
+        self.offset = header_size
+        self.frames = 0
+        
+        # Estado atual (acumulado pelos deltas)
+        self.dt = 0.0
+        self.move = (0, 0)
+        self.mask = 0
+        self.events = []
+    
+    def finished(self):
+        """Retorna True quando não há mais frames"""
+        return self.offset >= len(self.data)
+    
+    def peek_dt(self):
+        """
+        dt do próximo frame, sem avançar
+        
+        Returns:
+            float: dt do próximo frame (None se o replay terminou)
+        """
+        if self.finished():
+            return None
+        
+        flags = self.data[self.offset]
+        offset = self.offset + 1
+        
+        if flags & FLAG_DT_MS:
+            (ms,) = struct.unpack_from('<H', self.data, offset)
+            return ms / 1000.0
+        if flags & FLAG_DT:
+            (dt,) = struct.unpack_from('<d', self.data, offset)
+            return dt
+        return self.dt
+    
+    def next_frame(self):
+        """
+        Avança um frame
+        
+        Returns:
+            bool: False se o replay terminou
+        """
+        if self.finished():
+            return False
+        
+        data = self.data
+        flags = data[self.offset]
+        offset = self.offset + 1
+        
+        if flags & FLAG_DT_MS:
+            (ms,) = struct.unpack_from('<H', data, offset)
+            self.dt = ms / 1000.0
+            offset += 2
+        elif flags & FLAG_DT:
+            (self.dt,) = struct.unpack_from('<d', data, offset)
+            offset += 8
+        
+        if flags & FLAG_MOVE:
+            self.move = struct.unpack_from('<bb', data, offset)
+            offset += 2
+        
+        if flags & FLAG_BUTTONS:
+            (self.mask,) = struct.unpack_from('<H', data, offset)
+            offset += 2
+        
+        self.events = []
+        if flags & FLAG_EVENTS:
+            count = data[offset]
+            codes = data[offset + 1:offset + 1 + count]
+            self.events = [
+                pygame.event.Event(pygame.KEYDOWN, key=REPLAY_EVENT_KEYS[code], mod=0)
+                for code in codes
+            ]
+            offset += 1 + count
+        
+        self.offset = offset
+        self.frames += 1
+        return True
+    
+    @property
+    def state(self):
+        """Snapshot de input do frame atual"""
+        return (self.move[0], self.move[1], self.mask)
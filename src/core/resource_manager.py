@@ -0,0 +1,279 @@
+"""
+Resource Manager - Carregamento de assets com thread pool e cache em disco
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import struct
+import threading
+import time
+import pygame
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+from config import config
+
+
+# Pastas
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+ASSETS_DIR = os.path.join(ROOT_DIR, 'assets')
+ASSET_CACHE_DIR = os.path.join(ROOT_DIR, '.cache', 'assets')
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+# Cabeçalho do cache: magic, mtime_ns da imagem, largura, altura
+CACHE_MAGIC = b'PFAC'
+CACHE_HEADER = struct.Struct('<4sQII')
+
+
+class AssetManager:
+    """
+    Carrega imagens de assets/ em paralelo e mantém as superfícies prontas
+    
+    Fluxo de uma imagem:
+        1. (thread) lê os pixels RGBA do cache em disco, ou decodifica o
+           PNG, redimensiona se pedido e grava o cache
+        2. (thread principal) cria a Surface e faz convert_alpha()
+    
+    O cache em disco é um arquivo por (caminho, tamanho) com o mtime da
+    imagem no cabeçalho: se o PNG mudar, é decodificado de novo. As
+    superfícies em memória ficam num LRU limitado por bytes.
+    
+    O LRU, os pendentes e as estatísticas só são tocados com self.lock
+    (as threads contam hits/decodificações).
+    """
+    
+    def __init__(self, root=ASSETS_DIR, cache_dir=ASSET_CACHE_DIR, memory_budget_mb=None,
+                 disk_cache=None, workers=4):
+        """
+        Inicializa o gerenciador
+        
+        Args:
+            root (str): Pasta base dos assets
+            cache_dir (str): Pasta do cache de pixels (None = sem cache)
+            memory_budget_mb (int): Limite das superfícies em memória (None = config)
+            disk_cache (bool): Usa o cache em disco (None = config)
+            workers (int): Threads de decodificação
+        """
+        self.root = root
+        self.cache_dir = cache_dir
+        
+        if memory_budget_mb is None:
+            memory_budget_mb = config.asset_memory_budget_mb
+        if disk_cache is None:
+            disk_cache = config.asset_disk_cache
+        
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.disk_cache = disk_cache and cache_dir is not None
+        self.workers = workers
+        self.executor = None  # Criado no primeiro uso
+        self.lock = threading.RLock()
+        
+        # (caminho, tamanho) -> Surface, em ordem de uso
+        self.surfaces = OrderedDict()
+        self.memory_used = 0
+        
+        # (caminho, tamanho) -> Future com (largura, altura, pixels)
+        self.pending = {}
+        
+        # Estatísticas
+        self.disk_hits = 0
+        self.decodes = 0
+        self.evictions = 0
+        self.load_time = 0.0  # Tempo esperando na thread principal
+    
+    def _key(self, path, size):
+        """Normaliza a chave (caminho relativo, tamanho)"""
+        path = os.path.relpath(os.path.join(self.root, path), self.root)
+        return (path.replace(os.sep, '/'), tuple(size) if size else None)
+    
+    def _cache_path(self, key):
+        """Arquivo do cache em disco de uma chave"""
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.cache_dir, f"{digest}.rgba")
+    
+    def _read(self, key):
+        """
+        Lê os pixels de uma imagem (roda nas threads)
+        
+        Args:
+            key (tuple): (caminho relativo, tamanho)
+        
+        Returns:
+            tuple: (largura, altura, bytes RGBA)
+        """
+        path, size = key
+        full_path = os.path.join(self.root, path)
+        mtime = os.stat(full_path).st_mtime_ns
+        cache_path = self._cache_path(key) if self.disk_cache else None
+        
+        # Cache em disco (pula a decodificação do PNG)
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                header = f.read(CACHE_HEADER.size)
+                if len(header) == CACHE_HEADER.size:
+                    magic, cached_mtime, width, height = CACHE_HEADER.unpack(header)
+                    if magic == CACHE_MAGIC and cached_mtime == mtime:
+                        pixels = f.read()
+                        if len(pixels) == width * height * 4:
+                            with self.lock:
+                                self.disk_hits += 1
+                            return width, height, pixels
+        
+        # Decodificar (e redimensionar antes de guardar)
+        loaded = pygame.image.load(full_path)
+        
+        # Normaliza para RGBA 32 bits (PNGs com paleta viram alpha por pixel)
+        image = pygame.Surface(loaded.get_size(), pygame.SRCALPHA, 32)
+        image.blit(loaded, (0, 0))
+        if size:
+            image = pygame.transform.smoothscale(image, size)
+        
+        width, height = image.get_size()
+        pixels = pygame.image.tobytes(image, 'RGBA')
+        with self.lock:
+            self.decodes += 1
+        
+        if cache_path:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(CACHE_HEADER.pack(CACHE_MAGIC, mtime, width, height))
+                f.write(pixels)
+            os.replace(temp_path, cache_path)
+        
+        return width, height, pixels
+    
+    def preload(self, paths, size=None):
+        """
+        Agenda o carregamento em segundo plano
+        
+        Args:
+            paths (list): Caminhos relativos a assets/
+            size (tuple): Pré-redimensiona para (largura, altura)
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        
+        with self.lock:
+            for path in paths:
+                key = self._key(path, size)
+                if key not in self.surfaces and key not in self.pending:
+                    self.pending[key] = self.executor.submit(self._read, key)
+    
+    def preload_folder(self, folder, size=None):
+        """
+        Agenda todas as imagens de uma pasta (recursivo)
+        
+        Args:
+            folder (str): Pasta relativa a assets/
+            size (tuple): Pré-redimensiona para (largura, altura)
+        
+        Returns:
+            list: Caminhos agendados
+        """
+        paths = []
+        for dirpath, _, filenames in os.walk(os.path.join(self.root, folder)):
+            for filename in sorted(filenames):
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.relpath(os.path.join(dirpath, filename), self.root))
+        
+        self.preload(paths, size)
+        return paths
+    
+    def get(self, path, size=None):
+        """
+        Retorna a superfície de uma imagem (espera o carregamento se preciso)
+        
+        A superfície é compartilhada: não desenhe nela.
+        
+        Args:
+            path (str): Caminho relativo a assets/
+            size (tuple): Tamanho pré-redimensionado (None = original)
+        
+        Returns:
+            pygame.Surface: Imagem no formato do display
+        """
+        key = self._key(path, size)
+        
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                return surface
+            future = self.pending.pop(key, None)
+        
+        # Espera/decodifica fora do lock (as threads também o usam)
+        start = time.perf_counter()
+        width, height, pixels = future.result() if future else self._read(key)
+        
+        surface = pygame.image.frombytes(pixels, (width, height), 'RGBA')
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        
+        with self.lock:
+            self.load_time += time.perf_counter() - start
+            self._store(key, surface)
+        return surface
+    
+    def _store(self, key, surface):
+        """Guarda a superfície e aplica o limite de memória (LRU, com self.lock)"""
+        self.surfaces[key] = surface
+        self.memory_used += self._surface_bytes(surface)
+        
+        # Nunca remove a que acabou de entrar
+        while self.memory_used > self.memory_budget and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.memory_used -= self._surface_bytes(old)
+            self.evictions += 1
+    
+    def _surface_bytes(self, surface):
+        """Memória ocupada pelos pixels de uma superfície"""
+        return surface.get_pitch() * surface.get_height()
+    
+    def wait(self):
+        """Termina tudo o que foi agendado (ex: tela de loading)"""
+        with self.lock:
+            keys = list(self.pending)
+        for key in keys:
+            self.get(*key)
+    
+    def clear(self):
+        """Libera as superfícies em memória (o cache em disco continua)"""
+        with self.lock:
+            self.surfaces.clear()
+            self.memory_used = 0
+    
+    def shutdown(self):
+        """Encerra as threads"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        with self.lock:
+            self.pending.clear()
+    
+    def get_stats(self):
+        """
+        Estatísticas do carregamento
+        
+        Returns:
+            dict: Superfícies, memória (MB), hits do cache, decodificações...
+        """
+        with self.lock:
+            return {
+                'surfaces': len(self.surfaces),
+                'pending': len(self.pending),
+                'memory_mb': self.memory_used / (1024 * 1024),
+                'disk_hits': self.disk_hits,
+                'decodes': self.decodes,
+                'evictions': self.evictions,
+                'load_time': self.load_time,
+            }
+
+
+# Instância global
+asset_manager = AssetManager()
@@ -0,0 +1,84 @@
+"""
+Run Context - RNG com seed, relógio de simulação e world (ECS) de cada run
+"""
+
+import random
+
+from src.systems.ecs import World
+
+
+class SimulationClock:
+    """
+    Relógio da simulação
+    
+    Avança apenas com o dt do gameplay (não anda em pausa/menus), então
+    substitui pygame.time.get_ticks() em tudo que afeta a simulação.
+    """
+    
+    def __init__(self):
+        """Inicializa o relógio"""
+        self.time = 0.0  # Segundos simulados
+    
+    def reset(self):
+        """Volta para o tempo zero"""
+        self.time = 0.0
+    
+    def advance(self, dt):
+        """
+        Avança o relógio
+        
+        Args:
+            dt (float): Delta time em segundos
+        """
+        self.time += dt
+    
+    def get_ticks(self):
+        """Retorna o tempo simulado em milissegundos (como pygame.time.get_ticks)"""
+        return int(self.time * 1000)
+
+
+class RunContext:
+    """
+    Estado compartilhado por uma run: seed, RNGs, relógio e world
+    
+    rng é usado por tudo que afeta o gameplay (spawns, drops, cartas);
+    visual_rng por efeitos puramente visuais (estrelas, partículas), para
+    que mudar a densidade de estrelas não altere a sequência do gameplay.
+    Os objetos Random são re-semeados no lugar, então referências
+    guardadas pelas entidades continuam válidas após reset(). O mesmo
+    vale para o world, que só é esvaziado.
+    """
+    
+    def __init__(self, seed=None):
+        """
+        Inicializa o contexto
+        
+        Args:
+            seed (int): Seed da run (None = aleatória)
+        """
+        self.rng = random.Random()
+        self.visual_rng = random.Random()
+        self.clock = SimulationClock()
+        self.world = World()
+        self.seed = None
+        self.reset(seed)
+    
+    def reset(self, seed=None):
+        """
+        Começa uma nova run
+        
+        Args:
+            seed (int): Seed da run (None = aleatória)
+        """
+        if seed is None:
+            seed = random.randrange(1 << 32)
+        
+        self.seed = seed
+        self.rng.seed(seed)
+        self.visual_rng.seed(f"{seed}:visual")
+        self.clock.reset()
+        self.world.clear()
+
+
+# Instância global (reiniciada pelo GameState a cada run)
+run_context = RunContext()
@@ -4,6 +4,11 @@ Card - Carta equipável que modifica stats do player
 
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.core.run_context import run_context
 
 
 class Card:
@@ -92,8 +97,14 @@ class Card:
 class CardManager:
     """Gerenciador de cartas"""
     
-    def __init__(self):
-        """Inicializa o card manager"""
+    def __init__(self, rng=None):
+        """
+        Inicializa o card manager
+        
+        Args:
+            rng (random.Random): RNG da run (padrão: run_context.rng)
+        """
+        self.rng = rng or run_context.rng
         self.all_cards = []
         self.load_cards()
     
@@ -139,14 +150,12 @@ class CardManager:
         Returns:
             Card
         """
-        import random
-        
         if rarity:
             filtered = [c for c in self.all_cards if c.rarity == rarity]
             if filtered:
-                return random.choice(filtered)
+                return self.rng.choice(filtered)
         
-        return random.choice(self.all_cards)
+        return self.rng.choice(self.all_cards)
     
     def roll_rarity(self):
         """
@@ -155,10 +164,8 @@ class CardManager:
         Returns:
             str: 'comum', 'incomum' ou 'epico'
         """
-        import random
-        
         # 80% comum, 19% incomum, 1% épico
-        rand = random.random()
+        rand = self.rng.random()
         
         if rand < 0.80:
             return 'comum'
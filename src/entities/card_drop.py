@@ -9,6 +9,8 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from constants import *
+from src.core.run_context import run_context
+from src.utils.text_cache import render_text
 
 
 class CardDrop:
@@ -55,6 +57,10 @@ class CardDrop:
         self.can_collect = True
         self.collect_cooldown = 0.5  # Meio segundo entre coletas
         self.collect_timer = 0
+        
+        # RNG e relógio da run (determinísticos por seed)
+        self.rng = run_context.rng
+        self.clock = run_context.clock
     
     def spawn(self, x, y, card):
         """
@@ -81,8 +87,7 @@ class CardDrop:
         self._create_sprite()
         
         # Pequeno impulso aleatório
-        import random
-        self.vx = random.randint(-30, 30)
+        self.vx = self.rng.randint(-30, 30)
         
         self.rect.center = (self.x, self.y)
         
@@ -161,7 +166,7 @@ class CardDrop:
         # Animação de flutuação (quando parado)
         if self.vy == 0:
             import math
-            self.float_offset = math.sin(pygame.time.get_ticks() * 0.001 * self.float_speed) * self.float_amplitude
+            self.float_offset = math.sin(self.clock.get_ticks() * 0.001 * self.float_speed) * self.float_amplitude
         
         # Pulsação do brilho
         self.pulse_timer += dt * self.pulse_speed
@@ -270,17 +275,30 @@ class CardDrop:
         return False
     
     def render(self, screen):
-        """Renderiza o drop de carta"""
+        """Renderiza o drop de carta (retorna a área desenhada ou None)"""
+        item = self.get_blit()
+        if item is None:
+            return None
+        
+        # Renderizar sprite
+        dirty = screen.blit(*item)
+        dirty.union_ip(self.render_overlay(screen))
+        
+        return dirty
+    
+    def get_blit(self):
+        """Sprite e posição para desenho em lote (None = não desenha)"""
         if not self.active:
-            return
+            return None
         
         # Piscar quando próximo de expirar
         if self.time_alive >= self.blink_time and self.blink_state:
-            return  # Não renderiza (efeito de piscar)
-        
-        # Renderizar sprite
-        screen.blit(self.sprite, self.rect)
+            return None  # Não renderiza (efeito de piscar)
         
+        return (self.sprite, self.rect)
+    
+    def render_overlay(self, screen):
+        """Desenha o brilho em volta da carta (retorna a área desenhada)"""
         # Brilho/pulsação (círculo em volta)
         import math
         pulse_alpha = int((math.sin(self.pulse_timer) * 0.5 + 0.5) * 100) + 50  # 50-150
@@ -299,7 +317,7 @@ class CardDrop:
             2
         )
         
-        screen.blit(
+        return screen.blit(
             glow_surface,
             (self.rect.x - 10, self.rect.y - 10)
         )
@@ -311,9 +329,12 @@ class CardDrop:
         Args:
             screen: Pygame surface
             player: Player
+        
+        Returns:
+            pygame.Rect: Área da tela desenhada (None se não desenhou)
         """
         if not self.active or self.card is None:
-            return
+            return None
         
         # Verificar distância
         dx = self.x - player.x
@@ -321,11 +342,10 @@ class CardDrop:
         distance_sq = dx*dx + dy*dy
         
         if distance_sq > self.collect_radius * self.collect_radius:
-            return
+            return None
         
         # Prompt "Pressione E para coletar"
-        font = pygame.font.Font(None, 20)
-        text = font.render("[E] Coletar", True, COLOR_WHITE)
+        text = render_text("[E] Coletar", 20, COLOR_WHITE)
         text_rect = text.get_rect(center=(self.x, self.y - self.size))
         
         # Fundo semi-transparente
@@ -333,12 +353,13 @@ class CardDrop:
         bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
         bg_surface.fill((0, 0, 0, 180))
         
-        screen.blit(bg_surface, bg_rect)
+        dirty = screen.blit(bg_surface, bg_rect)
         screen.blit(text, text_rect)
         
         # Nome da carta
-        font_small = pygame.font.Font(None, 16)
-        name_text = font_small.render(self.card.name, True, self.card.get_rarity_color())
+        name_text = render_text(self.card.name, 16, self.card.get_rarity_color())
         name_rect = name_text.get_rect(center=(self.x, self.y + self.size + 5))
         
-        screen.blit(name_text, name_rect)
\ No newline at end of file
+        dirty.union_ip(screen.blit(name_text, name_rect))
+        
+        return dirty
\ No newline at end of file
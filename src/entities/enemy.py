@@ -9,11 +9,37 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from constants import *
-from src.utils.placeholder_generator import create_enemy_sprite
+from src.utils.placeholder_generator import get_sprite
+from src.core.run_context import run_context
+from src.systems.ecs import ComponentField
 
 
 class Enemy:
-    """Classe base para todos os inimigos"""
+    """
+    Classe base para todos os inimigos
+    
+    Fachada sobre uma entidade do World (run_context.world): enquanto
+    ativo, posição, velocidade, vida, hitbox, IA e timers moram nas
+    tabelas do ECS e são atualizados pelos sistemas (enemy_ai_system,
+    movement_system etc.). Os atributos continuam acessíveis
+    normalmente (enemy.x, enemy.hp...).
+    """
+    
+    # Componentes da entidade criada no spawn
+    COMPONENTS = ('Transform', 'Velocity', 'Health', 'Hitbox')
+    
+    x = ComponentField('x')
+    y = ComponentField('y')
+    vx = ComponentField('vx')
+    vy = ComponentField('vy')
+    hp = ComponentField('hp')
+    max_hp = ComponentField('max_hp')
+    alive = ComponentField('alive')
+    hitbox_radius = ComponentField('hitbox_radius')
+    speed = ComponentField('speed')
+    ai_level = ComponentField('ai_level')
+    orbit_parent = ComponentField('orbit_parent')
+    orbit_angle = ComponentField('orbit_angle')
     
     def __init__(self, x, y, enemy_type='kamikaze'):
         """
@@ -24,6 +50,13 @@ class Enemy:
             y (float): Posição Y inicial
             enemy_type (str): Tipo do inimigo ('kamikaze', 'range', 'mother')
         """
+        # Entidade no world (criada no spawn, removida no deactivate)
+        self.world = run_context.world
+        self.table = None
+        self.row = -1
+        self.entity = None
+        self.detached = {}  # Valores dos componentes fora do world
+        
         # Posição
         self.x = x
         self.y = y
@@ -44,9 +77,8 @@ class Enemy:
         
         # Sprite
         self.size = 24
-        self.sprite = create_enemy_sprite(self.size)
+        self.sprite = get_sprite('enemy', self.size)
         self.rect = self.sprite.get_rect()
-        self.rect.center = (self.x, self.y)
         
         # Hitbox
         self.hitbox_radius = self.size // 2
@@ -60,40 +92,37 @@ class Enemy:
         
         # Mutação (para implementar depois)
         self.is_mutated = False
+        
+        # RNG e relógio da run (determinísticos por seed)
+        self.rng = run_context.rng
+        self.clock = run_context.clock
+        
+        # Callbacks do dono do pool (WaveManager) para rastrear ativos
+        self.on_spawn = None
+        self.on_deactivate = None
+    
+    @property
+    def rect(self):
+        """Rect do sprite centrado na posição atual"""
+        self._rect.center = (self.x, self.y)
+        return self._rect
+    
+    @rect.setter
+    def rect(self, value):
+        self._rect = value
     
     def spawn(self, x, y):
-        """Ativa o inimigo"""
+        """Ativa o inimigo (cria a entidade no world)"""
         self.x = x
         self.y = y
         self.active = True
         self.alive = True
         self.hp = self.max_hp
-        self.rect.center = (self.x, self.y)
         self.has_dropped = False  # ✅ Resetar flag
-    
-    def update(self, dt, player_pos=None):
-        """
-        Atualiza o inimigo
+        self.world.create(self, self.COMPONENTS)
         
-        Args:
-            dt (float): Delta time
-            player_pos (tuple): Posição do player (x, y) - opcional
-        """
-        if not self.active or not self.alive:
-            return
-        
-        # Movimento básico (subclasses podem sobrescrever)
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        
-        # Atualizar rect
-        self.rect.center = (self.x, self.y)
-        
-        # Desativar se sair da tela
-        if self.y > SCREEN_HEIGHT + 50:
-            self.deactivate()
-        if self.x < -50 or self.x > SCREEN_WIDTH + 50:
-            self.deactivate()
+        if self.on_spawn:
+            self.on_spawn(self)
     
     def take_damage(self, amount):
         """Recebe dano"""
@@ -119,6 +148,10 @@ class Enemy:
         """Desativa o inimigo (retorna ao pool)"""
         self.active = False
         self.alive = False
+        self.world.destroy(self)
+        
+        if self.on_deactivate:
+            self.on_deactivate(self)
     
     def render(self, screen):
         """
@@ -126,27 +159,61 @@ class Enemy:
         
         Args:
             screen: Pygame surface
+        
+        Returns:
+            pygame.Rect: Área da tela desenhada (None se inativo)
         """
         if not self.active:
-            return
+            return None
         
         # Renderizar sprite
-        screen.blit(self.sprite, self.rect)
+        dirty = screen.blit(self.sprite, self.rect)
         
-        # Debug: Hitbox
+        overlay = self.render_overlay(screen)
+        if overlay:
+            dirty.union_ip(overlay)
+        
+        return dirty
+    
+    def get_blit(self):
+        """
+        Sprite e posição para desenho em lote (render_batch)
+        
+        Returns:
+            tuple: (sprite, rect) ou None se inativo
+        """
+        if not self.active:
+            return None
+        return (self.sprite, self.rect)
+    
+    def render_overlay(self, screen):
+        """
+        Desenha o que vai por cima do sprite (debug: hitbox e HP)
+        
+        Args:
+            screen: Pygame surface
+        
+        Returns:
+            pygame.Rect: Área desenhada (None se nada)
+        """
         from config import config
-        if config.debug_mode and config.show_hitboxes:
-            pygame.draw.circle(
+        if not config.debug_mode:
+            return None
+        
+        # Debug: HP bar
+        dirty = self.render_hp_bar(screen)
+        
+        # Debug: Hitbox
+        if config.show_hitboxes:
+            dirty.union_ip(pygame.draw.circle(
                 screen,
                 COLOR_RED,
                 (int(self.x), int(self.y)),
                 self.hitbox_radius,
                 1
-            )
+            ))
         
-        # Debug: HP bar
-        if config.debug_mode:
-            self.render_hp_bar(screen)
+        return dirty
     
     def render_hp_bar(self, screen):
         """Renderiza barra de HP (debug)"""
@@ -156,7 +223,7 @@ class Enemy:
         bar_y = self.y - self.size // 2 - 8
         
         # Fundo (vermelho)
-        pygame.draw.rect(
+        dirty = pygame.draw.rect(
             screen,
             COLOR_RED,
             (bar_x, bar_y, bar_width, bar_height)
@@ -169,6 +236,8 @@ class Enemy:
             COLOR_GREEN,
             (bar_x, bar_y, bar_width * hp_ratio, bar_height)
         )
+        
+        return dirty
     
     def get_collision_circle(self):
         """
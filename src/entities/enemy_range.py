@@ -10,11 +10,21 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from constants import *
 from src.entities.enemy import Enemy
-from src.utils.placeholder_generator import create_enemy_sprite
+from src.systems.ecs import ComponentField
+from src.systems.enemy_ai import PHASE_DESCENDING, PHASE_STOPPED
+from src.utils.placeholder_generator import get_sprite
 
 
 class EnemyRange(Enemy):
-    """Inimigo Range - ataca de longe, move-se lentamente"""
+    """Inimigo Range - ataca de longe, move-se lentamente (IA em enemy_ai._range_kernel)"""
+    
+    COMPONENTS = Enemy.COMPONENTS + ('Brain', 'Range', 'Shooter')
+    
+    fire_rate = ComponentField('fire_rate')
+    fire_timer = ComponentField('fire_timer')
+    phase = ComponentField('phase')
+    stopped_timer = ComponentField('stopped_timer')
+    can_shoot = ComponentField('can_shoot')
     
     def __init__(self):
         """Inicializa o Range"""
@@ -30,7 +40,7 @@ class EnemyRange(Enemy):
         
         # Visual (azul para diferenciar)
         self.size = 32  # Maior que Kamikaze
-        self.sprite = create_enemy_sprite(self.size, COLOR_BLUE)
+        self.sprite = get_sprite('enemy', self.size, COLOR_BLUE)
         self.hitbox_radius = self.size // 2
         
         # Comportamento de tiro
@@ -38,11 +48,9 @@ class EnemyRange(Enemy):
         self.fire_timer = 0
         self.can_shoot = False
         
-        # ✅ NOVO: Movimento vertical em 3 fases
-        self.stop_y = SCREEN_HEIGHT * 0.3  # Para em 30% da tela
-        self.phase = 'descending'  # 'descending' → 'stopped' → 'leaving'
+        # ✅ NOVO: Movimento vertical em 3 fases (descendo → parado → saindo)
+        self.phase = PHASE_DESCENDING
         self.stopped_timer = 0
-        self.stopped_duration = 8.0  # ✅ Fica parado por 8 segundos
         
         # IA
         self.ai_level = 0
@@ -57,84 +65,10 @@ class EnemyRange(Enemy):
         """
         super().spawn(x, y)
         self.fire_timer = self.fire_rate  # Começa pronto para atirar
-        self.phase = 'descending'
+        self.phase = PHASE_DESCENDING
         self.stopped_timer = 0
         self.can_shoot = False
     
-    def update(self, dt, player_pos=None):
-        """
-        Atualiza o Range
-        
-        Args:
-            dt (float): Delta time
-            player_pos (tuple): Posição do player (x, y)
-        """
-        if not self.active or not self.alive:
-            return
-        
-        # Sistema de fases
-        if self.phase == 'descending':
-            # FASE 1: Descendo até stop_y
-            self.vy = self.speed
-            self.vx = 0
-            
-            # ✅ AI Level 2+: Pode atirar mesmo descendo (mas raramente)
-            if self.ai_level >= 2:
-                self.can_shoot = True
-                # Aumenta fire rate (atira menos frequente)
-                if self.fire_timer <= 0:
-                    self.fire_rate = 4.0  # 1 tiro a cada 4s (metade da frequência)
-            else:
-                self.can_shoot = False
-            
-            if self.y >= self.stop_y:
-                # Chegou no ponto de parada
-                self.phase = 'stopped'
-                self.stopped_timer = 0
-                self.can_shoot = True
-                self.fire_rate = 2.0  # Volta ao normal
-                print(f"Range {id(self)} PAROU em Y={self.y:.0f}")
-        
-        elif self.phase == 'stopped':
-            # FASE 2: Parado atirando MAS com movimento lateral
-            self.vy = 0
-            
-            # Movimento lateral SEMPRE (não apenas AI 1+)
-            import math
-            self.vx = math.sin(pygame.time.get_ticks() * 0.002) * 40  # Patrol constante
-            
-            self.can_shoot = True
-            self.fire_rate = 2.0
-            
-            # Contar tempo parado
-            self.stopped_timer += dt
-            
-            if self.stopped_timer >= self.stopped_duration:
-                # Acabou o tempo, começar a descer
-                self.phase = 'leaving'
-                print(f"Range {id(self)} voltou a DESCER")
-        
-        elif self.phase == 'leaving':
-            # FASE 3: Descendo até sair da tela
-            self.vy = self.speed
-            self.vx = 0
-            
-            # ✅ AI Level 2+: Continua atirando em retirada (menos frequente)
-            if self.ai_level >= 2:
-                self.can_shoot = True
-                self.fire_rate = 5.0  # 1 tiro a cada 5s (bem raro)
-            else:
-                self.can_shoot = False
-    
-        # Aplicar movimento
-        super().update(dt, player_pos)
-        
-        # Fire rate timer
-        if self.fire_timer > 0:
-            self.fire_timer -= dt
-        else:
-            self.fire_timer = 0
-    
     def can_fire(self):
         """
         Verifica se pode atirar
@@ -147,7 +81,7 @@ class EnemyRange(Enemy):
             self.fire_timer <= 0 and 
             self.alive and 
             self.active and
-            self.phase == 'stopped'  # ✅ Só atira quando parado
+            self.phase == PHASE_STOPPED  # ✅ Só atira quando parado
         )
     
     def shoot(self, projectile_pool, player_pos=None):
@@ -217,23 +151,28 @@ class EnemyRange(Enemy):
         """
         self.ai_level = level
     
-    def render(self, screen):
+    def render_overlay(self, screen):
         """
-        Renderiza o Range (com indicador de tiro)
+        Desenha o debug do inimigo e o indicador de tiro
         
         Args:
             screen: Pygame surface
+        
+        Returns:
+            pygame.Rect: Área desenhada (None se nada)
         """
-        super().render(screen)
+        dirty = super().render_overlay(screen)
         
         # Indicador visual quando pronto para atirar
         from config import config
         if config.debug_mode and self.can_shoot and self.fire_timer <= 0.5:
             # Flash vermelho quando quase atirar
-            pygame.draw.circle(
+            dirty.union_ip(pygame.draw.circle(
                 screen,
                 COLOR_RED,
                 (int(self.x), int(self.y)),
                 self.hitbox_radius + 5,
                 2
-            )
\ No newline at end of file
+            ))
+        
+        return dirty
\ No newline at end of file
@@ -10,7 +10,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from constants import *
-from src.utils.placeholder_generator import create_player_sprite
+from src.utils.placeholder_generator import get_sprite
 
 
 class Player:
@@ -47,7 +47,7 @@ class Player:
         self.fire_timer = 0
         
         # Sprite
-        self.sprite = create_player_sprite(32)
+        self.sprite = get_sprite('player', 32)
         self.rect = self.sprite.get_rect()
         self.rect.center = (self.x, self.y)
         
@@ -77,6 +77,8 @@ class Player:
         self.shield_timer = 0
         self.shield_cooldown = 10.0
         self.explosion_radius = 0  # Raio de explosão dos projéteis
+        self.pickup_radius = 30  # Raio de coleta de minérios
+        self.magnet_radius = 80  # Raio do ímã que puxa minérios
         
     def handle_input(self, move_x, move_y):
         """
@@ -282,49 +284,84 @@ class Player:
         
         Args:
             screen: Pygame surface
+        
+        Returns:
+            pygame.Rect: Área da tela desenhada (None se não desenhou)
+        """
+        item = self.get_blit()
+        if item is None:
+            return None
+        
+        # Renderizar sprite
+        dirty = screen.blit(*item)
+        
+        overlay = self.render_overlay(screen)
+        if overlay:
+            dirty.union_ip(overlay)
+        
+        return dirty
+    
+    def get_blit(self):
+        """
+        Sprite e posição para desenho em lote
+        
+        Returns:
+            tuple: (sprite, rect) ou None se não deve desenhar
         """
         if not self.alive:
-            return
+            return None
         
         # Efeito de piscar quando invencível
         if self.invincible:
             if int(self.invincible_timer * 10) % 2 == 0:
-                return
+                return None
         
-        # Renderizar sprite
-        screen.blit(self.sprite, self.rect)
+        return (self.sprite, self.rect)
+    
+    def render_overlay(self, screen):
+        """
+        Desenha o debug por cima do sprite (spawn do tiro, centro, hitbox)
         
-        # DEBUG: Mostrar onde projétil spawna
+        Args:
+            screen: Pygame surface
+        
+        Returns:
+            pygame.Rect: Área desenhada (None se nada)
+        """
         from config import config
-        if config.debug_mode:
-            # Ponto de spawn do projétil (nariz)
-            spawn_y = self.y - 16
-            pygame.draw.circle(
-                screen,
-                (255, 0, 255),  # Rosa/Magenta
-                (int(self.x), int(spawn_y)),
-                4,  # Raio
-                0   # Preenchido
-            )
-            
-            # Linha do centro do player
-            pygame.draw.line(
-                screen,
-                (0, 255, 255),  # Ciano
-                (int(self.x) - 10, int(self.y)),
-                (int(self.x) + 10, int(self.y)),
-                2
-            )
+        if not config.debug_mode:
+            return None
+        
+        # DEBUG: Mostrar onde projétil spawna (nariz)
+        spawn_y = self.y - 16
+        dirty = pygame.draw.circle(
+            screen,
+            (255, 0, 255),  # Rosa/Magenta
+            (int(self.x), int(spawn_y)),
+            4,  # Raio
+            0   # Preenchido
+        )
+        
+        # Linha do centro do player
+        dirty.union_ip(pygame.draw.line(
+            screen,
+            (0, 255, 255),  # Ciano
+            (int(self.x) - 10, int(self.y)),
+            (int(self.x) + 10, int(self.y)),
+            2
+        ))
         
         # Hitbox
-        if config.debug_mode and config.show_hitboxes:
-            pygame.draw.circle(
+        if config.show_hitboxes:
+            dirty.union_ip(pygame.draw.circle(
                 screen,
                 COLOR_GREEN,
                 (int(self.x), int(self.y)),
                 self.hitbox_radius,
                 1
-            )
+            ))
+        
+        return dirty
     
     def equip_card(self, card):
         """
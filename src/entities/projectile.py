@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from constants import *
-from src.utils.placeholder_generator import create_projectile_sprite
+from src.utils.placeholder_generator import get_sprite
 
 
 class Projectile:
@@ -28,9 +28,9 @@ class Projectile:
         # Stats
         self.damage = 10
         
-        # Sprites (criados uma vez)
-        self.sprite_player = create_projectile_sprite(6, 12, COLOR_YELLOW)
-        self.sprite_enemy = create_projectile_sprite(8, 8, COLOR_RED)
+        # Sprites (compartilhados entre todos os projéteis)
+        self.sprite_player = get_sprite('projectile', (6, 12), COLOR_YELLOW)
+        self.sprite_enemy = get_sprite('projectile', (8, 8), COLOR_RED)
         self.sprite = self.sprite_player  # Padrão
         self.rect = self.sprite.get_rect()
         
@@ -126,18 +126,35 @@ class Projectile:
         
         Args:
             screen: Pygame surface
+        
+        Returns:
+            pygame.Rect: Área da tela desenhada (None se inativo)
         """
         if not self.active:
-            return
+            return None
+        
+        dirty = screen.blit(self.sprite, self.rect)
         
-        screen.blit(self.sprite, self.rect)
+        overlay = self.render_overlay(screen)
+        if overlay:
+            dirty.union_ip(overlay)
         
-        # Debug: Hitbox
+        return dirty
+    
+    def get_blit(self):
+        """Sprite e posição para desenho em lote (None se inativo)"""
+        if not self.active:
+            return None
+        return (self.sprite, self.rect)
+    
+    def render_overlay(self, screen):
+        """Desenha a hitbox (debug) por cima do sprite"""
         from config import config
         if config.debug_mode and config.show_hitboxes:
-            pygame.draw.rect(
+            return pygame.draw.rect(
                 screen,
                 COLOR_YELLOW if self.owner == 'player' else COLOR_RED,
                 self.rect,
                 1
-            )
\ No newline at end of file
+            )
+        return None
\ No newline at end of file
@@ -5,54 +5,86 @@ GameState - Estado principal de gameplay
 import pygame
 import sys
 import os
-import random
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from constants import *
 from config import config as game_config
 from src.entities.player import Player
-from src.entities.projectile import Projectile
-from src.systems.object_pool import ObjectPool
+from src.systems.object_pool import ObjectPool, render_batch
+from src.systems.projectile_buffer import ProjectileBuffer
 from src.core.input_manager import InputManager
+from src.core.run_context import run_context
+from src.core.render_target import RenderTarget
 from src.background.starfield import Background
 from src.systems.collision import CollisionSystem
+from src.systems.enemy_ai import enemy_ai_system
 from src.systems.wave_manager import WaveManager
 from src.entities.card import CardManager
 from src.entities.card_drop import CardDrop
 from src.ui.card_menu import CardMenu
+from src.ui.modal_layer import ModalLayer, create_dim_surface
+from src.utils.debug import FrameProfiler
+from src.utils.particle_system import ParticleSystem
+from src.utils.particles import DEATH_EFFECTS
+from src.utils.text_cache import TextLabel, render_text
 
 
 class GameState:
     """Estado de gameplay ativo"""
     
-    def __init__(self, screen):
-        """Inicializa o estado de jogo"""
+    def __init__(self, screen, input_manager=None, seed=None):
+        """
+        Inicializa o estado de jogo
+        
+        Args:
+            screen: Pygame surface (None na simulação headless)
+            input_manager: InputManager alternativo (ex: input scriptado)
+            seed (int): Seed da run (None = aleatória)
+        """
         self.screen = screen
         
+        # Resolução interna (mundo desenhado menor e esticado para a janela)
+        self.render_target = None
+        if screen is not None:
+            self.render_target = RenderTarget(
+                screen,
+                game_config.render_resolution,
+                game_config.render_smooth
+            )
+        self.ui_screen = screen  # Onde HUD e menus são desenhados
+        
+        # Nova run: RNG e relógio de simulação reiniciados pela seed
+        # (antes de criar qualquer componente que sorteie algo)
+        run_context.reset(seed)
+        self.seed = run_context.seed
+        self.rng = run_context.rng
+        self.clock = run_context.clock
+        self.world = run_context.world
+        
         # Componentes
-        self.background = Background()
-        self.input_manager = InputManager()
+        self.background = Background(rng=run_context.visual_rng)
+        self.input_manager = input_manager or InputManager()
         
         # Player
         self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150)
         
-        # Projéteis
-        self.projectile_pool = ObjectPool(Projectile, initial_size=200)
+        # Projéteis (structure-of-arrays, mesma API do ObjectPool)
+        self.projectile_pool = ProjectileBuffer(capacity=200)
         
         # Collectibles (minérios)
-        from src.entities.collectible import Collectible
-        self.collectible_pool = ObjectPool(Collectible, initial_size=100)
+        from src.systems.collectible_buffer import CollectibleBuffer
+        self.collectible_pool = CollectibleBuffer(capacity=100)
         self.player_minerals = 0
         
         # Sistema de colisão
         self.collision_system = CollisionSystem()
         
         # Wave Manager
-        self.wave_manager = WaveManager()
+        self.wave_manager = WaveManager(rng=self.rng)
         
         # Card Manager
-        self.card_manager = CardManager()
+        self.card_manager = CardManager(rng=self.rng)
         
         # Card Drops (pool)
         self.card_drop_pool = ObjectPool(CardDrop, initial_size=20)
@@ -60,15 +92,44 @@ class GameState:
         # Card Menu
         self.card_menu = CardMenu()
         
+        # Partículas (efeito visual: sorteios saem do visual_rng)
+        self.particles = ParticleSystem(
+            capacity=game_config.particle_capacity,
+            spawn_budget=game_config.particle_spawn_budget,
+            seed=run_context.visual_rng.getrandbits(64)
+        )
+        self.card_sparkle = -1  # Emissor que segue o player após coletar carta
+        
         # ✅ NOVO: Efeito visual de coleta de carta
         self.card_collect_effect = None  # {'timer': float, 'card_name': str, 'rarity': str}
         
+        # Textos que mudam com o jogo (só re-renderizam quando o valor muda)
+        self.hud_labels = {
+            'hp': TextLabel(32),
+            'minerals': TextLabel(32, COLOR_YELLOW),
+            'cards': TextLabel(32, COLOR_CYAN),
+            'sector': TextLabel(32),
+            'fps': TextLabel(24),
+            'debug': [TextLabel(24, COLOR_GRAY) for _ in range(5)],
+        }
+        
+        # Overlays em cache (só remontam quando o conteúdo muda)
+        self.pause_layer = ModalLayer(self._build_pause_overlay)
+        self.game_over_layer = ModalLayer(self._build_game_over_overlay)
+        self.collect_layer = ModalLayer(self._build_card_collect_effect)
+        
         # Estado
         self.paused = False
         self.game_over = False
         self.current_fps = 0
         
-        print("✅ GameState inicializado")
+        # Passos de simulação (posições anteriores para interpolar o render)
+        self.sim_step = 0
+        
+        # Profiler (frames são abertos/fechados pelo loop principal)
+        self.profiler = FrameProfiler(keep_trace=bool(game_config.profiler_dump))
+        
+        print(f"✅ GameState inicializado (seed {self.seed})")
     
     def handle_events(self, events):
         """Processa eventos"""
@@ -80,6 +141,11 @@ class GameState:
                         self.card_menu.toggle()
                         return
                 
+                # K para kill player (teste game over)
+                if event.key == pygame.K_k:
+                    self.player.take_damage(999)
+                    print("Player killed (test)")
+                
                 # Pausa
                 if event.key == pygame.K_PAUSE and not self.card_menu.active:
                     self.paused = not self.paused
@@ -103,19 +169,25 @@ class GameState:
                     print("⭐ Starfield speed: 1.15x (+15%)")
                 
                 # DENSIDADE DE ESTRELAS
+                starfield = self.background.starfield
                 if event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
-                    new_count = max(50, self.background.starfield.star_count - 50)
-                    self.background.starfield.set_density(new_count)
+                    new_count = max(50, starfield.star_count - starfield.density_step)
+                    starfield.set_density(new_count)
                     print(f"⭐ Star density: {new_count}")
                 if event.key == pygame.K_EQUALS or event.key == pygame.K_KP_PLUS:
-                    new_count = min(500, self.background.starfield.star_count + 50)
-                    self.background.starfield.set_density(new_count)
+                    new_count = min(starfield.max_star_count, starfield.star_count + starfield.density_step)
+                    starfield.set_density(new_count)
                     print(f"⭐ Star density: {new_count}")
     
     def update(self, dt, fps=0):
         """Atualiza o estado do jogo"""
         # Guardar FPS
         self.current_fps = fps
+        profiler = self.profiler
+        
+        # Estado anterior para a interpolação (só quem renderiza precisa)
+        if self.screen is not None:
+            self.capture_positions()
         
         # Update card menu
         self.card_menu.update(dt, self.input_manager, self.player)
@@ -125,6 +197,7 @@ class GameState:
             self.card_collect_effect['timer'] -= dt
             if self.card_collect_effect['timer'] <= 0:
                 self.card_collect_effect = None
+        profiler.lap('input')
         
         # Se menu aberto, pausar gameplay
         if self.card_menu.active:
@@ -133,15 +206,20 @@ class GameState:
         if self.paused or self.game_over:
             return
         
+        # Relógio da simulação (só anda com o gameplay)
+        self.clock.advance(dt)
+        
         # Update input
         self.input_manager.update()
         
         # Movimento do player
         move_x, move_y = self.input_manager.get_movement(player_index=0)
+        profiler.lap('input')
         
         # Update componentes
         self.background.update(dt)
         self.player.update(dt, move_x, move_y)
+        profiler.lap('player')
         
         # Tiro automático
         if self.player.alive:
@@ -149,27 +227,32 @@ class GameState:
         
         # Update projéteis
         self.projectile_pool.update_all(dt)
+        profiler.lap('projectiles')
         
         # Pegar inimigos ativos
         active_enemies = self.wave_manager.get_active_enemies()
         
-        # Update inimigos
+        # IA dos inimigos em lote (velocidades e fases)
         player_pos = (self.player.x, self.player.y) if self.player.alive else None
-        for enemy in active_enemies:
-            enemy.update(dt, player_pos)
-            
-            # Ranges atiram
-            if hasattr(enemy, 'can_fire') and enemy.can_fire():
+        enemy_ai_system(self.world, dt, player_pos, self.clock.get_ticks())
+        
+        # Sistemas do ECS: movimento, órbitas e timers (uma vez cada)
+        self.world.update(dt)
+        
+        # Ranges atiram
+        for enemy in self.world.query_objects('Shooter'):
+            if enemy.can_fire():
                 enemy.shoot(self.projectile_pool, player_pos)
-            
-            # Mães spawnam filhotes
-            if hasattr(enemy, 'can_spawn_child'):
-                if enemy.can_spawn_child():
-                    if random.random() < 0.75:
-                        child = self.wave_manager.get_kamikaze()
-                    else:
-                        child = self.wave_manager.get_range()
-                    enemy.spawn_child(child)
+        
+        # Mães spawnam filhotes
+        for enemy in self.world.query_objects('Spawner'):
+            if enemy.can_spawn_child():
+                if self.rng.random() < 0.75:
+                    child = self.wave_manager.get_kamikaze()
+                else:
+                    child = self.wave_manager.get_range()
+                enemy.spawn_child(child)
+        profiler.lap('enemies')
         
         # Colisões
         collision_stats = self.collision_system.process_collisions(
@@ -177,6 +260,7 @@ class GameState:
             active_enemies,
             self.projectile_pool
         )
+        profiler.lap('collisions')
         
         # DROPAR MINÉRIOS E CARTAS
         enemies_to_deactivate = []
@@ -197,8 +281,8 @@ class GameState:
                 
                 for i in range(num_drops):
                     mineral = self.collectible_pool.get()
-                    offset_x = random.randint(-15, 15) * i
-                    offset_y = random.randint(-10, 10) * i
+                    offset_x = self.rng.randint(-15, 15) * i
+                    offset_y = self.rng.randint(-10, 10) * i
                     mineral.spawn(
                         enemy.x + offset_x,
                         enemy.y + offset_y,
@@ -208,44 +292,53 @@ class GameState:
                 # ✅ AUMENTADO: Chance de dropar carta (3x mais frequente)
                 drop_chance = self._get_card_drop_chance(enemy.enemy_type)
                 
-                if random.random() < drop_chance:
+                if self.rng.random() < drop_chance:
                     rarity = self.card_manager.roll_rarity()
                     card = self.card_manager.get_random_card(rarity)
                     card_drop = self.card_drop_pool.get()
                     card_drop.spawn(enemy.x, enemy.y, card)
                     print(f"🎴 CARTA DROPADA: {card.name} ({card.rarity})")
                 
+                # Explosão
+                self.particles.burst(
+                    DEATH_EFFECTS.get(enemy.enemy_type, 'explosion'),
+                    enemy.x,
+                    enemy.y
+                )
+                
                 enemy.has_dropped = True
                 enemies_to_deactivate.append(enemy)
         
         for enemy in enemies_to_deactivate:
             enemy.deactivate()
+        profiler.lap('drops')
         
         # Update Wave Manager
         self.wave_manager.update(dt, active_enemies)
         
+        # Atmosfera do setor: preparada durante o countdown, crossfade no início
+        sector_atmosphere = self.background.atmosphere.for_sector(self.wave_manager.current_sector)
+        if self.wave_manager.sector_countdown > 0:
+            self.background.prefetch_atmosphere(sector_atmosphere)
+        else:
+            self.background.set_atmosphere(sector_atmosphere)
+        profiler.lap('waves')
+        
         # Update collectibles
         self.collectible_pool.update_all(dt)
         
         # Update card drops
         self.card_drop_pool.update_all(dt)
         
-        # Coletar minérios
-        for collectible in self.collectible_pool.in_use[:]:
-            if not collectible.active:
-                continue
-            
-            dx = collectible.x - self.player.x
-            dy = collectible.y - self.player.y
-            distance_sq = dx*dx + dy*dy
-            collect_radius = 30
-            
-            if distance_sq < collect_radius * collect_radius:
-                value = collectible.collect()
-                self.player_minerals += value
+        # Coletar minérios (ímã puxa os próximos, coleta numa redução só)
+        if self.player.alive:
+            self.collectible_pool.attract(self.player.x, self.player.y, self.player.magnet_radius, dt)
+        self.player_minerals += self.collectible_pool.collect(
+            self.player.x, self.player.y, self.player.pickup_radius
+        )
         
         # Coletar cartas
-        for card_drop in self.card_drop_pool.in_use[:]:
+        for card_drop in self.card_drop_pool.in_use:
             if not card_drop.active:
                 continue
             
@@ -277,11 +370,47 @@ class GameState:
                                 'card_name': card_name,
                                 'rarity': card_rarity
                             }
+                            self.particles.burst('card_pickup', self.player.x, self.player.y)
+                            self.particles.stop_emitter(self.card_sparkle)
+                            self.card_sparkle = self.particles.add_emitter(
+                                'card_sparkle', self.player.x, self.player.y, duration=1.0
+                            )
         
         # Check game over
         if not self.player.alive and not self.game_over:
             self.game_over = True
             print("💀 GAME OVER!")
+        
+        profiler.lap('collectibles')
+        
+        # Partículas
+        if self.particles.is_emitter_active(self.card_sparkle):
+            self.particles.move_emitter(self.card_sparkle, self.player.x, self.player.y)
+        self.particles.update(dt)
+        profiler.lap('particles')
+    
+    def capture_positions(self):
+        """
+        Guarda as posições do fim do passo anterior
+        
+        O render desenha entre essas posições e as atuais (ver render).
+        Objetos que entram em cena durante o passo não têm posição
+        anterior deste passo e são desenhados onde estão.
+        """
+        self.sim_step += 1
+        step = self.sim_step
+        
+        objects = [self.player]
+        objects.extend(self.wave_manager.get_active_enemies())
+        objects.extend(self.card_drop_pool.in_use)
+        
+        for obj in objects:
+            obj.prev_pos = obj.rect.topleft
+            obj.prev_step = step
+        
+        self.projectile_pool.capture_positions()
+        self.collectible_pool.capture_positions()
+        self.particles.capture_positions()
     
     def _get_card_drop_chance(self, enemy_type):
         """
@@ -297,49 +426,129 @@ class GameState:
         else:
             return 0.15
     
-    def render(self):
-        """Renderiza o estado do jogo"""
+    def render(self, dirty=False, restore_rects=None, alpha=1.0):
+        """
+        Renderiza o estado do jogo
+        
+        Args:
+            dirty (bool): Modo dirty rects (fundo estático, só restaura áreas sujas)
+            restore_rects (list): Áreas do frame anterior a restaurar (None = tudo)
+            alpha (float): Fração do passo de simulação já decorrida; entidades
+                são desenhadas entre a posição anterior e a atual (1 = atual)
+        
+        Returns:
+            tuple: Apenas no modo dirty: (áreas desenhadas sobre o fundo ou
+                None se um overlay cobriu a tela, True se a tela toda mudou)
+        """
+        profiler = self.profiler
+        screen = self.screen
+        drawn = []
+        
+        # Mundo: na resolução interna (ScaledView) ou direto na tela
+        target = self.render_target
+        scaled = target.scaled
+        world = target.view
+        overlays = [] if scaled else None  # Debug/brilho vão depois do upscale
+        step = self.sim_step  # Interpolação entre o passo anterior e o atual
+        
         # Background
-        self.background.render(self.screen)
+        if dirty:
+            repainted = self.background.render_static(world, restore_rects)
+        else:
+            self.background.render(world)
+            repainted = True
+        profiler.lap('draw_background')
         
-        # Inimigos
-        for enemy in self.wave_manager.get_active_enemies():
-            enemy.render(self.screen)
-            
-            if hasattr(enemy, 'children'):
-                for child in enemy.children:
-                    if child.active:
-                        child.render(self.screen)
+        # Inimigos (filhotes da Mother também estão entre os ativos)
+        enemies = self.wave_manager.get_active_enemies()
+        drawn.extend(render_batch(world, enemies, doreturn=dirty, overlays=overlays, alpha=alpha, step=step))
+        profiler.lap('draw_enemies')
         
         # Collectibles
-        self.collectible_pool.render_all(self.screen)
+        drawn.extend(self.collectible_pool.render_all(
+            world, doreturn=dirty, overlays=overlays, alpha=alpha, step=step
+        ))
         
         # Card drops
-        self.card_drop_pool.render_all(self.screen)
-        
-        # Card collect prompts
-        for card_drop in self.card_drop_pool.in_use:
-            if card_drop.active:
-                card_drop.render_collect_prompt(self.screen, self.player)
+        drawn.extend(self.card_drop_pool.render_all(
+            world, doreturn=dirty, overlays=overlays, alpha=alpha, step=step
+        ))
         
         # Projéteis
-        self.projectile_pool.render_all(self.screen)
+        drawn.extend(self.projectile_pool.render_all(
+            world, doreturn=dirty, overlays=overlays, alpha=alpha, step=step
+        ))
         
         # Player
-        self.player.render(self.screen)
+        drawn.extend(render_batch(world, [self.player], doreturn=dirty, overlays=overlays, alpha=alpha, step=step))
+        profiler.lap('draw_pools')
+        
+        # Partículas (por cima das entidades)
+        drawn.extend(self.particles.render(world, doreturn=dirty, alpha=alpha, step=step))
+        profiler.lap('draw_particles')
+        
+        if not scaled:
+            overlay = self.render_ui(screen, drawn)
+        else:
+            # HUD na resolução interna (opcional): vai junto no upscale
+            hud_native = game_config.render_hud_native
+            if not hud_native:
+                overlay = self.render_ui(world, drawn)
+            
+            target.present()
+            for obj in overlays:
+                obj.render_overlay(screen)
+            profiler.lap('upscale')
+            
+            if hud_native:
+                overlay = self.render_ui(screen, drawn)
+        
+        # Profiler (F3)
+        if game_config.show_profiler:
+            profiler.render(screen)
+            overlay = True
+        
+        if not dirty:
+            return None
+        
+        drawn = None if overlay else [rect for rect in drawn if rect]
+        return drawn, repainted or overlay
+    
+    def render_ui(self, screen, drawn):
+        """
+        Renderiza prompts, HUD, efeitos de texto e menus
+        
+        Args:
+            screen: Superfície da janela ou ScaledView (HUD em resolução reduzida)
+            drawn (list): Recebe as áreas desenhadas (dirty rects)
+        
+        Returns:
+            bool: True se um overlay de tela cheia foi desenhado
+        """
+        profiler = self.profiler
+        self.ui_screen = screen
+        
+        # Card collect prompts
+        for card_drop in self.card_drop_pool.in_use:
+            if card_drop.active:
+                drawn.append(card_drop.render_collect_prompt(screen, self.player))
         
         # HUD
-        self.render_hud()
+        drawn.extend(self.render_hud())
+        profiler.lap('draw_hud')
         
         # ✅ NOVO: Efeito de coleta de carta
         if self.card_collect_effect:
-            self.render_card_collect_effect()
+            drawn.append(self.render_card_collect_effect())
         
         # Countdown
-        self.render_countdown()
+        drawn.extend(self.render_countdown())
+        
+        # Overlays de tela cheia
+        overlay = self.card_menu.active or self.paused or self.game_over
         
         # Card Menu
-        self.card_menu.render(self.screen, self.player)
+        self.card_menu.render(screen, self.player)
         
         # Pause
         if self.paused and not self.card_menu.active:
@@ -348,27 +557,25 @@ class GameState:
         # Game Over
         if self.game_over:
             self.render_game_over_overlay()
+        profiler.lap('draw_menus')
+        
+        return overlay
     
     def render_card_collect_effect(self):
-        """✅ NOVO: Renderiza efeito visual ao coletar carta"""
+        """
+        ✅ NOVO: Renderiza efeito visual ao coletar carta
+        
+        Returns:
+            pygame.Rect: Área da tela desenhada (None se não há efeito)
+        """
         if not self.card_collect_effect:
-            return
+            return None
         
         # Informações
         card_name = self.card_collect_effect['card_name']
         card_rarity = self.card_collect_effect['rarity']
         timer = self.card_collect_effect['timer']
         
-        # Cor baseada na raridade
-        if card_rarity == 'comum':
-            color = (200, 200, 200)
-        elif card_rarity == 'incomum':
-            color = (100, 150, 255)
-        elif card_rarity == 'epico':
-            color = (200, 0, 255)
-        else:
-            color = (255, 255, 255)
-        
         # Fade out nos últimos 0.5s
         alpha = 255
         if timer < 0.5:
@@ -377,94 +584,103 @@ class GameState:
         # Posição (topo da tela, centralizado)
         y_pos = 150 + int((3.0 - timer) * 20)  # Desce suavemente
         
-        # Fontes
-        font_large = pygame.font.Font(None, 64)
-        font_medium = pygame.font.Font(None, 36)
-        
-        # Texto "NOVA CARTA!"
-        new_card_text = font_large.render("NOVA CARTA!", True, color)
-        new_card_rect = new_card_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
+        # Caixa montada uma vez por carta; o fade só muda o alpha
+        key = (card_name, card_rarity)
+        surface = self.collect_layer.get(key, card_name, card_rarity)
+        return self.collect_layer.render(
+            self.ui_screen,
+            key,
+            pos=((SCREEN_WIDTH - surface.get_width()) // 2, y_pos - 40),
+            alpha=alpha
+        )
+    
+    def _build_card_collect_effect(self, card_name, card_rarity):
+        """
+        Monta a caixa "NOVA CARTA!" (opaca, o fade vem do set_alpha)
         
-        # Texto do nome da carta
-        name_text = font_medium.render(card_name, True, color)
-        name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 50))
+        Args:
+            card_name (str): Nome da carta
+            card_rarity (str): Raridade
         
-        # Texto da raridade
-        rarity_text = font_medium.render(card_rarity.upper(), True, color)
-        rarity_rect = rarity_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 85))
+        Returns:
+            pygame.Surface: Caixa com fundo, borda e textos
+        """
+        # Cor baseada na raridade
+        if card_rarity == 'comum':
+            color = (200, 200, 200)
+        elif card_rarity == 'incomum':
+            color = (100, 150, 255)
+        elif card_rarity == 'epico':
+            color = (200, 0, 255)
+        else:
+            color = (255, 255, 255)
         
-        # Aplicar alpha
-        new_card_text.set_alpha(alpha)
-        name_text.set_alpha(alpha)
-        rarity_text.set_alpha(alpha)
+        # Textos
+        new_card_text = render_text("NOVA CARTA!", 64, color)
+        name_text = render_text(card_name, 36, color)
+        rarity_text = render_text(card_rarity.upper(), 36, color)
         
-        # Fundo semi-transparente
+        # Fundo semi-transparente (nomes longos podem passar da caixa)
         bg_width = 500
         bg_height = 140
-        bg_x = (SCREEN_WIDTH - bg_width) // 2
-        bg_y = y_pos - 40
+        width = max(bg_width, name_text.get_width())
+        bg_x = (width - bg_width) // 2
         
-        bg_surface = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, int(200 * (alpha / 255))))
+        surface = pygame.Surface((width, bg_height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 200), (bg_x, 0, bg_width, bg_height))
         
         # Borda colorida
-        border_surface = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
-        pygame.draw.rect(border_surface, (*color, alpha), (0, 0, bg_width, bg_height), 4)
-        
-        # Blit
-        self.screen.blit(bg_surface, (bg_x, bg_y))
-        self.screen.blit(border_surface, (bg_x, bg_y))
-        self.screen.blit(new_card_text, new_card_rect)
-        self.screen.blit(name_text, name_rect)
-        self.screen.blit(rarity_text, rarity_rect)
+        pygame.draw.rect(surface, color, (bg_x, 0, bg_width, bg_height), 4)
+        
+        # Textos (posições relativas ao topo da caixa)
+        center_x = width // 2
+        surface.blit(new_card_text, new_card_text.get_rect(center=(center_x, 40)))
+        surface.blit(name_text, name_text.get_rect(center=(center_x, 90)))
+        surface.blit(rarity_text, rarity_text.get_rect(center=(center_x, 125)))
+        
+        return surface
     
     def render_hud(self):
-        """Renderiza HUD"""
-        font = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
+        """
+        Renderiza HUD
+        
+        Returns:
+            list: Áreas da tela desenhadas
+        """
+        labels = self.hud_labels
+        dirty = []
         
         # HP
-        hp_text = font.render(
+        hp_text = labels['hp'].render(
             f"HP: {int(self.player.hp)}/{self.player.max_hp}",
-            True,
             COLOR_GREEN if self.player.hp > 30 else COLOR_RED
         )
-        self.screen.blit(hp_text, (20, 20))
+        dirty.append(self.ui_screen.blit(hp_text, (20, 20)))
         
         # Minérios
-        mineral_text = font.render(
-            f"MINERIOS: {self.player_minerals}",
-            True,
-            COLOR_YELLOW
-        )
-        self.screen.blit(mineral_text, (20, 60))
+        mineral_text = labels['minerals'].render(f"MINERIOS: {self.player_minerals}")
+        dirty.append(self.ui_screen.blit(mineral_text, (20, 60)))
         
         # Cartas equipadas
         cards_equipped = len(self.player.equipped_cards)
-        cards_text = font.render(
-            f"CARTAS: {cards_equipped}/{self.player.max_card_slots}",
-            True,
-            COLOR_CYAN
+        cards_text = labels['cards'].render(
+            f"CARTAS: {cards_equipped}/{self.player.max_card_slots}"
         )
-        self.screen.blit(cards_text, (20, 100))
+        dirty.append(self.ui_screen.blit(cards_text, (20, 100)))
         
         # Hint de menu
-        hint_text = font_small.render("[TAB] Menu de Cartas", True, COLOR_GRAY)
-        self.screen.blit(hint_text, (20, 135))
+        hint_text = render_text("[TAB] Menu de Cartas", 24, COLOR_GRAY)
+        dirty.append(self.ui_screen.blit(hint_text, (20, 135)))
         
         # Setor
-        sector_text = font.render(
-            f"SETOR {self.wave_manager.current_sector}",
-            True,
-            COLOR_WHITE
-        )
+        sector_text = labels['sector'].render(f"SETOR {self.wave_manager.current_sector}")
         sector_rect = sector_text.get_rect(center=(SCREEN_WIDTH // 2, 30))
-        self.screen.blit(sector_text, sector_rect)
+        dirty.append(self.ui_screen.blit(sector_text, sector_rect))
         
         # FPS
         if game_config.show_fps:
-            fps_text = font_small.render(f"FPS: {int(self.current_fps)}", True, COLOR_WHITE)
-            self.screen.blit(fps_text, (SCREEN_WIDTH - 100, 20))
+            fps_text = labels['fps'].render(f"FPS: {int(self.current_fps)}")
+            dirty.append(self.ui_screen.blit(fps_text, (SCREEN_WIDTH - 100, 20)))
         
         # Debug info
         if game_config.debug_mode:
@@ -474,99 +690,99 @@ class GameState:
                 f"Projéteis: {self.projectile_pool.get_active_count()}",
                 f"Pierce: {self.player.pierce}",
                 f"Spawned: {self.wave_manager.enemies_spawned}/{self.wave_manager.enemies_to_spawn}",
+                f"Partículas: {self.particles.count}",
             ]
             
             y_offset = 170
-            for line in info_lines:
-                text = font_small.render(line, True, COLOR_GRAY)
-                self.screen.blit(text, (20, y_offset))
+            for label, line in zip(labels['debug'], info_lines):
+                text = label.render(line)
+                dirty.append(self.ui_screen.blit(text, (20, y_offset)))
                 y_offset += 25
+        
+        return dirty
     
     def render_countdown(self):
-        """Renderiza countdown entre SETORES"""
+        """
+        Renderiza countdown entre SETORES
+        
+        Returns:
+            list: Áreas da tela desenhadas
+        """
         countdown_text = self.wave_manager.get_countdown_text()
+        dirty = []
         
         if countdown_text:
-            font_huge = pygame.font.Font(None, 120)
-            font_large = pygame.font.Font(None, 80)
-            
             if '\n' in countdown_text:
                 lines = countdown_text.split('\n')
                 
-                text1 = font_large.render(lines[0], True, (0, 255, 255))
+                text1 = render_text(lines[0], 80, (0, 255, 255))
                 rect1 = text1.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
                 
-                text2 = font_huge.render(lines[1], True, COLOR_YELLOW)
+                text2 = render_text(lines[1], 120, COLOR_YELLOW)
                 rect2 = text2.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
                 
-                shadow1 = font_large.render(lines[0], True, COLOR_BLACK)
+                shadow1 = render_text(lines[0], 80, COLOR_BLACK)
                 shadow_rect1 = shadow1.get_rect(center=(SCREEN_WIDTH // 2 + 3, SCREEN_HEIGHT // 2 - 57))
-                shadow2 = font_huge.render(lines[1], True, COLOR_BLACK)
+                shadow2 = render_text(lines[1], 120, COLOR_BLACK)
                 shadow_rect2 = shadow2.get_rect(center=(SCREEN_WIDTH // 2 + 4, SCREEN_HEIGHT // 2 + 44))
                 
-                self.screen.blit(shadow1, shadow_rect1)
-                self.screen.blit(shadow2, shadow_rect2)
-                self.screen.blit(text1, rect1)
-                self.screen.blit(text2, rect2)
+                dirty.append(self.ui_screen.blit(shadow1, shadow_rect1))
+                dirty.append(self.ui_screen.blit(shadow2, shadow_rect2))
+                dirty.append(self.ui_screen.blit(text1, rect1))
+                dirty.append(self.ui_screen.blit(text2, rect2))
             else:
-                text = font_huge.render(countdown_text, True, COLOR_GREEN)
+                text = render_text(countdown_text, 120, COLOR_GREEN)
                 text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
                 
-                shadow = font_huge.render(countdown_text, True, COLOR_BLACK)
+                shadow = render_text(countdown_text, 120, COLOR_BLACK)
                 shadow_rect = shadow.get_rect(center=(SCREEN_WIDTH // 2 + 4, SCREEN_HEIGHT // 2 + 4))
                 
-                self.screen.blit(shadow, shadow_rect)
-                self.screen.blit(text, text_rect)
+                dirty.append(self.ui_screen.blit(shadow, shadow_rect))
+                dirty.append(self.ui_screen.blit(text, text_rect))
+        
+        return dirty
     
     def render_pause_overlay(self):
-        """Renderiza overlay de pause"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(COLOR_BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        font_large = pygame.font.Font(None, 72)
-        font_small = pygame.font.Font(None, 36)
+        """Renderiza overlay de pause (montado uma única vez)"""
+        self.pause_layer.render(self.ui_screen, None)
+    
+    def _build_pause_overlay(self):
+        """Monta o overlay de pause"""
+        overlay = create_dim_surface(128)
         
-        pause_text = font_large.render("PAUSADO", True, COLOR_WHITE)
+        pause_text = render_text("PAUSADO", 72, COLOR_WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(pause_text, pause_rect)
+        overlay.blit(pause_text, pause_rect)
         
-        instruction_text = font_small.render("Pressione PAUSE para continuar", True, COLOR_GRAY)
+        instruction_text = render_text("Pressione PAUSE para continuar", 36, COLOR_GRAY)
         instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(instruction_text, instruction_rect)
+        overlay.blit(instruction_text, instruction_rect)
+        
+        return overlay
     
     def render_game_over_overlay(self):
-        """Renderiza overlay de game over"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(COLOR_BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        font_large = pygame.font.Font(None, 96)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        """Renderiza overlay de game over (remonta se setor/minérios mudarem)"""
+        key = (self.wave_manager.current_sector, self.player_minerals)
+        self.game_over_layer.render(self.ui_screen, key)
+    
+    def _build_game_over_overlay(self):
+        """Monta o overlay de game over"""
+        overlay = create_dim_surface(180)
         
-        game_over_text = font_large.render("GAME OVER", True, COLOR_RED)
+        game_over_text = render_text("GAME OVER", 96, COLOR_RED)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-        self.screen.blit(game_over_text, game_over_rect)
+        overlay.blit(game_over_text, game_over_rect)
         
-        stats_text = font_medium.render(
-            f"SETOR {self.wave_manager.current_sector}",
-            True,
-            COLOR_WHITE
-        )
+        stats_text = render_text(f"SETOR {self.wave_manager.current_sector}", 48, COLOR_WHITE)
         stats_rect = stats_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
-        self.screen.blit(stats_text, stats_rect)
+        overlay.blit(stats_text, stats_rect)
         
-        minerals_text = font_small.render(
-            f"MINERIOS: {self.player_minerals}",
-            True,
-            COLOR_YELLOW
-        )
+        minerals_text = render_text(f"MINERIOS: {self.player_minerals}", 36, COLOR_YELLOW)
         minerals_rect = minerals_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
-        self.screen.blit(minerals_text, minerals_rect)
+        overlay.blit(minerals_text, minerals_rect)
         
-        instruction_text = font_small.render("Pressione ESC para sair", True, COLOR_GRAY)
+        instruction_text = render_text("Pressione ESC para sair", 36, COLOR_GRAY)
         instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
-        self.screen.blit(instruction_text, instruction_rect)
\ No newline at end of file
+        overlay.blit(instruction_text, instruction_rect)
+        
+        return overlay
\ No newline at end of file
@@ -0,0 +1,345 @@
+"""
+Collectible Buffer - Minérios em structure-of-arrays (NumPy)
+"""
+
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+from src.utils.placeholder_generator import get_sprite
+from src.core.run_context import run_context
+
+
+# Margem abaixo da tela antes de desativar
+OFFSCREEN_MARGIN = 50
+
+# Queda e impulso lateral inicial
+FALL_SPEED = 50
+DRIFT_SPEED = 30
+
+# Vida: some aos 15s, pisca a partir dos 10s (alterna a cada 0.2s)
+LIFETIME = 15.0
+BLINK_TIME = 10.0
+BLINK_INTERVAL = 0.2
+
+# Ímã: velocidade com que os minérios no raio vão até o player (px/s)
+MAGNET_SPEED = 450
+
+
+class CollectibleHandle:
+    """
+    Visão de um slot do CollectibleBuffer
+    
+    Expõe o que o GameState usa de um minério (spawn, x, y, value,
+    active...). Cada slot tem um único handle reutilizado.
+    """
+    
+    __slots__ = ('buffer', 'index')
+    
+    def __init__(self, buffer, index):
+        self.buffer = buffer
+        self.index = index
+    
+    def spawn(self, x, y, value=10):
+        """
+        Ativa o minério
+        
+        Args:
+            x (float): Posição X
+            y (float): Posição Y
+            value (int): Valor em minérios
+        """
+        self.buffer.spawn(self.index, x, y, value)
+    
+    def deactivate(self):
+        """Desativa o minério (slot volta ao buffer no próximo update)"""
+        self.buffer.active[self.index] = False
+    
+    @property
+    def x(self):
+        return float(self.buffer.x[self.index])
+    
+    @property
+    def y(self):
+        return float(self.buffer.y[self.index])
+    
+    @property
+    def value(self):
+        return int(self.buffer.value[self.index])
+    
+    @property
+    def active(self):
+        return bool(self.buffer.active[self.index])
+    
+    @property
+    def time_alive(self):
+        return float(self.buffer.time_alive[self.index])
+
+
+class CollectibleBuffer:
+    """
+    Buffer de minérios em arrays contíguos
+    
+    Queda, ímã e coleta são operações vetorizadas sobre todos os
+    minérios. O piscar não tem timer próprio: é calculado de time_alive
+    na hora do render.
+    """
+    
+    def __init__(self, capacity=100):
+        """
+        Inicializa o buffer
+        
+        Args:
+            capacity (int): Quantidade inicial de slots (dobra se esgotar)
+        """
+        self.capacity = 0
+        
+        # Arrays (structure-of-arrays)
+        self.x = np.zeros(0, dtype=np.float64)
+        self.y = np.zeros(0, dtype=np.float64)
+        self.prev_x = np.zeros(0, dtype=np.float64)  # Posição no passo anterior
+        self.prev_y = np.zeros(0, dtype=np.float64)  # (interpolação do render)
+        self.vx = np.zeros(0, dtype=np.float64)
+        self.value = np.zeros(0, dtype=np.int32)
+        self.time_alive = np.zeros(0, dtype=np.float64)
+        self.active = np.zeros(0, dtype=bool)
+        self.used = np.zeros(0, dtype=bool)  # Slot entregue por get()
+        
+        # Slots livres (pilha) e handles (um por slot)
+        self.free = []
+        self.handles = []
+        self.used_count = 0
+        
+        # Sprite compartilhado por todos os minérios
+        self.sprite = get_sprite('collectible', 12)
+        self.half_size = self.sprite.get_width() // 2
+        
+        # RNG da run (impulso lateral, determinístico por seed)
+        self.rng = run_context.rng
+        
+        self._grow(max(1, capacity))
+    
+    def _grow(self, new_slots):
+        """
+        Aumenta a capacidade do buffer
+        
+        Args:
+            new_slots (int): Quantidade de slots a adicionar
+        """
+        old = self.capacity
+        new = old + new_slots
+        
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'vx', 'value', 'time_alive', 'active', 'used'):
+            array = getattr(self, name)
+            grown = np.zeros(new, dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        
+        self.handles.extend(CollectibleHandle(self, i) for i in range(old, new))
+        
+        # Pilha: menores índices saem primeiro
+        self.free = list(range(new - 1, old - 1, -1)) + self.free
+        self.capacity = new
+    
+    def get(self):
+        """
+        Pega um slot livre
+        
+        Returns:
+            CollectibleHandle: Handle do slot (inativo até spawn)
+        """
+        if not self.free:
+            # Buffer esgotado, dobrar capacidade
+            self._grow(self.capacity)
+        
+        index = self.free.pop()
+        self.used[index] = True
+        self.active[index] = False
+        self.used_count += 1
+        return self.handles[index]
+    
+    def spawn(self, index, x, y, value=10):
+        """
+        Ativa o minério de um slot
+        
+        Args:
+            index (int): Slot
+            x (float): Posição X
+            y (float): Posição Y
+            value (int): Valor em minérios
+        """
+        self.x[index] = x
+        self.y[index] = y
+        self.prev_x[index] = x
+        self.prev_y[index] = y
+        self.value[index] = value
+        self.time_alive[index] = 0
+        self.active[index] = True
+        
+        # Pequeno impulso aleatório
+        self.vx[index] = self.rng.randint(-DRIFT_SPEED, DRIFT_SPEED)
+    
+    def update_all(self, dt):
+        """
+        Move, envelhece e descarta todos os minérios de uma vez
+        
+        Args:
+            dt (float): Delta time em segundos
+        """
+        active = self.active
+        
+        # Queda lenta com o impulso lateral
+        np.add(self.x, self.vx * dt, out=self.x, where=active)
+        np.add(self.y, FALL_SPEED * dt, out=self.y, where=active)
+        np.add(self.time_alive, dt, out=self.time_alive, where=active)
+        
+        # Expirados ou abaixo da tela
+        expired = self.time_alive >= LIFETIME
+        expired |= self.y > SCREEN_HEIGHT + OFFSCREEN_MARGIN
+        active &= ~expired
+        
+        self._release()
+    
+    def attract(self, target_x, target_y, radius, dt):
+        """
+        Puxa para o alvo os minérios dentro do raio do ímã
+        
+        Cada minério anda até MAGNET_SPEED * dt na direção do alvo (sem
+        passar dele).
+        
+        Args:
+            target_x (float): X do alvo (player)
+            target_y (float): Y do alvo
+            radius (float): Raio do ímã (player.magnet_radius)
+            dt (float): Delta time em segundos
+        """
+        if radius <= 0:
+            return
+        
+        dx = target_x - self.x
+        dy = target_y - self.y
+        distance_sq = dx * dx + dy * dy
+        
+        pulled = np.flatnonzero(self.active & (distance_sq < radius * radius) & (distance_sq > 0))
+        if pulled.size == 0:
+            return
+        
+        distance = np.sqrt(distance_sq[pulled])
+        step = np.minimum(MAGNET_SPEED * dt, distance) / distance
+        self.x[pulled] += dx[pulled] * step
+        self.y[pulled] += dy[pulled] * step
+    
+    def collect(self, target_x, target_y, radius):
+        """
+        Coleta todos os minérios dentro do raio (uma redução mascarada)
+        
+        Args:
+            target_x (float): X do alvo (player)
+            target_y (float): Y do alvo
+            radius (float): Raio de coleta
+        
+        Returns:
+            int: Valor total coletado neste passo
+        """
+        dx = self.x - target_x
+        dy = self.y - target_y
+        collected = self.active & (dx * dx + dy * dy < radius * radius)
+        
+        total = int(self.value.sum(where=collected))
+        self.active &= ~collected
+        return total
+    
+    def _release(self):
+        """Slots em uso mas inativos voltam ao buffer"""
+        released = np.flatnonzero(self.used & ~self.active)
+        if released.size:
+            self.used[released] = False
+            self.free.extend(released[::-1].tolist())
+            self.used_count -= released.size
+    
+    def get_visible(self):
+        """
+        Máscara dos minérios desenhados (ativos e fora da fase apagada do piscar)
+        
+        Returns:
+            np.ndarray: bool por slot
+        """
+        blinking = self.time_alive >= BLINK_TIME
+        phase = ((self.time_alive - BLINK_TIME) // BLINK_INTERVAL).astype(np.int64)
+        return self.active & ~(blinking & (phase % 2 == 1))
+    
+    def capture_positions(self):
+        """Guarda as posições atuais como as do passo anterior (interpolação)"""
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+    
+    @property
+    def in_use(self):
+        """Handles dos slots em uso (ordem dos índices)"""
+        handles = self.handles
+        return [handles[i] for i in np.flatnonzero(self.used)]
+    
+    def render_all(self, screen, viewport=None, doreturn=True, overlays=None, alpha=1.0, step=None):
+        """
+        Renderiza os minérios visíveis com um único blits()
+        
+        Args:
+            screen: Pygame surface
+            viewport (pygame.Rect): Área visível (None = tela toda)
+            doreturn (bool): Coleta as áreas desenhadas (para dirty rects)
+            overlays (list): Não usado (minérios não têm overlay)
+            alpha (float): Fração entre o passo anterior e o atual
+            step (int): Passo de simulação atual (None = sem interpolação)
+        
+        Returns:
+            list: Áreas da tela desenhadas (vazia se doreturn=False)
+        """
+        if viewport is None:
+            viewport = screen.get_rect()
+        
+        indices = np.flatnonzero(self.get_visible())
+        if indices.size == 0:
+            return []
+        
+        x = self.x[indices]
+        y = self.y[indices]
+        if step is not None and alpha < 1.0:
+            prev_x = self.prev_x[indices]
+            prev_y = self.prev_y[indices]
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        left = (x - self.half_size).astype(np.int32)
+        top = (y - self.half_size).astype(np.int32)
+        
+        # Culling: descarta quem está fora do viewport
+        size = self.half_size * 2
+        visible = (
+            (left < viewport.right) & (left + size > viewport.left) &
+            (top < viewport.bottom) & (top + size > viewport.top)
+        )
+        if not visible.any():
+            return []
+        
+        sprite = self.sprite
+        return screen.blits(
+            [(sprite, (l, t)) for l, t in zip(left[visible].tolist(), top[visible].tolist())],
+            doreturn=doreturn
+        ) or []
+    
+    def get_active_count(self):
+        """Retorna quantidade de slots em uso"""
+        return self.used_count
+    
+    def get_available_count(self):
+        """Retorna quantidade de slots disponíveis"""
+        return len(self.free)
+    
+    def clear_all(self):
+        """Remove todos os minérios ativos"""
+        self.active[:] = False
+        self.used[:] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+        self.used_count = 0
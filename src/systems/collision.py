@@ -3,15 +3,25 @@ Collision System - Sistema de detecção de colisão
 """
 
 import math
+import numpy as np
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+from src.systems.spatial_grid import SpatialGrid
+from src.systems.projectile_buffer import ProjectileBuffer, OWNER_PLAYER, OWNER_ENEMY
+
 
 class CollisionSystem:
     """Sistema de detecção de colisões"""
     
+    # Grade de broadphase (reconstruída a cada frame com os inimigos ativos)
+    grid = SpatialGrid()
+    
+    # Máximo de pares avaliados por bloco no kernel vetorizado
+    chunk_pairs = 16384
+    
     @staticmethod
     def circle_collision(x1, y1, r1, x2, y2, r2):
         """
@@ -32,6 +42,113 @@ class CollisionSystem:
         # Colide se distância < soma dos raios
         return distance < (r1 + r2)
     
+    @staticmethod
+    def circle_hits(ax, ay, ar, bx, by, br, chunk_pairs=None):
+        """
+        Kernel vetorizado círculo-vs-círculo (distâncias ao quadrado)
+        
+        Testa todos os círculos A contra todos os círculos B, em blocos de
+        linhas para limitar a memória a ~chunk_pairs pares por vez.
+        
+        Args:
+            ax, ay, ar: Arrays com centros e raios dos círculos A (projéteis)
+            bx, by, br: Arrays com centros e raios dos círculos B (inimigos)
+            chunk_pairs (int): Máximo de pares por bloco (opcional)
+            
+        Returns:
+            tuple: (índices_a, índices_b) dos pares colidindo, ordenados
+                   por A e depois por B
+        """
+        ax = np.asarray(ax, dtype=np.float64)
+        ay = np.asarray(ay, dtype=np.float64)
+        ar = np.asarray(ar, dtype=np.float64)
+        bx = np.asarray(bx, dtype=np.float64)
+        by = np.asarray(by, dtype=np.float64)
+        br = np.asarray(br, dtype=np.float64)
+        
+        count_a = ax.size
+        count_b = bx.size
+        
+        if count_a == 0 or count_b == 0:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        
+        chunk_pairs = chunk_pairs or CollisionSystem.chunk_pairs
+        rows = max(1, chunk_pairs // count_b)
+        
+        hits_a = []
+        hits_b = []
+        
+        for start in range(0, count_a, rows):
+            end = min(start + rows, count_a)
+            
+            dx = bx[None, :] - ax[start:end, None]
+            dy = by[None, :] - ay[start:end, None]
+            radii = br[None, :] + ar[start:end, None]
+            
+            # Colide se distância² < (soma dos raios)²
+            hit = dx * dx + dy * dy < radii * radii
+            
+            # nonzero percorre em ordem de linha: A crescente, depois B
+            index_a, index_b = np.nonzero(hit)
+            if index_a.size:
+                hits_a.append(index_a + start)
+                hits_b.append(index_b)
+        
+        if not hits_a:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        
+        return np.concatenate(hits_a), np.concatenate(hits_b)
+    
+    @staticmethod
+    def resolve_pierce_hits(hits_a, hits_b, enemies, damages, max_hits):
+        """
+        Aplica os pares de colisão respeitando o PIERCE
+        
+        Percorre os pares na mesma ordem do loop antigo (projétil por
+        projétil, inimigos na ordem da lista). Inimigos mortos por um
+        projétil anterior são ignorados e cada projétil para após
+        max_hits acertos.
+        
+        Args:
+            hits_a: Índices dos projéteis (saída de circle_hits)
+            hits_b: Índices dos inimigos (saída de circle_hits)
+            enemies (list): Inimigos indexados por hits_b
+            damages: Dano de cada projétil indexado por hits_a
+            max_hits (int): 1 + player.pierce
+            
+        Returns:
+            tuple: (acertos, lista de projéteis que atingiram o máximo)
+        """
+        hits = 0
+        destroyed = []
+        
+        current = -1
+        hits_this_frame = 0
+        
+        for proj, enemy_index in zip(hits_a.tolist(), hits_b.tolist()):
+            if proj != current:
+                current = proj
+                hits_this_frame = 0
+            elif hits_this_frame >= max_hits:
+                continue  # Projétil já destruído
+            
+            enemy = enemies[enemy_index]
+            if not enemy.active or not enemy.alive:
+                continue
+            
+            # Inimigo toma dano
+            enemy.take_damage(float(damages[proj]))
+            hits += 1
+            hits_this_frame += 1
+            
+            # Se atingiu máximo, destruir projétil
+            if hits_this_frame >= max_hits:
+                destroyed.append(proj)
+        
+        return hits, destroyed
+    
     @staticmethod
     def rect_collision(rect1, rect2):
         """
@@ -120,6 +237,30 @@ class CollisionSystem:
             player.x, player.y, player.hitbox_radius
         )
     
+    @staticmethod
+    def build_enemy_grid(enemies):
+        """
+        Reconstrói a grade de broadphase com os inimigos vivos
+        
+        O tamanho da célula acompanha o maior hitbox presente (diâmetro),
+        então cada consulta cobre no máximo algumas células vizinhas.
+        
+        Args:
+            enemies: Lista de inimigos
+            
+        Returns:
+            int: Maior raio de hitbox entre os inimigos inseridos
+        """
+        candidates = [e for e in enemies if e.active and e.alive]
+        
+        max_radius = 0
+        for enemy in candidates:
+            if enemy.hitbox_radius > max_radius:
+                max_radius = enemy.hitbox_radius
+        
+        CollisionSystem.grid.rebuild(candidates, cell_size=max(16, max_radius * 2))
+        return max_radius
+    
     @staticmethod
     def process_collisions(player, enemies, projectiles):
         """
@@ -128,7 +269,7 @@ class CollisionSystem:
         Args:
             player: Objeto Player
             enemies: Lista de inimigos
-            projectiles: ObjectPool de projéteis
+            projectiles: ObjectPool ou ProjectileBuffer de projéteis
             
         Returns:
             dict: Estatísticas de colisões
@@ -150,20 +291,45 @@ class CollisionSystem:
                 enemy.take_damage(9999)
                 stats['enemies_hit'] += 1
         
-        # 2. Projéteis do Player vs Inimigos
-        # ✅ NOVO: Implementar PIERCE corretamente
-        for projectile in projectiles.in_use[:]:
-            if not projectile.active or projectile.owner != 'player':
+        # Projéteis em arrays: kernel vetorizado
+        if isinstance(projectiles, ProjectileBuffer):
+            CollisionSystem._process_projectile_buffer(player, enemies, projectiles, stats)
+            return stats
+        
+        # Broadphase: spatial hash dos inimigos vivos
+        max_enemy_radius = CollisionSystem.build_enemy_grid(enemies)
+        grid = CollisionSystem.grid
+        max_hits = 1 + player.pierce  # 1 hit base + pierce adicional
+        
+        # 2 + 3. Uma única passada pelos projéteis
+        # (projéteis do player só afetam inimigos e os de inimigos só o player,
+        # então juntar as duas passadas não muda o resultado)
+        for projectile in projectiles.in_use:
+            if not projectile.active:
+                continue
+            
+            # Projéteis de Inimigos vs Player
+            if projectile.owner != 'player':
+                if CollisionSystem.check_projectile_player_collision(projectile, player):
+                    # Player toma dano
+                    player.take_damage(projectile.damage)
+                    stats['player_hit'] = True
+                    
+                    # Projétil é destruído
+                    projectile.deactivate()
                 continue
             
-            # Contador de hits deste projétil neste frame
+            if grid.count == 0:
+                continue
+            
+            # Projéteis do Player vs Inimigos (apenas células vizinhas)
+            proj_radius = max(projectile.width, projectile.height) // 2
+            nearby = grid.query(projectile.x, projectile.y, proj_radius + max_enemy_radius)
+            
+            # Contador de hits deste projétil neste frame (PIERCE)
             hits_this_frame = 0
-            max_hits = 1 + player.pierce  # 1 hit base + pierce adicional
             
-            for enemy in enemies:
-                if hits_this_frame >= max_hits:
-                    break  # Já atingiu o máximo
-                
+            for enemy in nearby:
                 if CollisionSystem.check_projectile_enemy_collision(projectile, enemy):
                     # Inimigo toma dano
                     enemy.take_damage(projectile.damage)
@@ -176,17 +342,71 @@ class CollisionSystem:
                         stats['projectiles_destroyed'] += 1
                         break
         
-        # 3. Projéteis de Inimigos vs Player
-        for projectile in projectiles.in_use[:]:
-            if not projectile.active:
-                continue
+        return stats
+    
+    @staticmethod
+    def _process_projectile_buffer(player, enemies, buffer, stats):
+        """
+        Projéteis vs inimigos/player usando os arrays do ProjectileBuffer
+        
+        Args:
+            player: Objeto Player
+            enemies: Lista de inimigos
+            buffer: ProjectileBuffer
+            stats (dict): Estatísticas (atualizado no lugar)
+        """
+        active = buffer.active
+        
+        # Projéteis do Player vs Inimigos
+        live = [e for e in enemies if e.active and e.alive]
+        shots = np.flatnonzero(active & (buffer.owner == OWNER_PLAYER))
+        
+        if live and shots.size:
+            count = len(live)
+            ex = np.fromiter((e.x for e in live), dtype=np.float64, count=count)
+            ey = np.fromiter((e.y for e in live), dtype=np.float64, count=count)
+            er = np.fromiter((e.hitbox_radius for e in live), dtype=np.float64, count=count)
             
-            if CollisionSystem.check_projectile_player_collision(projectile, player):
-                # Player toma dano
-                player.take_damage(projectile.damage)
-                stats['player_hit'] = True
+            radii = np.maximum(buffer.width[shots], buffer.height[shots]) // 2
+            
+            hits_a, hits_b = CollisionSystem.circle_hits(
+                buffer.x[shots], buffer.y[shots], radii,
+                ex, ey, er
+            )
+            
+            if hits_a.size:
+                hits, destroyed = CollisionSystem.resolve_pierce_hits(
+                    hits_a, hits_b, live,
+                    buffer.damage[shots],
+                    1 + player.pierce
+                )
+                stats['enemies_hit'] += hits
                 
-                # Projétil é destruído
-                projectile.deactivate()
+                if destroyed:
+                    active[shots[destroyed]] = False
+                    stats['projectiles_destroyed'] += len(destroyed)
+        
+        # Projéteis de Inimigos vs Player
+        if not player.alive:
+            return
         
-        return stats
\ No newline at end of file
+        shots = np.flatnonzero(active & (buffer.owner == OWNER_ENEMY))
+        if shots.size == 0:
+            return
+        
+        radii = np.maximum(buffer.width[shots], buffer.height[shots]) // 2
+        hits_a, _ = CollisionSystem.circle_hits(
+            buffer.x[shots], buffer.y[shots], radii,
+            (player.x,), (player.y,), (player.hitbox_radius,)
+        )
+        
+        for proj in hits_a.tolist():
+            if not player.alive:
+                break
+            
+            # Player toma dano
+            player.take_damage(float(buffer.damage[shots[proj]]))
+            stats['player_hit'] = True
+            
+            # Projétil é destruído
+            active[shots[proj]] = False
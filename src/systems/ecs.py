@@ -0,0 +1,535 @@
+"""
+ECS - Mundo de entidades com componentes em tabelas de arrays (NumPy)
+"""
+
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+
+
+# Componentes: nome -> campos (nome do campo, tipo). Os nomes dos campos
+# são únicos entre componentes (viram atributos das fachadas).
+COMPONENTS = {
+    'Transform': (('x', float), ('y', float)),
+    'Velocity': (('vx', float), ('vy', float)),
+    'Health': (('hp', float), ('max_hp', int), ('alive', bool)),
+    'Hitbox': (('hitbox_radius', int),),
+    'Shooter': (('fire_rate', float), ('fire_timer', float)),
+    'Spawner': (('spawn_rate', float), ('spawn_timer', float), ('child_count', int)),
+    'Orbit': (('orbit_parent', int), ('orbit_angle', float), ('orbit_radius', float), ('orbit_speed', float)),
+    'Brain': (('ai_level', int), ('speed', float)),
+    # Tipo do inimigo (agrupa os kernels de IA; só o Range tem estado)
+    'Kamikaze': (),
+    'Range': (('phase', int), ('stopped_timer', float), ('can_shoot', bool)),
+    'Mother': (),
+}
+
+FIELD_TYPES = {field: kind for fields in COMPONENTS.values() for field, kind in fields}
+
+DTYPES = {float: np.float64, int: np.int64, bool: np.bool_}
+
+# Margem fora da tela antes de desativar (mesma do Enemy)
+OFFSCREEN_MARGIN = 50
+
+
+class Archetype:
+    """
+    Tabela de todas as entidades com o mesmo conjunto de componentes
+    
+    Cada campo é um array NumPy; as linhas [0:count] são as entidades
+    vivas, sem buracos (remoção troca a linha pela última).
+    """
+    
+    def __init__(self, components, capacity=64):
+        """
+        Inicializa a tabela
+        
+        Args:
+            components (frozenset): Nomes dos componentes
+            capacity (int): Linhas pré-alocadas (cresce se precisar)
+        """
+        self.components = components
+        self.fields = [field for name in sorted(components) for field, _ in COMPONENTS[name]]
+        self.columns = {
+            field: np.zeros(capacity, dtype=DTYPES[FIELD_TYPES[field]])
+            for field in self.fields
+        }
+        self.entities = np.zeros(capacity, dtype=np.int64)
+        self.objects = [None] * capacity  # Fachada de cada linha (ou None)
+        self.count = 0
+    
+    def _grow(self):
+        """Dobra a capacidade da tabela"""
+        capacity = len(self.entities) * 2
+        for field, column in self.columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[field] = grown
+        
+        entities = np.zeros(capacity, dtype=np.int64)
+        entities[:self.count] = self.entities[:self.count]
+        self.entities = entities
+        self.objects.extend([None] * (capacity - len(self.objects)))
+    
+    def append(self, entity, obj, values):
+        """
+        Adiciona uma linha
+        
+        Args:
+            entity (int): Id da entidade
+            obj: Fachada da entidade (ou None)
+            values (dict): Valores iniciais dos campos (faltando = 0)
+        
+        Returns:
+            int: Linha ocupada
+        """
+        if self.count >= len(self.entities):
+            self._grow()
+        
+        row = self.count
+        for field, column in self.columns.items():
+            column[row] = values.get(field, 0)
+        self.entities[row] = entity
+        self.objects[row] = obj
+        self.count += 1
+        return row
+    
+    def read(self, row):
+        """Valores de uma linha (tipos Python)"""
+        return {
+            field: FIELD_TYPES[field](column[row])
+            for field, column in self.columns.items()
+        }
+    
+    def remove(self, row):
+        """
+        Remove uma linha (a última ocupa o lugar)
+        
+        Returns:
+            object: Fachada que mudou de linha (None se nenhuma)
+        """
+        last = self.count - 1
+        moved = None
+        
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            self.entities[row] = self.entities[last]
+            moved = self.objects[last]
+            self.objects[row] = moved
+        
+        self.objects[last] = None
+        self.count = last
+        return moved
+
+
+class ComponentField:
+    """
+    Atributo de uma fachada guardado na tabela do world
+    
+    Enquanto a entidade existe, o valor mora na coluna da sua tabela;
+    fora do world (objeto no pool) ou se o componente não está na tabela,
+    fica no dict detached da fachada. Assim o código antigo (x, hp,
+    fire_timer...) continua lendo e escrevendo atributos normais.
+    """
+    
+    __slots__ = ('field', 'cast')
+    
+    def __init__(self, field):
+        self.field = field
+        self.cast = FIELD_TYPES[field]
+    
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        
+        table = obj.table
+        if table is not None:
+            column = table.columns.get(self.field)
+            if column is not None:
+                return self.cast(column[obj.row])
+        return obj.detached.get(self.field, 0)
+    
+    def __set__(self, obj, value):
+        table = obj.table
+        if table is not None:
+            column = table.columns.get(self.field)
+            if column is not None:
+                column[obj.row] = value
+                return
+        obj.detached[self.field] = value
+
+
+class World:
+    """
+    Entidades e sistemas de uma run
+    
+    Uma entidade é uma linha na tabela (Archetype) do seu conjunto de
+    componentes. Os sistemas rodam uma vez por frame sobre todas as
+    tabelas que têm os componentes que eles usam, com operações NumPy
+    sobre as colunas inteiras em vez de um update por objeto.
+    
+    As fachadas (Enemy e subclasses) guardam table/row/entity e expõem
+    os campos como atributos via ComponentField.
+    """
+    
+    def __init__(self):
+        """Inicializa o world vazio"""
+        self.archetypes = {}  # frozenset(componentes) -> Archetype
+        self.queries = {}  # (componentes, excluídos) -> Archetypes compatíveis
+        self.objects = {}  # entity -> fachada
+        self.next_entity = 1
+        
+        # Ordem dos sistemas em update()
+        self.systems = [movement_system, orbit_system, cooldown_system]
+        
+        # Chamados quando uma entidade perde o componente (destroy ou remove)
+        self.on_remove = {'Orbit': release_orbit}
+    
+    def clear(self):
+        """Remove todas as entidades (nova run)"""
+        for obj in list(self.objects.values()):
+            self.destroy(obj)
+        self.archetypes.clear()
+        self.queries.clear()
+        self.next_entity = 1
+    
+    def get_archetype(self, components):
+        """Tabela de um conjunto de componentes (cria se não existe)"""
+        key = frozenset(components)
+        table = self.archetypes.get(key)
+        if table is None:
+            table = Archetype(key)
+            self.archetypes[key] = table
+            self.queries.clear()
+        return table
+    
+    def create(self, obj, components):
+        """
+        Cria a entidade de uma fachada
+        
+        Os valores iniciais vêm do dict detached da fachada.
+        
+        Args:
+            obj: Fachada (precisa de table, row, entity e detached)
+            components (iterable): Nomes dos componentes
+        
+        Returns:
+            int: Id da entidade
+        """
+        if obj.table is not None:
+            self.destroy(obj)
+        
+        entity = self.next_entity
+        self.next_entity += 1
+        
+        table = self.get_archetype(components)
+        obj.row = table.append(entity, obj, obj.detached)
+        obj.table = table
+        obj.entity = entity
+        self.objects[entity] = obj
+        return entity
+    
+    def destroy(self, obj):
+        """
+        Remove a entidade de uma fachada (valores voltam para detached)
+        
+        Args:
+            obj: Fachada
+        """
+        table = obj.table
+        if table is None:
+            return
+        
+        obj.detached.update(table.read(obj.row))
+        self._notify_remove(table, obj.row, table.components)
+        self._remove_row(table, obj.row)
+        del self.objects[obj.entity]
+        obj.table = None
+        obj.row = -1
+        obj.entity = None
+    
+    def _notify_remove(self, table, row, components):
+        """Chama os hooks on_remove dos componentes que a linha está perdendo"""
+        for component in components:
+            hook = self.on_remove.get(component)
+            if hook is not None:
+                hook(self, table, row)
+    
+    def _remove_row(self, table, row):
+        """Remove uma linha e corrige a linha da fachada que foi movida"""
+        moved = table.remove(row)
+        if moved is not None:
+            moved.row = row
+    
+    def _migrate(self, obj, components, values=None):
+        """Move a entidade para a tabela de outro conjunto de componentes"""
+        old = obj.table
+        current = old.read(obj.row)
+        if values:
+            current.update(values)
+        values = current
+        
+        table = self.get_archetype(components)
+        self._notify_remove(old, obj.row, old.components - table.components)
+        row = table.append(obj.entity, obj, values)
+        self._remove_row(old, obj.row)
+        obj.table = table
+        obj.row = row
+    
+    def add_component(self, obj, component, **values):
+        """
+        Adiciona um componente a uma entidade existente
+        
+        Args:
+            obj: Fachada (já no world)
+            component (str): Nome do componente
+            **values: Valores dos campos do componente
+        """
+        if component in obj.table.components:
+            for field, value in values.items():
+                obj.table.columns[field][obj.row] = value
+            return
+        self._migrate(obj, obj.table.components | {component}, values)
+    
+    def remove_component(self, obj, component):
+        """
+        Remove um componente de uma entidade existente
+        
+        Args:
+            obj: Fachada (já no world)
+            component (str): Nome do componente
+        """
+        if obj.table is None or component not in obj.table.components:
+            return
+        self._migrate(obj, obj.table.components - {component})
+    
+    def has(self, obj, component):
+        """True se a fachada está no world com o componente"""
+        return obj.table is not None and component in obj.table.components
+    
+    def get(self, entity):
+        """Fachada de uma entidade (None se não existe mais)"""
+        return self.objects.get(entity)
+    
+    def query(self, *components, exclude=()):
+        """
+        Tabelas não vazias com todos os componentes pedidos
+        
+        Args:
+            *components: Componentes obrigatórios
+            exclude (tuple): Componentes que a tabela não pode ter
+        
+        Returns:
+            list: Archetypes
+        """
+        key = (components, exclude)
+        tables = self.queries.get(key)
+        if tables is None:
+            required = set(components)
+            tables = [
+                table for table in self.archetypes.values()
+                if required <= table.components and not table.components.intersection(exclude)
+            ]
+            self.queries[key] = tables
+        
+        return [table for table in tables if table.count]
+    
+    def query_objects(self, *components, exclude=()):
+        """
+        Fachadas das entidades com os componentes pedidos
+        
+        Returns:
+            list: Fachadas (cópia: pode ser alterada durante o loop)
+        """
+        result = []
+        for table in self.query(*components, exclude=exclude):
+            result.extend(table.objects[:table.count])
+        return result
+    
+    def count(self, *components):
+        """Número de entidades com os componentes pedidos"""
+        return sum(table.count for table in self.query(*components))
+    
+    def update(self, dt):
+        """
+        Roda todos os sistemas (uma vez cada)
+        
+        Args:
+            dt (float): Delta time
+        """
+        for system in self.systems:
+            system(self, dt)
+
+
+def _offscreen(x, y):
+    """Máscara de quem saiu da tela (abaixo, ou pelos lados)"""
+    return (
+        (y > SCREEN_HEIGHT + OFFSCREEN_MARGIN) |
+        (x < -OFFSCREEN_MARGIN) |
+        (x > SCREEN_WIDTH + OFFSCREEN_MARGIN)
+    )
+
+
+def movement_system(world, dt):
+    """
+    Transform += Velocity * dt para todas as entidades vivas
+    
+    Entidades em órbita ficam de fora (a posição delas é do orbit_system).
+    
+    Quem sai da tela (abaixo, ou pelos lados) é desativado pela própria
+    fachada depois do passo, para o dono do pool ser avisado.
+    
+    Args:
+        world (World): Mundo
+        dt (float): Delta time
+    """
+    leaving = []
+    
+    for table in world.query('Transform', 'Velocity', exclude=('Orbit',)):
+        n = table.count
+        columns = table.columns
+        x = columns['x'][:n]
+        y = columns['y'][:n]
+        alive = columns['alive'][:n] if 'alive' in columns else np.ones(n, dtype=bool)
+        
+        np.add(x, columns['vx'][:n] * dt, out=x, where=alive)
+        np.add(y, columns['vy'][:n] * dt, out=y, where=alive)
+        
+        for row in np.flatnonzero(alive & _offscreen(x, y)):
+            leaving.append(table.objects[row])
+    
+    for obj in leaving:
+        obj.deactivate()
+
+
+def orbit_system(world, dt):
+    """
+    Posiciona todas as entidades com Orbit ao redor dos pais (vetorizado)
+    
+    Os pais são as entidades com Spawner. As posições deles são juntadas
+    em arrays e cada filho encontra a linha do seu pai por busca binária
+    no id (searchsorted), então não há loop por filho nem por mãe. Se o
+    pai não existe mais, o filho perde o componente Orbit e volta para o
+    movement_system. Filhos que saem da tela são desativados.
+    
+    Args:
+        world (World): Mundo
+        dt (float): Delta time
+    """
+    tables = world.query('Transform', 'Orbit')
+    if not tables:
+        return
+    
+    # Pais: ids ordenados e posições na mesma ordem
+    parents = world.query('Transform', 'Spawner')
+    if parents:
+        entities = np.concatenate([table.entities[:table.count] for table in parents])
+        order = np.argsort(entities)
+        entities = entities[order]
+        parent_x = np.concatenate([table.columns['x'][:table.count] for table in parents])[order]
+        parent_y = np.concatenate([table.columns['y'][:table.count] for table in parents])[order]
+        parent_alive = np.concatenate([table.columns['alive'][:table.count] for table in parents])[order]
+    
+    released = []
+    leaving = []
+    
+    for table in tables:
+        n = table.count
+        columns = table.columns
+        parent = columns['orbit_parent'][:n]
+        
+        if parents:
+            index = np.minimum(np.searchsorted(entities, parent), len(entities) - 1)
+            found = entities[index] == parent
+        else:
+            index = np.zeros(n, dtype=np.intp)
+            found = np.zeros(n, dtype=bool)
+        
+        for row in np.flatnonzero(~found):
+            released.append(table.objects[row])
+        
+        # Só filhos vivos de pais vivos giram
+        alive = found & columns['alive'][:n]
+        if parents:
+            alive &= parent_alive[index]
+        if not alive.any():
+            continue
+        
+        angle = columns['orbit_angle'][:n]
+        np.add(angle, columns['orbit_speed'][:n] * dt, out=angle, where=alive)
+        np.subtract(angle, 360, out=angle, where=alive & (angle >= 360))
+        
+        radians = np.radians(angle[alive])
+        radius = columns['orbit_radius'][:n][alive]
+        x = columns['x'][:n]
+        y = columns['y'][:n]
+        x[alive] = parent_x[index[alive]] + np.cos(radians) * radius
+        y[alive] = parent_y[index[alive]] + np.sin(radians) * radius
+        
+        for row in np.flatnonzero(alive & _offscreen(x, y)):
+            leaving.append(table.objects[row])
+    
+    for obj in released:
+        world.remove_component(obj, 'Orbit')
+    for obj in leaving:
+        obj.deactivate()
+
+
+def release_orbit(world, table, row):
+    """
+    Hook on_remove do Orbit: o pai tem um filho a menos (O(1))
+    
+    Args:
+        world (World): Mundo
+        table (Archetype): Tabela do filho
+        row (int): Linha do filho
+    """
+    parent = world.get(int(table.columns['orbit_parent'][row]))
+    if parent is not None:
+        parent.child_count -= 1
+
+
+def orbit_children(world, parent_entity):
+    """
+    Fachadas em órbita de uma entidade
+    
+    Args:
+        world (World): Mundo
+        parent_entity (int): Id do pai
+    
+    Returns:
+        list: Fachadas dos filhos
+    """
+    children = []
+    for table in world.query('Orbit'):
+        rows = np.flatnonzero(table.columns['orbit_parent'][:table.count] == parent_entity)
+        children.extend(table.objects[row] for row in rows)
+    return children
+
+
+def cooldown_system(world, dt):
+    """
+    Timers de tiro (Shooter) e de spawn (Spawner) das entidades vivas
+    
+    fire_timer para em 0; spawn_timer só desconta enquanto é positivo.
+    
+    Args:
+        world (World): Mundo
+        dt (float): Delta time
+    """
+    for table in world.query('Shooter', 'Health'):
+        n = table.count
+        timer = table.columns['fire_timer'][:n]
+        alive = table.columns['alive'][:n]
+        timer[:] = np.where(alive, np.where(timer > 0, timer - dt, 0.0), timer)
+    
+    for table in world.query('Spawner', 'Health'):
+        n = table.count
+        timer = table.columns['spawn_timer'][:n]
+        ticking = table.columns['alive'][:n] & (timer > 0)
+        np.subtract(timer, dt, out=timer, where=ticking)
@@ -0,0 +1,145 @@
+"""
+Enemy AI - Kernels de movimento dos inimigos em lote (NumPy)
+"""
+
+import math
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+
+
+# Fases do Range (guardadas como int na coluna 'phase')
+PHASE_DESCENDING = 0
+PHASE_STOPPED = 1
+PHASE_LEAVING = 2
+
+RANGE_STOP_Y = SCREEN_HEIGHT * 0.3  # Para em 30% da tela
+RANGE_STOPPED_DURATION = 8.0  # Fica parado por 8 segundos
+
+# Kamikaze por ai_level (0, 1, 2+): deadzone em px e fração da velocidade
+# usada na correção lateral (0 = MUITO LEVE, 1 = suave, 2+ = com zigzag)
+KAMIKAZE_DEADZONE = np.array([20.0, 10.0, 10.0])
+KAMIKAZE_TRACKING = np.array([0.1, 0.3, 0.4])
+ZIGZAG_FREQUENCY = 3.0
+ZIGZAG_AMPLITUDE = 50
+
+
+def enemy_ai_system(world, dt, player_pos, ticks):
+    """
+    Define vx/vy de todos os inimigos vivos (roda antes do world.update)
+    
+    Cada tipo é dividido em grupos (ai_level para o Kamikaze, fase para
+    o Range) e todos os grupos de uma tabela são calculados de uma vez
+    com máscaras NumPy, então o custo quase não cresce com o número de
+    inimigos. Só as trocas de fase do Range têm trabalho por objeto.
+    
+    Args:
+        world (World): Mundo
+        dt (float): Delta time
+        player_pos (tuple): Posição do player (x, y) ou None
+        ticks (int): Tempo da simulação em ms (patrulhas)
+    """
+    for table in world.query('Kamikaze', 'Brain'):
+        _kamikaze_kernel(table, dt, player_pos)
+    
+    for table in world.query('Range', 'Brain'):
+        _range_kernel(table, dt, ticks)
+    
+    patrol = math.sin(ticks * 0.001) * 25
+    for table in world.query('Mother', 'Brain'):
+        n = table.count
+        columns = table.columns
+        alive = columns['alive'][:n]
+        
+        # Sempre desce (como Kamikaze mas mais lento) com patrol lateral
+        columns['vy'][:n][alive] = columns['speed'][:n][alive]
+        columns['vx'][:n][alive] = patrol
+
+
+def _kamikaze_kernel(table, dt, player_pos):
+    """Kamikazes: desce na velocidade cheia, corrige o X conforme o ai_level"""
+    n = table.count
+    columns = table.columns
+    alive = columns['alive'][:n]
+    level = np.minimum(columns['ai_level'][:n], 2)
+    speed = columns['speed'][:n]
+    x = columns['x'][:n]
+    vx = columns['vx'][:n]
+    vy = columns['vy'][:n]
+    
+    if player_pos is None:
+        # Sem player só o nível 0 se mexe (desce reto)
+        still = alive & (level == 0)
+        vy[still] = speed[still]
+        vx[still] = 0
+        return
+    
+    # Parâmetros de cada linha vêm da tabela do seu nível (um grupo por nível)
+    player_x = player_pos[0]
+    direction = np.where(x < player_x, 1.0, -1.0)
+    tracking = direction * speed * KAMIKAZE_TRACKING[level]
+    outside = np.abs(x - player_x) > KAMIKAZE_DEADZONE[level]
+    
+    # Nível 2+: zigzag usando Y como "tempo"
+    zigzag = np.where(
+        level == 2,
+        np.sin(columns['y'][:n] * ZIGZAG_FREQUENCY * 0.01) * ZIGZAG_AMPLITUDE * dt,
+        0.0
+    )
+    
+    vy[:] = np.where(alive, speed, vy)
+    vx[:] = np.where(alive, np.where(outside, tracking + zigzag, zigzag), vx)
+
+
+def _range_kernel(table, dt, ticks):
+    """Ranges: máquina de fases (descendo → parado → saindo) em lote"""
+    n = table.count
+    columns = table.columns
+    alive = columns['alive'][:n]
+    phase = columns['phase'][:n]
+    vx = columns['vx'][:n]
+    vy = columns['vy'][:n]
+    can_shoot = columns['can_shoot'][:n]
+    fire_rate = columns['fire_rate'][:n]
+    stopped_timer = columns['stopped_timer'][:n]
+    high = columns['ai_level'][:n] >= 2
+    
+    # Grupos fechados antes das transições (quem troca de fase neste
+    # passo só roda a fase nova no próximo)
+    descending = alive & (phase == PHASE_DESCENDING)
+    stopped = alive & (phase == PHASE_STOPPED)
+    leaving = alive & (phase == PHASE_LEAVING)
+    moving = descending | leaving
+    
+    # Descendo/saindo: desce reto; parado: patrol lateral
+    vy[:] = np.where(moving, columns['speed'][:n], np.where(stopped, 0.0, vy))
+    vx[:] = np.where(moving, 0.0, np.where(stopped, math.sin(ticks * 0.002) * 40, vx))
+    
+    # AI 2+ atira em movimento (bem menos frequente); parado sempre atira
+    can_shoot[:] = np.where(moving, high, can_shoot | stopped)
+    fire_rate[:] = np.where(
+        stopped, 2.0,
+        np.where(leaving & high, 5.0,
+                 np.where(descending & high & (columns['fire_timer'][:n] <= 0), 4.0, fire_rate))
+    )
+    np.add(stopped_timer, dt, out=stopped_timer, where=stopped)
+    
+    # Transições (poucas por passo: o único trabalho por objeto)
+    arrived = descending & (columns['y'][:n] >= RANGE_STOP_Y)
+    if arrived.any():
+        phase[arrived] = PHASE_STOPPED
+        stopped_timer[arrived] = 0
+        can_shoot[arrived] = True
+        fire_rate[arrived] = 2.0
+        for row in np.flatnonzero(arrived):
+            print(f"Range {id(table.objects[row])} PAROU em Y={columns['y'][row]:.0f}")
+    
+    finished = stopped & (stopped_timer >= RANGE_STOPPED_DURATION)
+    if finished.any():
+        phase[finished] = PHASE_LEAVING
+        for row in np.flatnonzero(finished):
+            print(f"Range {id(table.objects[row])} voltou a DESCER")
@@ -4,59 +4,247 @@ Object Pool - Sistema de pooling de objetos para otimização
 
 import sys
 import os
+from collections import deque
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 
+# Políticas de crescimento quando o pool esgota
+GROWTH_FIXED = 'fixed'              # Não cresce: get() levanta PoolExhausted
+GROWTH_DOUBLE = 'double'            # Dobra a quantidade de objetos
+GROWTH_DROP_OLDEST = 'drop_oldest'  # Recicla o objeto em uso mais antigo
+
+GROWTH_POLICIES = (GROWTH_FIXED, GROWTH_DOUBLE, GROWTH_DROP_OLDEST)
+
+
+class PoolExhausted(RuntimeError):
+    """Pool com política 'fixed' sem objetos disponíveis"""
+
+
+def render_batch(screen, objects, viewport=None, doreturn=True, overlays=None, alpha=1.0, step=None):
+    """
+    Desenha vários objetos com um único screen.blits()
+    
+    Objetos com get_blit() entram no lote: os que estão fora do viewport
+    são descartados e o resto é ordenado por sprite (mesma superfície em
+    sequência). Depois vêm os render_overlay() dos visíveis (hitbox,
+    brilho...), ou eles são adiados para a lista overlays quando o mundo
+    é desenhado em resolução reduzida. Objetos sem get_blit() usam o
+    render() de sempre.
+    
+    Com step, objetos cuja posição anterior foi guardada nesse passo
+    (prev_step/prev_pos, ver GameState.capture_positions) são desenhados
+    entre a posição anterior e a atual, na fração alpha.
+    
+    Args:
+        screen: Pygame surface
+        objects: Objetos a desenhar (inativos são ignorados)
+        viewport (pygame.Rect): Área visível (None = tela toda)
+        doreturn (bool): Coleta as áreas desenhadas (só o modo dirty usa)
+        overlays (list): Recebe os objetos com render_overlay() em vez de
+            desenhá-los agora (None = desenha na hora)
+        alpha (float): Fração entre o passo anterior e o atual (0-1)
+        step (int): Passo de simulação atual (None = sem interpolação)
+    
+    Returns:
+        list: Áreas da tela desenhadas (vazia se doreturn=False)
+    """
+    interpolate = step is not None and alpha < 1.0
+    
+    if viewport is None:
+        viewport = screen.get_rect()
+    
+    batch = []
+    visible = []
+    dirty = []
+    
+    for obj in objects:
+        if not getattr(obj, 'active', True):
+            continue
+        
+        get_blit = getattr(obj, 'get_blit', None)
+        if get_blit is None:
+            rect = obj.render(screen)
+            if rect and doreturn:
+                dirty.append(rect)
+            continue
+        
+        item = get_blit()
+        if item is None:
+            continue
+        
+        # Área real do blit (o sprite pode ser maior que o rect da entidade)
+        sprite, rect = item
+        x, y = rect.topleft
+        if interpolate and getattr(obj, 'prev_step', None) == step:
+            prev_x, prev_y = obj.prev_pos
+            x = round(prev_x + (x - prev_x) * alpha)
+            y = round(prev_y + (y - prev_y) * alpha)
+        area = sprite.get_rect(topleft=(x, y))
+        if not viewport.colliderect(area):
+            continue
+        
+        batch.append((sprite, area))
+        visible.append(obj)
+    
+    if batch:
+        batch.sort(key=lambda item: id(item[0]))
+        screen.blits(batch, doreturn=False)
+        if doreturn:
+            dirty.extend(area.clip(viewport) for _, area in batch)
+        
+        if overlays is not None:
+            overlays.extend(obj for obj in visible if hasattr(obj, 'render_overlay'))
+            return dirty
+        
+        for obj in visible:
+            render_overlay = getattr(obj, 'render_overlay', None)
+            if render_overlay is not None:
+                rect = render_overlay(screen)
+                if rect and doreturn:
+                    dirty.append(rect)
+    
+    return dirty
+
+
 class ObjectPool:
-    """Pool genérico de objetos"""
+    """
+    Pool genérico de objetos
+    
+    Cada objeto guarda seu índice em in_use (pool_index), então devolver
+    ao pool é O(1): o último objeto em uso ocupa o lugar do que saiu.
     
-    def __init__(self, object_class, initial_size=50):
+    get() sempre retorna um objeto. Esgotado, o pool dobra ('double'),
+    recicla o objeto em uso mais antigo ('drop_oldest', chamando o
+    deactivate() dele) ou levanta PoolExhausted ('fixed').
+    """
+    
+    def __init__(self, object_class, initial_size=50, growth=GROWTH_DOUBLE):
         """
         Inicializa o pool
         
         Args:
             object_class: Classe dos objetos a serem poolados
             initial_size (int): Quantidade inicial de objetos
+            growth (str): Política quando esgota ('fixed', 'double' ou 'drop_oldest')
         """
+        if growth not in GROWTH_POLICIES:
+            raise ValueError(f"Política de crescimento inválida: {growth}")
+        
         self.object_class = object_class
+        self.growth = growth
         self.available = []
         self.in_use = []
+        self.total_created = 0
+        
+        # Contador de aquisições e ordem de aquisição (só 'drop_oldest').
+        # Entradas de objetos já devolvidos ficam na fila e são puladas
+        self.acquire_count = 0
+        self.acquire_order = deque()
         
         # Pré-popular pool
-        for _ in range(initial_size):
-            obj = object_class()
+        self._create_objects(initial_size)
+    
+    def _create_objects(self, amount):
+        """
+        Cria objetos novos e coloca em available
+        
+        Args:
+            amount (int): Quantidade de objetos
+        """
+        for _ in range(amount):
+            obj = self.object_class()
             obj.active = False
+            obj.pool_index = -1
+            obj.pool_serial = 0
             self.available.append(obj)
+        
+        self.total_created += amount
     
     def get(self):
         """
         Pega um objeto do pool
         
         Returns:
-            object: Objeto disponível ou novo se pool vazio
+            object: Objeto disponível
+        
+        Raises:
+            PoolExhausted: Pool esgotado com política 'fixed'
         """
-        if self.available:
-            obj = self.available.pop()
-            self.in_use.append(obj)
-            return obj
-        else:
-            # Pool esgotado, criar novo
-            obj = self.object_class()
-            self.in_use.append(obj)
-            return obj
+        if not self.available:
+            if self.growth == GROWTH_FIXED:
+                raise PoolExhausted(
+                    f"Pool de {self.object_class.__name__} esgotado ({self.total_created} objetos)"
+                )
+            
+            if self.growth == GROWTH_DROP_OLDEST and self.in_use:
+                self._drop_oldest()
+            else:
+                # Pool esgotado, dobrar
+                self._create_objects(max(1, self.total_created))
+        
+        obj = self.available.pop()
+        obj.pool_index = len(self.in_use)
+        self.acquire_count += 1
+        obj.pool_serial = self.acquire_count
+        self.in_use.append(obj)
+        
+        if self.growth == GROWTH_DROP_OLDEST:
+            order = self.acquire_order
+            order.append((obj.pool_serial, obj))
+            
+            # Compacta as entradas de devolvidos (custo amortizado O(1))
+            if len(order) > 2 * self.total_created:
+                self.acquire_order = deque(
+                    entry for entry in order if self._is_current(entry)
+                )
+        
+        return obj
+    
+    def _is_current(self, entry):
+        """Entrada da fila ainda é o objeto em uso daquela aquisição?"""
+        serial, obj = entry
+        return obj.pool_index >= 0 and obj.pool_serial == serial
+    
+    def _drop_oldest(self):
+        """Desativa e devolve o objeto em uso mais antigo (O(1) amortizado)"""
+        order = self.acquire_order
+        while order:
+            entry = order.popleft()
+            if not self._is_current(entry):
+                continue
+            
+            oldest = entry[1]
+            deactivate = getattr(oldest, 'deactivate', None)
+            if deactivate is not None:
+                deactivate()
+            self.return_object(oldest)
+            return
+        
+        # Nenhum em uso rastreado (não deveria acontecer): cresce
+        self._create_objects(max(1, self.total_created))
     
     def return_object(self, obj):
         """
-        Retorna objeto ao pool
+        Retorna objeto ao pool (O(1), troca com o último em uso)
         
         Args:
             obj: Objeto a ser retornado
         """
-        if obj in self.in_use:
-            obj.active = False
-            self.in_use.remove(obj)
-            self.available.append(obj)
+        index = getattr(obj, 'pool_index', -1)
+        in_use = self.in_use
+        
+        if index < 0 or index >= len(in_use) or in_use[index] is not obj:
+            return
+        
+        last = in_use.pop()
+        if last is not obj:
+            in_use[index] = last
+            last.pool_index = index
+        
+        obj.active = False
+        obj.pool_index = -1
+        self.available.append(obj)
     
     def update_all(self, dt):
         """
@@ -65,23 +253,37 @@ class ObjectPool:
         Args:
             dt (float): Delta time
         """
-        for obj in self.in_use[:]:  # Copia lista para evitar problemas
+        in_use = self.in_use
+        i = 0
+        
+        # Sem cópia: ao devolver um objeto, o último ocupa a posição i
+        # e é atualizado na mesma iteração
+        while i < len(in_use):
+            obj = in_use[i]
             obj.update(dt)
             
             # Se desativado, retorna ao pool
             if not obj.active:
                 self.return_object(obj)
+            else:
+                i += 1
     
-    def render_all(self, screen):
+    def render_all(self, screen, viewport=None, doreturn=True, overlays=None, alpha=1.0, step=None):
         """
-        Renderiza todos os objetos ativos
+        Renderiza todos os objetos ativos (em lote, ver render_batch)
         
         Args:
             screen: Pygame surface
+            viewport (pygame.Rect): Área visível (None = tela toda)
+            doreturn (bool): Coleta as áreas desenhadas (para dirty rects)
+            overlays (list): Adia os render_overlay() (ver render_batch)
+            alpha (float): Fração entre o passo anterior e o atual
+            step (int): Passo de simulação atual (None = sem interpolação)
+        
+        Returns:
+            list: Áreas da tela desenhadas (vazia se doreturn=False)
         """
-        for obj in self.in_use:
-            if obj.active:
-                obj.render(screen)
+        return render_batch(screen, self.in_use, viewport, doreturn, overlays, alpha, step)
     
     def get_active_count(self):
         """Retorna quantidade de objetos ativos"""
@@ -93,6 +295,10 @@ class ObjectPool:
     
     def clear_all(self):
         """Remove todos os objetos ativos"""
-        for obj in self.in_use[:]:
+        for obj in self.in_use:
             obj.active = False
-            self.return_object(obj)
\ No newline at end of file
+            obj.pool_index = -1
+        
+        self.available.extend(self.in_use)
+        self.in_use.clear()
+        self.acquire_order.clear()
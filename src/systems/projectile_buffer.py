@@ -0,0 +1,420 @@
+"""
+Projectile Buffer - Projéteis em structure-of-arrays (NumPy)
+"""
+
+import pygame
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+from src.utils.placeholder_generator import get_sprite
+
+
+# Códigos de dono (armazenados em int8)
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+
+OWNER_NAMES = ('player', 'enemy')
+OWNER_CODES = {'player': OWNER_PLAYER, 'enemy': OWNER_ENEMY}
+
+# Margem fora da tela antes de desativar (mesma do Projectile)
+OFFSCREEN_MARGIN = 20
+
+
+class ProjectileHandle:
+    """
+    Visão de um slot do ProjectileBuffer
+    
+    Expõe a mesma API do Projectile (spawn, deactivate, x, y, vx, vy...)
+    para que Player.create_projectile e EnemyRange.shoot continuem
+    funcionando sem alterações. Cada slot tem um único handle reutilizado.
+    """
+    
+    __slots__ = ('buffer', 'index')
+    
+    def __init__(self, buffer, index):
+        self.buffer = buffer
+        self.index = index
+    
+    def spawn(self, x, y, damage=10, owner='player'):
+        """
+        Ativa o projétil
+        
+        Args:
+            x (float): Posição X inicial
+            y (float): Posição Y inicial
+            damage (float): Dano que causa
+            owner (str): 'player' ou 'enemy'
+        """
+        self.buffer.spawn(self.index, x, y, damage, owner)
+    
+    def deactivate(self):
+        """Desativa o projétil (slot volta ao buffer no próximo update)"""
+        self.buffer.active[self.index] = False
+    
+    @property
+    def x(self):
+        return float(self.buffer.x[self.index])
+    
+    @x.setter
+    def x(self, value):
+        self.buffer.x[self.index] = value
+    
+    @property
+    def y(self):
+        return float(self.buffer.y[self.index])
+    
+    @y.setter
+    def y(self, value):
+        self.buffer.y[self.index] = value
+    
+    @property
+    def vx(self):
+        return float(self.buffer.vx[self.index])
+    
+    @vx.setter
+    def vx(self, value):
+        self.buffer.vx[self.index] = value
+    
+    @property
+    def vy(self):
+        return float(self.buffer.vy[self.index])
+    
+    @vy.setter
+    def vy(self, value):
+        self.buffer.vy[self.index] = value
+    
+    @property
+    def damage(self):
+        return float(self.buffer.damage[self.index])
+    
+    @damage.setter
+    def damage(self, value):
+        self.buffer.damage[self.index] = value
+    
+    @property
+    def owner(self):
+        return OWNER_NAMES[self.buffer.owner[self.index]]
+    
+    @property
+    def active(self):
+        return bool(self.buffer.active[self.index])
+    
+    @active.setter
+    def active(self, value):
+        self.buffer.active[self.index] = value
+    
+    @property
+    def time_alive(self):
+        return float(self.buffer.time_alive[self.index])
+    
+    @property
+    def lifetime(self):
+        return self.buffer.lifetime
+    
+    @property
+    def width(self):
+        return int(self.buffer.width[self.index])
+    
+    @property
+    def height(self):
+        return int(self.buffer.height[self.index])
+    
+    @property
+    def sprite(self):
+        return self.buffer.sprites[self.buffer.owner[self.index]]
+    
+    @property
+    def rect(self):
+        rect = self.sprite.get_rect()
+        rect.center = (self.x, self.y)
+        return rect
+
+
+class ProjectileBuffer:
+    """
+    Buffer de projéteis em arrays contíguos
+    
+    Substitui ObjectPool(Projectile): posição, velocidade, dano, dono,
+    tempo de vida e flags ficam em arrays NumPy, e update_all integra e
+    descarta todos os projéteis com poucas operações vetorizadas.
+    """
+    
+    def __init__(self, capacity=200, lifetime=2.0):
+        """
+        Inicializa o buffer
+        
+        Args:
+            capacity (int): Quantidade inicial de slots (dobra se esgotar)
+            lifetime (float): Tempo de vida dos projéteis em segundos
+        """
+        self.capacity = 0
+        self.lifetime = lifetime
+        
+        # Arrays (structure-of-arrays)
+        self.x = np.zeros(0, dtype=np.float64)
+        self.y = np.zeros(0, dtype=np.float64)
+        self.prev_x = np.zeros(0, dtype=np.float64)  # Posição no passo anterior
+        self.prev_y = np.zeros(0, dtype=np.float64)  # (interpolação do render)
+        self.vx = np.zeros(0, dtype=np.float64)
+        self.vy = np.zeros(0, dtype=np.float64)
+        self.damage = np.zeros(0, dtype=np.float64)
+        self.owner = np.zeros(0, dtype=np.int8)
+        self.width = np.zeros(0, dtype=np.int16)
+        self.height = np.zeros(0, dtype=np.int16)
+        self.time_alive = np.zeros(0, dtype=np.float64)
+        self.active = np.zeros(0, dtype=bool)
+        self.used = np.zeros(0, dtype=bool)  # Slot entregue por get()
+        
+        # Slots livres (pilha) e handles (um por slot)
+        self.free = []
+        self.handles = []
+        self.used_count = 0
+        
+        # Projéteis desenhados no último render_all (índices, donos, posições)
+        self.drawn = None
+        
+        # Sprites compartilhados por todos os projéteis (indexados pelo dono)
+        self.sprites = (
+            get_sprite('projectile', (6, 12), COLOR_YELLOW),
+            get_sprite('projectile', (8, 8), COLOR_RED),
+        )
+        
+        self._grow(max(1, capacity))
+    
+    def _grow(self, new_slots):
+        """
+        Aumenta a capacidade do buffer
+        
+        Args:
+            new_slots (int): Quantidade de slots a adicionar
+        """
+        old = self.capacity
+        new = old + new_slots
+        
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'damage', 'owner',
+                     'width', 'height', 'time_alive', 'active', 'used'):
+            array = getattr(self, name)
+            grown = np.zeros(new, dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        
+        self.handles.extend(ProjectileHandle(self, i) for i in range(old, new))
+        
+        # Pilha: menores índices saem primeiro
+        self.free = list(range(new - 1, old - 1, -1)) + self.free
+        self.capacity = new
+    
+    def get(self):
+        """
+        Pega um slot livre
+        
+        Returns:
+            ProjectileHandle: Handle do slot (inativo até spawn)
+        """
+        if not self.free:
+            # Buffer esgotado, dobrar capacidade
+            self._grow(self.capacity)
+        
+        index = self.free.pop()
+        self.used[index] = True
+        self.active[index] = False
+        self.used_count += 1
+        return self.handles[index]
+    
+    def spawn(self, index, x, y, damage=10, owner='player'):
+        """
+        Ativa o projétil de um slot
+        
+        Args:
+            index (int): Slot
+            x (float): Posição X inicial
+            y (float): Posição Y inicial
+            damage (float): Dano que causa
+            owner (str): 'player' ou 'enemy'
+        """
+        code = OWNER_CODES[owner]
+        
+        self.x[index] = x
+        self.y[index] = y
+        self.prev_x[index] = x
+        self.prev_y[index] = y
+        self.damage[index] = damage
+        self.owner[index] = code
+        self.time_alive[index] = 0
+        self.active[index] = True
+        
+        if code == OWNER_PLAYER:
+            # Projéteis do player: PARA CIMA
+            self.vx[index] = 0
+            self.vy[index] = -600
+            self.width[index] = 6
+            self.height[index] = 12
+        else:
+            # Projéteis inimigos: velocidade é setada por quem chamou
+            self.width[index] = 8
+            self.height[index] = 8
+    
+    def return_object(self, handle):
+        """
+        Devolve um slot ao buffer
+        
+        Args:
+            handle (ProjectileHandle): Handle a ser devolvido
+        """
+        index = handle.index
+        if self.used[index]:
+            self.active[index] = False
+            self.used[index] = False
+            self.free.append(index)
+            self.used_count -= 1
+    
+    def update_all(self, dt):
+        """
+        Move, envelhece e descarta todos os projéteis de uma vez
+        
+        Args:
+            dt (float): Delta time em segundos
+        """
+        active = self.active
+        
+        # Movimento e lifetime (apenas slots ativos)
+        np.add(self.x, self.vx * dt, out=self.x, where=active)
+        np.add(self.y, self.vy * dt, out=self.y, where=active)
+        np.add(self.time_alive, dt, out=self.time_alive, where=active)
+        
+        # Expirados ou fora da tela
+        expired = self.time_alive >= self.lifetime
+        expired |= self.y < -OFFSCREEN_MARGIN
+        expired |= self.y > SCREEN_HEIGHT + OFFSCREEN_MARGIN
+        expired |= self.x < -OFFSCREEN_MARGIN
+        expired |= self.x > SCREEN_WIDTH + OFFSCREEN_MARGIN
+        active &= ~expired
+        
+        # Slots em uso mas inativos voltam ao buffer
+        released = np.flatnonzero(self.used & ~active)
+        if released.size:
+            self.used[released] = False
+            self.free.extend(released[::-1].tolist())
+            self.used_count -= released.size
+    
+    def capture_positions(self):
+        """Guarda as posições atuais como as do passo anterior (interpolação)"""
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+    
+    @property
+    def in_use(self):
+        """Handles dos slots em uso (ordem dos índices)"""
+        handles = self.handles
+        return [handles[i] for i in np.flatnonzero(self.used)]
+    
+    def render_all(self, screen, viewport=None, doreturn=True, overlays=None, alpha=1.0, step=None):
+        """
+        Renderiza os projéteis ativos e visíveis com um único blits()
+        
+        Args:
+            screen: Pygame surface
+            viewport (pygame.Rect): Área visível (None = tela toda)
+            doreturn (bool): Coleta as áreas desenhadas (para dirty rects)
+            overlays (list): Recebe o buffer para desenhar as hitboxes
+                depois (None = desenha na hora)
+            alpha (float): Fração entre o passo anterior e o atual
+            step (int): Passo de simulação atual (None = sem interpolação)
+        
+        Returns:
+            list: Áreas da tela desenhadas (vazia se doreturn=False)
+        """
+        if viewport is None:
+            viewport = screen.get_rect()
+        
+        self.drawn = None
+        
+        indices = np.flatnonzero(self.active)
+        if indices.size == 0:
+            return []
+        
+        width = self.width[indices]
+        height = self.height[indices]
+        x = self.x[indices]
+        y = self.y[indices]
+        if step is not None and alpha < 1.0:
+            prev_x = self.prev_x[indices]
+            prev_y = self.prev_y[indices]
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        left = (x - width // 2).astype(np.int32)
+        top = (y - height // 2).astype(np.int32)
+        
+        # Culling: descarta quem está fora do viewport
+        visible = (
+            (left < viewport.right) & (left + width > viewport.left) &
+            (top < viewport.bottom) & (top + height > viewport.top)
+        )
+        
+        # Agrupa por dono (mesmo sprite em sequência)
+        order = np.flatnonzero(visible)
+        order = order[np.argsort(self.owner[indices[order]], kind='stable')]
+        if order.size == 0:
+            return []
+        
+        indices = indices[order]
+        owners = self.owner[indices]
+        left = left[order]
+        top = top[order]
+        
+        sprites = self.sprites
+        dirty = screen.blits(
+            [(sprites[o], (l, t)) for o, l, t in zip(owners.tolist(), left.tolist(), top.tolist())],
+            doreturn=doreturn
+        ) or []
+        
+        # Desenhados neste frame (para as hitboxes)
+        self.drawn = (indices, owners, left, top)
+        if overlays is not None:
+            overlays.append(self)
+        else:
+            self.render_overlay(screen)
+        
+        return dirty
+    
+    def render_overlay(self, screen):
+        """
+        Desenha as hitboxes (debug) dos projéteis do último render_all
+        
+        Args:
+            screen: Pygame surface
+        """
+        from config import config
+        if self.drawn is None or not (config.debug_mode and config.show_hitboxes):
+            return None
+        
+        indices, owners, left, top = self.drawn
+        widths = self.width[indices].tolist()
+        heights = self.height[indices].tolist()
+        for o, l, t, w, h in zip(owners.tolist(), left.tolist(), top.tolist(), widths, heights):
+            pygame.draw.rect(
+                screen,
+                COLOR_YELLOW if o == OWNER_PLAYER else COLOR_RED,
+                (l, t, w, h),
+                1
+            )
+        return None
+    
+    def get_active_count(self):
+        """Retorna quantidade de slots em uso"""
+        return self.used_count
+    
+    def get_available_count(self):
+        """Retorna quantidade de slots disponíveis"""
+        return len(self.free)
+    
+    def clear_all(self):
+        """Remove todos os projéteis ativos"""
+        self.active[:] = False
+        self.used[:] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+        self.used_count = 0
@@ -0,0 +1,90 @@
+"""
+Spatial Grid - Hash espacial uniforme para broadphase de colisões
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+
+class SpatialGrid:
+    """Grade uniforme (spatial hash) reconstruída a cada frame"""
+    
+    def __init__(self, cell_size=64):
+        """
+        Inicializa a grade
+        
+        Args:
+            cell_size (int): Tamanho de cada célula em pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> lista de (ordem, objeto)
+        self.count = 0
+    
+    def clear(self):
+        """Esvazia a grade (mantém o tamanho de célula)"""
+        self.cells.clear()
+        self.count = 0
+    
+    def rebuild(self, objects, cell_size=None):
+        """
+        Reconstrói a grade a partir de uma lista de objetos
+        
+        Cada objeto é inserido pelo centro (x, y). A ordem original da
+        lista é guardada para que as consultas devolvam os objetos na
+        mesma ordem da lista (determinismo).
+        
+        Args:
+            objects (list): Objetos com atributos x e y
+            cell_size (int): Novo tamanho de célula (opcional)
+        """
+        if cell_size:
+            self.cell_size = cell_size
+        
+        self.clear()
+        
+        size = self.cell_size
+        cells = self.cells
+        
+        for order, obj in enumerate(objects):
+            key = (int(obj.x // size), int(obj.y // size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(order, obj)]
+            else:
+                bucket.append((order, obj))
+        
+        self.count = len(objects)
+    
+    def query(self, x, y, radius):
+        """
+        Retorna objetos nas células vizinhas de um ponto
+        
+        Args:
+            x, y (float): Centro da consulta
+            radius (float): Alcance da consulta (raio do objeto + maior hitbox)
+        
+        Returns:
+            list: Objetos candidatos, na ordem original de inserção
+        """
+        size = self.cell_size
+        cells = self.cells
+        
+        min_cx = int((x - radius) // size)
+        max_cx = int((x + radius) // size)
+        min_cy = int((y - radius) // size)
+        max_cy = int((y + radius) // size)
+        
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        
+        # Ordenar pela ordem da lista original (mesma ordem do loop antigo)
+        if len(found) > 1:
+            found.sort(key=lambda item: item[0])
+        
+        return [obj for _, obj in found]
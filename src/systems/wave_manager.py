@@ -3,9 +3,9 @@ WaveManager - Gerenciador de setores, spawns e progressão
 SISTEMA SIMPLIFICADO: Apenas SETORES (sem waves)
 """
 
-import random
 import pygame
 from constants import *
+from src.core.run_context import run_context
 from src.entities.enemy_kamikaze import EnemyKamikaze
 from src.entities.enemy_range import EnemyRange
 from src.entities.enemy_mother import EnemyMother
@@ -14,8 +14,15 @@ from src.entities.enemy_mother import EnemyMother
 class WaveManager:
     """Gerencia setores, spawns e progressão"""
     
-    def __init__(self):
-        """Inicializa o wave manager"""
+    def __init__(self, rng=None):
+        """
+        Inicializa o wave manager
+        
+        Args:
+            rng (random.Random): RNG da run (padrão: run_context.rng)
+        """
+        self.rng = rng or run_context.rng
+        
         # Progressão
         self.current_sector = 1
         
@@ -43,6 +50,12 @@ class WaveManager:
         self.range_pool = []
         self.mother_pool = []
         
+        # Inimigos livres por tipo (pilhas) e conjunto de ativos
+        # (dict mantém a ordem de spawn → iteração determinística)
+        self.free_enemies = {'kamikaze': [], 'range': [], 'mother': []}
+        self.active_enemies = {}
+        self._active_snapshot = None
+        
         self._create_pools()
         self.start_sector()
         
@@ -51,45 +64,85 @@ class WaveManager:
     def _create_pools(self):
         """Cria pools de inimigos"""
         for _ in range(60):
-            k = EnemyKamikaze()
-            self.kamikaze_pool.append(k)
+            self._create_enemy(EnemyKamikaze, self.kamikaze_pool)
         
         for _ in range(30):
-            r = EnemyRange()
-            self.range_pool.append(r)
+            self._create_enemy(EnemyRange, self.range_pool)
         
         for _ in range(10):
-            m = EnemyMother()
-            self.mother_pool.append(m)
+            self._create_enemy(EnemyMother, self.mother_pool)
+        
+        # Primeiro do pool no topo da pilha (mesma ordem da busca antiga)
+        for stack in self.free_enemies.values():
+            stack.reverse()
         
         print(f"✅ Pools criados: {len(self.kamikaze_pool)} Kamikazes, {len(self.range_pool)} Ranges, {len(self.mother_pool)} Mães")
     
+    def _create_enemy(self, enemy_class, pool):
+        """
+        Cria inimigo, registra callbacks e coloca na pilha de livres
+        
+        Args:
+            enemy_class: Classe do inimigo
+            pool (list): Pool do tipo
+            
+        Returns:
+            Enemy: Inimigo criado
+        """
+        enemy = enemy_class()
+        enemy.on_spawn = self._on_enemy_spawn
+        enemy.on_deactivate = self._on_enemy_deactivate
+        pool.append(enemy)
+        self.free_enemies[enemy.enemy_type].append(enemy)
+        return enemy
+    
+    def _on_enemy_spawn(self, enemy):
+        """Move inimigo da pilha de livres para o conjunto de ativos"""
+        if enemy in self.active_enemies:
+            return
+        
+        stack = self.free_enemies[enemy.enemy_type]
+        if stack and stack[-1] is enemy:
+            stack.pop()
+        elif enemy in stack:
+            # Spawn sem passar por get_*() (raro)
+            stack.remove(enemy)
+        
+        self.active_enemies[enemy] = None
+        self._active_snapshot = None
+    
+    def _on_enemy_deactivate(self, enemy):
+        """Devolve inimigo desativado para a pilha de livres"""
+        if enemy not in self.active_enemies:
+            return
+        
+        del self.active_enemies[enemy]
+        self.free_enemies[enemy.enemy_type].append(enemy)
+        self._active_snapshot = None
+    
+    def _get_free(self, enemy_type, enemy_class, pool):
+        """
+        Retorna o próximo inimigo livre do tipo (O(1))
+        
+        O inimigo só sai da pilha quando spawn() é chamado, então chamar
+        get_*() sem spawnar devolve o mesmo objeto (igual à busca antiga).
+        """
+        stack = self.free_enemies[enemy_type]
+        if not stack:
+            self._create_enemy(enemy_class, pool)
+        return stack[-1]
+    
     def get_kamikaze(self):
         """Pega Kamikaze do pool"""
-        for k in self.kamikaze_pool:
-            if not k.active:
-                return k
-        k = EnemyKamikaze()
-        self.kamikaze_pool.append(k)
-        return k
+        return self._get_free('kamikaze', EnemyKamikaze, self.kamikaze_pool)
     
     def get_range(self):
         """Pega Range do pool"""
-        for r in self.range_pool:
-            if not r.active:
-                return r
-        r = EnemyRange()
-        self.range_pool.append(r)
-        return r
+        return self._get_free('range', EnemyRange, self.range_pool)
     
     def get_mother(self):
         """Pega Mãe do pool"""
-        for m in self.mother_pool:
-            if not m.active:
-                return m
-        m = EnemyMother()
-        self.mother_pool.append(m)
-        return m
+        return self._get_free('mother', EnemyMother, self.mother_pool)
     
     def start_sector(self):
         """Inicia novo setor"""
@@ -154,8 +207,8 @@ class WaveManager:
             enemy_type = self._choose_enemy_type()
             
             # Posição ESPALHADA
-            x = random.randint(100, SCREEN_WIDTH - 100)
-            y = -50 - random.randint(0, 100)
+            x = self.rng.randint(100, SCREEN_WIDTH - 100)
+            y = -50 - self.rng.randint(0, 100)
             
             if enemy_type == 'kamikaze':
                 enemy = self.get_kamikaze()
@@ -222,10 +275,10 @@ class WaveManager:
         if self.current_sector == 1:
             return 'kamikaze'
         elif self.current_sector == 2:
-            return 'kamikaze' if random.random() < 0.80 else 'range'
+            return 'kamikaze' if self.rng.random() < 0.80 else 'range'
         elif self.current_sector >= 3:
             # 65% Kamikaze, 32% Range, 3% Mother
-            rand = random.random()
+            rand = self.rng.random()
             if rand < 0.65:
                 return 'kamikaze'
             elif rand < 0.97:
@@ -246,7 +299,7 @@ class WaveManager:
         print(f"\n🎉 SETOR {self.current_sector} COMPLETO!")
         
         # 25% chance de miniboss
-        if not self._is_boss_sector() and random.random() < self.miniboss_chance:
+        if not self._is_boss_sector() and self.rng.random() < self.miniboss_chance:
             print("⚠️ MINIBOSS APARECENDO!")
             self.miniboss_active = True
         
@@ -266,18 +319,16 @@ class WaveManager:
         return self.current_sector % 7 == 0
     
     def get_active_enemies(self):
-        """Retorna inimigos ativos"""
-        active = []
-        for k in self.kamikaze_pool:
-            if k.active:
-                active.append(k)
-        for r in self.range_pool:
-            if r.active:
-                active.append(r)
-        for m in self.mother_pool:
-            if m.active:
-                active.append(m)
-        return active
+        """
+        Retorna inimigos ativos
+        
+        A lista é reconstruída apenas quando algum inimigo spawna ou é
+        desativado; chamadas no mesmo frame reutilizam a mesma lista.
+        Não modificar a lista retornada.
+        """
+        if self._active_snapshot is None:
+            self._active_snapshot = list(self.active_enemies)
+        return self._active_snapshot
     
     def get_countdown_text(self):
         """Retorna texto do countdown"""
@@ -9,6 +9,8 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from constants import *
+from src.utils.text_cache import render_text
+from src.ui.modal_layer import ModalLayer, create_dim_surface
 
 
 class CardMenu:
@@ -30,11 +32,11 @@ class CardMenu:
         self.slot_height = 120
         self.slot_spacing = 20
         
-        # Fontes
-        self.font_title = pygame.font.Font(None, 48)
-        self.font_large = pygame.font.Font(None, 36)
-        self.font_medium = pygame.font.Font(None, 28)
-        self.font_small = pygame.font.Font(None, 20)
+        # Tamanhos de fonte (textos via text_cache)
+        self.font_title = 48
+        self.font_large = 36
+        self.font_medium = 28
+        self.font_small = 20
         
         # Cores
         self.bg_color = (20, 20, 30, 230)  # Fundo escuro semi-transparente
@@ -50,6 +52,9 @@ class CardMenu:
         self.confirming_removal = False
         self.removal_timer = 0
         self.removal_duration = 2.0
+        
+        # Overlay em cache
+        self.layer = ModalLayer(self._build)
     
     def toggle(self):
         """Abre/fecha o menu"""
@@ -167,10 +172,27 @@ class CardMenu:
         if not self.active:
             return
         
+        # Remonta só quando seleção, confirmação ou cartas mudam
+        key = (
+            self.selected_slot,
+            self.confirming_removal,
+            tuple((card.name, card.rarity) for card in player.equipped_cards),
+            player.max_card_slots,
+        )
+        self.layer.render(screen, key, player)
+    
+    def _build(self, player):
+        """
+        Monta o overlay completo (fundo escurecido + menu)
+        
+        Args:
+            player: Player object
+        
+        Returns:
+            pygame.Surface: Overlay do tamanho da tela
+        """
         # Overlay escuro (fundo)
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        overlay = create_dim_surface(150)
         
         # Fundo do menu
         menu_surface = pygame.Surface((self.menu_width, self.menu_height), pygame.SRCALPHA)
@@ -185,14 +207,14 @@ class CardMenu:
         )
         
         # Título
-        title_text = self.font_title.render("CARTAS EQUIPADAS", True, COLOR_WHITE)
+        title_text = render_text("CARTAS EQUIPADAS", self.font_title, COLOR_WHITE)
         title_rect = title_text.get_rect(center=(self.menu_width // 2, 40))
         menu_surface.blit(title_text, title_rect)
         
         # Contador de slots
-        slots_text = self.font_small.render(
+        slots_text = render_text(
             f"{len(player.equipped_cards)}/{player.max_card_slots} slots",
-            True,
+            self.font_small,
             COLOR_GRAY
         )
         slots_rect = slots_text.get_rect(center=(self.menu_width // 2, 75))
@@ -234,7 +256,7 @@ class CardMenu:
         ]
         
         for i, text in enumerate(instructions):
-            instruction_text = self.font_small.render(text, True, COLOR_GRAY)
+            instruction_text = render_text(text, self.font_small, COLOR_GRAY)
             instruction_rect = instruction_text.get_rect(
                 center=(self.menu_width // 2, instructions_y + (i * 25))
             )
@@ -242,9 +264,9 @@ class CardMenu:
         
         # Mensagem de confirmação de remoção
         if self.confirming_removal:
-            confirm_text = self.font_medium.render(
+            confirm_text = render_text(
                 "Pressione R novamente para CONFIRMAR",
-                True,
+                self.font_medium,
                 COLOR_RED
             )
             confirm_rect = confirm_text.get_rect(center=(self.menu_width // 2, instructions_y - 30))
@@ -256,8 +278,10 @@ class CardMenu:
             
             menu_surface.blit(confirm_text, confirm_rect)
         
-        # Blit menu na tela
-        screen.blit(menu_surface, (self.menu_x, self.menu_y))
+        # Menu sobre o fundo escurecido
+        overlay.blit(menu_surface, (self.menu_x, self.menu_y))
+        
+        return overlay
     
     def _render_card_slot(self, surface, card, x, y, width, height, selected=False):
         """
@@ -320,20 +344,20 @@ class CardMenu:
         name_x = icon_x + icon_size + 15
         name_y = y + 15
         
-        name_text = self.font_large.render(card.name, True, rarity_color)
+        name_text = render_text(card.name, self.font_large, rarity_color)
         surface.blit(name_text, (name_x, name_y))
         
         # Raridade
-        rarity_text = self.font_small.render(
+        rarity_text = render_text(
             card.rarity.upper(),
-            True,
+            self.font_small,
             rarity_color
         )
         surface.blit(rarity_text, (name_x, name_y + 35))
         
         # Descrição
         desc_y = name_y + 60
-        desc_text = self.font_small.render(card.description, True, COLOR_GRAY)
+        desc_text = render_text(card.description, self.font_small, COLOR_GRAY)
         surface.blit(desc_text, (name_x, desc_y))
     
     def _render_empty_slot(self, surface, x, y, width, height):
@@ -353,7 +377,7 @@ class CardMenu:
         pygame.draw.rect(surface, border_color, (x, y, width, height), 2)
         
         # Texto "VAZIO"
-        empty_text = self.font_medium.render("[ VAZIO ]", True, (100, 100, 110))
+        empty_text = render_text("[ VAZIO ]", self.font_medium, (100, 100, 110))
         empty_rect = empty_text.get_rect(center=(x + width // 2, y + height // 2))
         surface.blit(empty_text, empty_rect)
     
@@ -0,0 +1,95 @@
+"""
+Modal Layer - Superfícies de overlay montadas uma vez e reaproveitadas
+"""
+
+import pygame
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+
+
+def create_dim_surface(alpha, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    """
+    Cria uma superfície preta semi-transparente (base dos overlays)
+    
+    Args:
+        alpha (int): Opacidade do escurecimento (0-255)
+        size (tuple): Tamanho da superfície
+    
+    Returns:
+        pygame.Surface: Superfície SRCALPHA
+    """
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((0, 0, 0, alpha))
+    return surface
+
+
+class ModalLayer:
+    """
+    Overlay com superfície em cache
+    
+    A superfície só é reconstruída quando a chave muda (seleção, estado
+    de confirmação, textos...). Fora isso, render() é um único blit.
+    Fade usa set_alpha na superfície pronta, sem reconstruir.
+    """
+    
+    def __init__(self, build):
+        """
+        Inicializa a camada
+        
+        Args:
+            build (callable): Monta e retorna a superfície (recebe os
+                argumentos extras passados para render)
+        """
+        self.build = build
+        self.key = None
+        self.surface = None
+        self.alpha = None
+        self.builds = 0
+    
+    def get(self, key, *args):
+        """
+        Retorna a superfície, reconstruindo se a chave mudou
+        
+        Args:
+            key: Valor que identifica o conteúdo (comparado com ==)
+            *args: Repassados para build
+        
+        Returns:
+            pygame.Surface: Superfície do overlay
+        """
+        if self.surface is None or key != self.key:
+            self.surface = self.build(*args)
+            self.key = key
+            self.alpha = None
+            self.builds += 1
+        return self.surface
+    
+    def render(self, screen, key, *args, pos=(0, 0), alpha=255):
+        """
+        Desenha o overlay
+        
+        Args:
+            screen: Pygame surface
+            key: Valor que identifica o conteúdo
+            *args: Repassados para build
+            pos (tuple): Posição do canto superior esquerdo
+            alpha (int): Opacidade geral (0-255)
+        
+        Returns:
+            pygame.Rect: Área da tela desenhada
+        """
+        surface = self.get(key, *args)
+        
+        if alpha != self.alpha:
+            surface.set_alpha(alpha)
+            self.alpha = alpha
+        
+        return screen.blit(surface, pos)
+    
+    def invalidate(self):
+        """Força a reconstrução no próximo render"""
+        self.surface = None
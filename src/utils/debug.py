@@ -0,0 +1,249 @@
+"""
+Debug - Profiler de frame com breakdown por subsistema (overlay F3)
+"""
+
+import csv
+import json
+import time
+import pygame
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+from src.utils.text_cache import TextLabel
+
+
+# Fases de um frame, na ordem em que acontecem (nome, cor no gráfico)
+PROFILER_PHASES = (
+    ('events', (90, 90, 90)),
+    ('input', (160, 160, 160)),
+    ('player', (0, 200, 0)),
+    ('projectiles', (255, 220, 0)),
+    ('enemies', (255, 60, 60)),
+    ('collisions', (255, 140, 0)),
+    ('drops', (200, 100, 255)),
+    ('waves', (255, 0, 180)),
+    ('collectibles', (0, 220, 220)),
+    ('particles', (255, 150, 90)),
+    ('draw_background', (40, 70, 160)),
+    ('draw_enemies', (160, 40, 40)),
+    ('draw_pools', (160, 140, 0)),
+    ('draw_particles', (170, 90, 50)),
+    ('upscale', (255, 255, 160)),
+    ('draw_hud', (0, 130, 130)),
+    ('draw_menus', (120, 60, 160)),
+    ('present', (230, 230, 230)),
+)
+
+PROFILER_PERCENTILES = (50, 95, 99)
+
+# Orçamento de um frame (ms)
+FRAME_BUDGET_MS = 1000.0 / FPS
+
+
+class FrameProfiler:
+    """
+    Mede o tempo de cada fase do frame
+    
+    Uso por "voltas": begin_frame() marca o início, cada lap(nome) soma
+    o tempo desde a marca anterior à fase e move a marca, end_frame()
+    fecha a linha. Fora de um frame (ex: simulação headless) lap() não
+    faz nada, então as chamadas podem ficar no código sempre.
+    """
+    
+    def __init__(self, history=240, keep_trace=False):
+        """
+        Inicializa o profiler
+        
+        Args:
+            history (int): Frames usados nos percentis e no gráfico
+            keep_trace (bool): Guarda todos os frames para dump()
+        """
+        self.phases = [name for name, _ in PROFILER_PHASES]
+        self.colors = np.array([color for _, color in PROFILER_PHASES], dtype=np.uint8)
+        self.phase_index = {name: i for i, name in enumerate(self.phases)}
+        
+        # Janela circular (ms por fase)
+        self.history = history
+        self.samples = np.zeros((history, len(self.phases)), dtype=np.float64)
+        self.count = 0   # Frames válidos na janela
+        self.cursor = 0  # Próxima linha a escrever
+        self.frames = 0  # Total de frames medidos
+        
+        # Frame atual
+        self.current = np.zeros(len(self.phases), dtype=np.float64)
+        self.in_frame = False
+        self.mark = 0.0
+        
+        # Trace completo (para CSV/JSON)
+        self.keep_trace = keep_trace
+        self.trace = []
+        
+        # Overlay: um label por célula da tabela (só re-renderiza se mudar)
+        self.graph_height = 100
+        self.labels = {}
+    
+    def begin_frame(self):
+        """Começa a medir um frame"""
+        self.current[:] = 0
+        self.in_frame = True
+        self.mark = time.perf_counter()
+    
+    def lap(self, phase):
+        """
+        Atribui o tempo desde a última marca a uma fase
+        
+        Args:
+            phase (str): Nome da fase (ver PROFILER_PHASES)
+        """
+        if not self.in_frame:
+            return
+        
+        now = time.perf_counter()
+        self.current[self.phase_index[phase]] += (now - self.mark) * 1000.0
+        self.mark = now
+    
+    def end_frame(self):
+        """Fecha o frame atual e guarda na janela"""
+        if not self.in_frame:
+            return
+        
+        self.in_frame = False
+        self.samples[self.cursor] = self.current
+        self.cursor = (self.cursor + 1) % self.history
+        self.count = min(self.count + 1, self.history)
+        self.frames += 1
+        
+        if self.keep_trace:
+            self.trace.append(self.current.tolist())
+    
+    def get_window(self):
+        """
+        Retorna a janela em ordem cronológica
+        
+        Returns:
+            np.ndarray: (frames, fases) em ms
+        """
+        if self.count < self.history:
+            return self.samples[:self.count]
+        return np.roll(self.samples, -self.cursor, axis=0)
+    
+    def get_percentiles(self):
+        """
+        Percentis da janela por fase e do frame total
+        
+        Returns:
+            dict: {fase: (p50, p95, p99)} incluindo 'total'
+        """
+        window = self.get_window()
+        if len(window) == 0:
+            return {}
+        
+        totals = window.sum(axis=1)
+        table = np.percentile(
+            np.column_stack((window, totals)),
+            PROFILER_PERCENTILES,
+            axis=0
+        )
+        
+        names = self.phases + ['total']
+        return {name: tuple(table[:, i].tolist()) for i, name in enumerate(names)}
+    
+    def render(self, screen):
+        """
+        Desenha o gráfico empilhado e a tabela de percentis
+        
+        Args:
+            screen: Pygame surface
+        """
+        window = self.get_window()
+        if len(window) == 0:
+            return
+        
+        width = self.history
+        height = self.graph_height
+        x0 = SCREEN_WIDTH - width - 20
+        y0 = SCREEN_HEIGHT - height - 20
+        
+        # Escala: 2x o orçamento do frame ocupa o gráfico inteiro
+        scale = height / (FRAME_BUDGET_MS * 2)
+        
+        # Altura acumulada de cada fase por coluna → fase de cada pixel
+        bounds = np.cumsum(window, axis=1) * scale
+        ys = np.arange(height, dtype=np.float64)
+        phase = (ys[None, :, None] >= bounds[:, None, :]).sum(axis=2)
+        
+        pixels = np.zeros((width, height, 3), dtype=np.uint8)
+        columns = len(window)
+        palette = np.vstack((self.colors, np.zeros((1, 3), dtype=np.uint8)))
+        pixels[width - columns:] = palette[phase]
+        
+        # Eixo y cresce para baixo na tela: barras crescem de baixo para cima
+        graph = pygame.surfarray.make_surface(pixels[:, ::-1])
+        
+        # Tabela: total + fases mais caras (p95)
+        percentiles = self.get_percentiles()
+        ranked = sorted(self.phases, key=lambda name: percentiles[name][1], reverse=True)
+        lines = [('total', COLOR_WHITE)]
+        lines += [(name, tuple(self.colors[self.phase_index[name]])) for name in ranked[:6]]
+        
+        line_height = 16
+        table_top = y0 - 10 - line_height * (len(lines) + 1)
+        
+        # Fundo do painel (tabela + gráfico)
+        panel = pygame.Surface((width + 10, y0 + height + 5 - (table_top - 5)))
+        panel.set_alpha(200)
+        panel.fill(COLOR_BLACK)
+        screen.blit(panel, (x0 - 5, table_top - 5))
+        screen.blit(graph, (x0, y0))
+        
+        # Linha do orçamento (16.6ms a 60 FPS)
+        budget_y = y0 + height - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(screen, COLOR_WHITE, (x0, budget_y), (x0 + width - 1, budget_y))
+        
+        # Colunas com x fixo (fonte proporcional)
+        columns_x = (x0, x0 + 115, x0 + 160, x0 + 205)
+        rows = [(("ms", "p50", "p95", "p99"), COLOR_GRAY)]
+        rows += [
+            ((name, *(f"{value:.2f}" for value in percentiles[name])), color)
+            for name, color in lines
+        ]
+        
+        labels = self.labels
+        y = table_top
+        for row, (cells, color) in enumerate(rows):
+            for column, (cell, x) in enumerate(zip(cells, columns_x)):
+                label = labels.get((row, column))
+                if label is None:
+                    label = labels[(row, column)] = TextLabel(18)
+                screen.blit(label.render(cell, color), (x, y))
+            y += line_height
+    
+    def dump(self, path):
+        """
+        Salva o trace em CSV ou JSON (pela extensão)
+        
+        Args:
+            path (str): Caminho do arquivo (.csv ou .json)
+        """
+        rows = self.trace if self.keep_trace else self.get_window().tolist()
+        
+        if path.endswith('.json'):
+            data = {
+                'phases': self.phases,
+                'frames': rows,
+                'percentiles': self.get_percentiles(),
+            }
+            with open(path, 'w') as f:
+                json.dump(data, f)
+        else:
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['frame'] + self.phases + ['total'])
+                for i, row in enumerate(rows):
+                    writer.writerow([i] + [f"{v:.4f}" for v in row] + [f"{sum(row):.4f}"])
+        
+        print(f"⏱️ Profiler: {len(rows)} frames salvos em {path}")
@@ -0,0 +1,382 @@
+"""
+Particle System - Partículas e emissores em arrays NumPy de capacidade fixa
+"""
+
+import pygame
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+from src.utils.particles import PARTICLE_PRESETS
+from src.utils.placeholder_generator import get_sprite
+
+
+# Quantos sprites pré-tingidos por tamanho (cor/alpha do início ao fim da vida)
+FADE_STEPS = 8
+
+
+class ParticleSystem:
+    """
+    Motor de partículas vetorizado
+    
+    Partículas vivas ficam compactadas no início dos arrays ([0:count]):
+    update integra posição, velocidade e idade de todas de uma vez e
+    remove as mortas com uma única máscara. O fade de cor não é calculado
+    por pixel: cada preset gera FADE_STEPS sprites por tamanho, e o render
+    só escolhe o índice do sprite pela idade e desenha tudo com blits().
+    
+    Rajadas pedidas durante o frame (burst) são resolvidas juntas no
+    update, respeitando o orçamento de spawn do frame e a capacidade:
+    se 30 inimigos morrem no mesmo frame, cada explosão sai mais rala em
+    vez de as primeiras saírem completas e as últimas sumirem.
+    
+    O orçamento vale para o frame renderizado inteiro (renovado em
+    begin_frame): num frame com vários passos de simulação (catch-up) os
+    passos dividem o mesmo orçamento.
+    """
+    
+    def __init__(self, capacity=4096, spawn_budget=600, max_emitters=32, seed=None):
+        """
+        Inicializa o sistema
+        
+        Args:
+            capacity (int): Máximo de partículas vivas (limite rígido)
+            spawn_budget (int): Máximo de partículas criadas por frame renderizado
+            max_emitters (int): Máximo de emissores contínuos
+            seed (int): Seed do gerador (None = aleatória)
+        """
+        self.capacity = capacity
+        self.spawn_budget = spawn_budget
+        self.rng = np.random.default_rng(seed)
+        
+        # Partículas (structure-of-arrays, vivas em [0:count])
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_x = np.zeros(capacity, dtype=np.float32)  # Passo anterior (interpolação)
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.life = np.ones(capacity, dtype=np.float32)
+        self.drag = np.zeros(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.frame = np.zeros(capacity, dtype=np.int32)  # Primeiro sprite do fade
+        
+        # Emissores contínuos
+        self.emitter_x = np.zeros(max_emitters, dtype=np.float32)
+        self.emitter_y = np.zeros(max_emitters, dtype=np.float32)
+        self.emitter_preset = np.zeros(max_emitters, dtype=np.int32)
+        self.emitter_time = np.zeros(max_emitters, dtype=np.float32)  # Restante (inf = sem fim)
+        self.emitter_accum = np.zeros(max_emitters, dtype=np.float32)
+        self.emitter_active = np.zeros(max_emitters, dtype=bool)
+        
+        # Rajadas pedidas neste frame: (preset, x, y, quantidade)
+        self.pending = []
+        
+        # Presets compilados em tabelas (índice = id do preset)
+        self.preset_ids = {}
+        self.frames = []  # Sprites pré-tingidos
+        self._compile_presets(PARTICLE_PRESETS)
+        
+        # Estatísticas
+        self.spawned = 0
+        self.dropped = 0  # Pedidas mas cortadas pelo orçamento
+        self.peak = 0
+        self.frame_spawned = 0  # Criadas desde o begin_frame (orçamento)
+    
+    def _compile_presets(self, presets):
+        """
+        Monta as tabelas de parâmetros e os sprites de cada preset
+        
+        Args:
+            presets (dict): nome -> preset (ver PARTICLE_PRESETS)
+        """
+        table = {name: [] for name in (
+            'count', 'rate', 'speed_min', 'speed_max', 'life_min', 'life_max',
+            'direction', 'spread', 'drag', 'gravity', 'first_frame', 'sizes'
+        )}
+        radii = []
+        
+        for preset_id, (name, preset) in enumerate(presets.items()):
+            self.preset_ids[name] = preset_id
+            
+            table['count'].append(preset['count'])
+            table['rate'].append(preset['rate'])
+            table['speed_min'].append(preset['speed'][0])
+            table['speed_max'].append(preset['speed'][1])
+            table['life_min'].append(preset['life'][0])
+            table['life_max'].append(preset['life'][1])
+            table['direction'].append(np.radians(preset['direction']))
+            table['spread'].append(np.radians(preset['spread']))
+            table['drag'].append(preset['drag'])
+            table['gravity'].append(preset['gravity'])
+            table['first_frame'].append(len(self.frames))
+            table['sizes'].append(len(preset['sizes']))
+            
+            # Sprites: [tamanho][passo do fade]
+            start, end = preset['colors']
+            for radius in preset['sizes']:
+                for step in range(FADE_STEPS):
+                    t = step / FADE_STEPS
+                    color = tuple(round(a + (b - a) * t) for a, b in zip(start, end))
+                    alpha = round(255 * (1 - t))
+                    self.frames.append(get_sprite('particle', radius, color + (alpha,)))
+                    radii.append(radius)
+        
+        self.presets = {name: np.array(values) for name, values in table.items()}
+        self.frame_radius = np.array(radii, dtype=np.int32)
+    
+    def burst(self, name, x, y, count=None):
+        """
+        Pede uma rajada (criada no próximo update)
+        
+        Args:
+            name (str): Nome do preset
+            x (float): Posição X
+            y (float): Posição Y
+            count (int): Quantidade (None = a do preset)
+        """
+        preset_id = self.preset_ids[name]
+        if count is None:
+            count = int(self.presets['count'][preset_id])
+        if count > 0:
+            self.pending.append((preset_id, x, y, count))
+    
+    def add_emitter(self, name, x, y, duration=None):
+        """
+        Cria um emissor contínuo (usa o 'rate' do preset)
+        
+        Args:
+            name (str): Nome do preset
+            x (float): Posição X
+            y (float): Posição Y
+            duration (float): Duração em segundos (None = até stop_emitter)
+        
+        Returns:
+            int: Índice do emissor (-1 se todos estão ocupados)
+        """
+        free = np.flatnonzero(~self.emitter_active)
+        if free.size == 0:
+            return -1
+        
+        index = int(free[0])
+        self.emitter_x[index] = x
+        self.emitter_y[index] = y
+        self.emitter_preset[index] = self.preset_ids[name]
+        self.emitter_time[index] = np.inf if duration is None else duration
+        self.emitter_accum[index] = 0
+        self.emitter_active[index] = True
+        return index
+    
+    def move_emitter(self, index, x, y):
+        """Move um emissor (ex: seguindo uma entidade)"""
+        if index >= 0:
+            self.emitter_x[index] = x
+            self.emitter_y[index] = y
+    
+    def stop_emitter(self, index):
+        """Desliga um emissor (as partículas já criadas continuam)"""
+        if index >= 0:
+            self.emitter_active[index] = False
+    
+    def is_emitter_active(self, index):
+        """Retorna True se o emissor ainda está emitindo"""
+        return index >= 0 and bool(self.emitter_active[index])
+    
+    def begin_frame(self):
+        """Renova o orçamento de spawn (uma vez por frame renderizado)"""
+        self.frame_spawned = 0
+    
+    def update(self, dt):
+        """
+        Atualiza emissores e partículas e cria as rajadas pendentes
+        
+        Args:
+            dt (float): Delta time em segundos
+        """
+        self._update_emitters(dt)
+        
+        n = self.count
+        if n:
+            # Envelhecer e compactar (vivas continuam em [0:count])
+            age = self.age[:n]
+            age += dt
+            alive = age < self.life[:n]
+            
+            if not alive.all():
+                n = int(np.count_nonzero(alive))
+                for array in (self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy,
+                              self.age, self.life, self.drag, self.gravity, self.frame):
+                    array[:n] = array[:self.count][alive]
+                self.count = n
+            
+            # Integrar (drag, gravidade, movimento)
+            vx = self.vx[:n]
+            vy = self.vy[:n]
+            damping = np.maximum(0, 1 - self.drag[:n] * dt)
+            vx *= damping
+            vy *= damping
+            vy += self.gravity[:n] * dt
+            self.x[:n] += vx * dt
+            self.y[:n] += vy * dt
+        
+        self._spawn_pending()
+        self.peak = max(self.peak, self.count)
+    
+    def _update_emitters(self, dt):
+        """Acumula a emissão dos emissores ativos e vira rajadas pendentes"""
+        active = np.flatnonzero(self.emitter_active)
+        if active.size == 0:
+            return
+        
+        rates = self.presets['rate'][self.emitter_preset[active]]
+        accum = self.emitter_accum[active] + rates * dt
+        counts = accum.astype(np.int32)
+        self.emitter_accum[active] = accum - counts
+        
+        for index, count in zip(active.tolist(), counts.tolist()):
+            if count > 0:
+                self.pending.append((
+                    int(self.emitter_preset[index]),
+                    float(self.emitter_x[index]),
+                    float(self.emitter_y[index]),
+                    count
+                ))
+        
+        self.emitter_time[active] -= dt
+        self.emitter_active[active] = self.emitter_time[active] > 0
+    
+    def _spawn_pending(self):
+        """Cria as rajadas do frame dentro do orçamento (distribuição proporcional)"""
+        if not self.pending:
+            return
+        
+        preset_ids, xs, ys, counts = (np.array(column) for column in zip(*self.pending))
+        self.pending = []
+        
+        requested = int(counts.sum())
+        available = min(self.spawn_budget - self.frame_spawned, self.capacity - self.count)
+        
+        if requested > available:
+            # Cada rajada perde a mesma fração; o resto vai para as primeiras
+            counts = counts * available // requested
+            leftover = available - int(counts.sum())
+            counts[:leftover] += 1
+            self.dropped += requested - available
+        
+        total = int(counts.sum())
+        if total <= 0:
+            return
+        
+        # Parâmetros por partícula (uma linha por partícula nova)
+        preset = np.repeat(preset_ids, counts)
+        presets = self.presets
+        rng = self.rng
+        
+        angle = presets['direction'][preset] + (rng.random(total) - 0.5) * presets['spread'][preset]
+        speed = presets['speed_min'][preset] + rng.random(total) * (
+            presets['speed_max'][preset] - presets['speed_min'][preset]
+        )
+        life = presets['life_min'][preset] + rng.random(total) * (
+            presets['life_max'][preset] - presets['life_min'][preset]
+        )
+        size = rng.integers(0, presets['sizes'][preset])
+        
+        start = self.count
+        end = start + total
+        self.x[start:end] = np.repeat(xs, counts)
+        self.y[start:end] = np.repeat(ys, counts)
+        self.prev_x[start:end] = self.x[start:end]
+        self.prev_y[start:end] = self.y[start:end]
+        self.vx[start:end] = np.cos(angle) * speed
+        self.vy[start:end] = np.sin(angle) * speed
+        self.age[start:end] = 0
+        self.life[start:end] = life
+        self.drag[start:end] = presets['drag'][preset]
+        self.gravity[start:end] = presets['gravity'][preset]
+        self.frame[start:end] = presets['first_frame'][preset] + size * FADE_STEPS
+        
+        self.count = end
+        self.spawned += total
+        self.frame_spawned += total
+    
+    def capture_positions(self):
+        """Guarda as posições atuais como as do passo anterior (interpolação)"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+    
+    def render(self, screen, viewport=None, doreturn=True, alpha=1.0, step=None):
+        """
+        Desenha as partículas visíveis com um único blits()
+        
+        Args:
+            screen: Pygame surface
+            viewport (pygame.Rect): Área visível (None = tela toda)
+            doreturn (bool): Coleta as áreas desenhadas (para dirty rects)
+            alpha (float): Fração entre o passo anterior e o atual
+            step (int): Passo de simulação atual (None = sem interpolação)
+        
+        Returns:
+            list: Áreas da tela desenhadas (vazia se doreturn=False)
+        """
+        n = self.count
+        if n == 0:
+            return []
+        
+        if viewport is None:
+            viewport = screen.get_rect()
+        
+        # Sprite pela idade (passo do fade)
+        fade = (self.age[:n] / self.life[:n] * FADE_STEPS).astype(np.int32)
+        frame = self.frame[:n] + np.minimum(fade, FADE_STEPS - 1)
+        radius = self.frame_radius[frame]
+        x = self.x[:n]
+        y = self.y[:n]
+        if step is not None and alpha < 1.0:
+            x = self.prev_x[:n] + (x - self.prev_x[:n]) * alpha
+            y = self.prev_y[:n] + (y - self.prev_y[:n]) * alpha
+        left = x.astype(np.int32) - radius
+        top = y.astype(np.int32) - radius
+        
+        # Culling
+        visible = (
+            (left < viewport.right) & (left + radius * 2 > viewport.left) &
+            (top < viewport.bottom) & (top + radius * 2 > viewport.top)
+        )
+        if not visible.all():
+            frame = frame[visible]
+            left = left[visible]
+            top = top[visible]
+        
+        frames = self.frames
+        return screen.blits(
+            [(frames[f], (l, t)) for f, l, t in zip(frame.tolist(), left.tolist(), top.tolist())],
+            doreturn=doreturn
+        ) or []
+    
+    def clear(self):
+        """Remove todas as partículas, emissores e rajadas pendentes"""
+        self.count = 0
+        self.emitter_active[:] = False
+        self.pending = []
+        self.frame_spawned = 0
+    
+    def get_stats(self):
+        """
+        Estatísticas do sistema
+        
+        Returns:
+            dict: Partículas vivas, emissores, criadas, cortadas e pico
+        """
+        return {
+            'particles': self.count,
+            'emitters': int(np.count_nonzero(self.emitter_active)),
+            'spawned': self.spawned,
+            'dropped': self.dropped,
+            'peak': self.peak,
+        }
@@ -0,0 +1,78 @@
+"""
+Particles - Presets dos efeitos de partículas
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+
+
+# Cada preset descreve uma rajada (burst) ou um emissor contínuo:
+#   count: partículas por rajada
+#   rate: partículas por segundo quando usado como emissor
+#   speed / life: intervalos (mín, máx) sorteados por partícula
+#   direction / spread: ângulo central e abertura em graus (0 = direita, 90 = baixo)
+#   sizes: raios possíveis (cada um vira um conjunto de sprites)
+#   colors: cor inicial e final (o alpha cai junto até o fim da vida)
+#   drag: perda de velocidade por segundo (fração)
+#   gravity: aceleração vertical (px/s², negativo sobe)
+PARTICLE_PRESETS = {
+    'explosion': {
+        'count': 24,
+        'rate': 0,
+        'speed': (60, 260),
+        'life': (0.35, 0.8),
+        'direction': 0,
+        'spread': 360,
+        'sizes': (2, 3, 4),
+        'colors': ((255, 220, 90), (200, 40, 0)),
+        'drag': 2.5,
+        'gravity': 0,
+    },
+    'explosion_large': {
+        'count': 64,
+        'rate': 0,
+        'speed': (80, 380),
+        'life': (0.5, 1.2),
+        'direction': 0,
+        'spread': 360,
+        'sizes': (3, 4, 6),
+        'colors': ((255, 240, 160), (180, 30, 0)),
+        'drag': 2.0,
+        'gravity': 0,
+    },
+    'card_pickup': {
+        'count': 36,
+        'rate': 0,
+        'speed': (40, 220),
+        'life': (0.6, 1.0),
+        'direction': 0,
+        'spread': 360,
+        'sizes': (2, 3),
+        'colors': (COLOR_CYAN, COLOR_WHITE),
+        'drag': 3.0,
+        'gravity': -60,
+    },
+    'card_sparkle': {
+        'count': 1,
+        'rate': 40,
+        'speed': (20, 80),
+        'life': (0.3, 0.6),
+        'direction': 270,
+        'spread': 120,
+        'sizes': (1, 2),
+        'colors': (COLOR_WHITE, COLOR_CYAN),
+        'drag': 1.0,
+        'gravity': -40,
+    },
+}
+
+# Efeito de morte por tipo de inimigo
+DEATH_EFFECTS = {
+    'kamikaze': 'explosion',
+    'range': 'explosion',
+    'mother': 'explosion_large',
+}
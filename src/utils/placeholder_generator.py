@@ -59,6 +59,66 @@ def create_collectible_sprite(size=12):
     return surface
 
 
+def create_particle_sprite(radius=3, color=(255, 255, 255, 255)):
+    """Cria sprite de partícula (ponto com núcleo mais forte, cor RGBA)"""
+    size = radius * 2
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    
+    r, g, b, a = color
+    pygame.draw.circle(surface, (r, g, b, a // 2), (radius, radius), radius)
+    pygame.draw.circle(surface, (r, g, b, a), (radius, radius), max(1, radius - 1))
+    
+    return surface
+
+
+# Fábricas por tipo: (tamanho, cor) -> Surface nova
+SPRITE_FACTORIES = {
+    'player': lambda size, color: create_player_sprite(size),
+    'enemy': lambda size, color: create_enemy_sprite(size, color or COLOR_RED),
+    'projectile': lambda size, color: create_projectile_sprite(*size, color or COLOR_YELLOW),
+    'collectible': lambda size, color: create_collectible_sprite(size),
+    'particle': lambda size, color: create_particle_sprite(size, color or (255, 255, 255, 255)),
+}
+
+# Registry de sprites: (tipo, tamanho, cor) -> Surface compartilhada
+_sprites = {}
+
+
+def get_sprite(kind, size, color=None):
+    """
+    Retorna um sprite compartilhado (flyweight), criado uma única vez
+    
+    Entidades com a mesma aparência usam a mesma superfície, então
+    ninguém deve desenhar nela ou alterar seu alpha.
+    
+    Args:
+        kind (str): Tipo do sprite (ver SPRITE_FACTORIES)
+        size: Tamanho (int) ou (largura, altura) para projéteis
+        color (tuple): Cor RGB (None = padrão do tipo)
+    
+    Returns:
+        pygame.Surface: Sprite (convert_alpha se já houver display)
+    """
+    key = (kind, size, tuple(color) if color is not None else None)
+    sprite = _sprites.get(key)
+    
+    if sprite is None:
+        sprite = SPRITE_FACTORIES[kind](size, color)
+        
+        # convert_alpha exige um display criado
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        
+        _sprites[key] = sprite
+    
+    return sprite
+
+
+def clear_sprite_cache():
+    """Esvazia o registry (ex: depois de trocar o modo de vídeo)"""
+    _sprites.clear()
+
+
 if __name__ == "__main__":
     """Testa a geração de sprites"""
     pygame.init()
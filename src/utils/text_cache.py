@@ -0,0 +1,150 @@
+"""
+Text Cache - Registry de fontes e cache de superfícies de texto
+"""
+
+from collections import OrderedDict
+import pygame
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from constants import *
+
+
+# Registry de fontes: (nome, tamanho) -> pygame.font.Font
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """
+    Retorna uma fonte compartilhada (criada uma única vez)
+    
+    Args:
+        size (int): Tamanho da fonte
+        name (str): Arquivo da fonte (None = fonte padrão do pygame)
+    
+    Returns:
+        pygame.font.Font: Fonte
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """
+    Cache LRU de textos renderizados
+    
+    Chave: (fonte, tamanho, texto, cor). Ideal para textos que se repetem
+    (títulos, instruções, countdown). Valores que mudam o tempo todo
+    (HP, minérios) devem usar TextLabel para não expulsar os outros.
+    
+    As superfícies são compartilhadas: quem precisar alterar alpha deve
+    usar uma cópia ou um TextLabel próprio.
+    """
+    
+    def __init__(self, max_entries=256):
+        """
+        Inicializa o cache
+        
+        Args:
+            max_entries (int): Quantidade máxima de superfícies guardadas
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, text, size, color, font_name=None):
+        """
+        Retorna a superfície de um texto (renderiza só na primeira vez)
+        
+        Args:
+            text (str): Texto
+            size (int): Tamanho da fonte
+            color (tuple): Cor RGB
+            font_name (str): Arquivo da fonte (None = padrão)
+        
+        Returns:
+            pygame.Surface: Texto renderizado (antialias)
+        """
+        key = (font_name, size, text, tuple(color))
+        entries = self.entries
+        
+        surface = entries.get(key)
+        if surface is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = get_font(size, font_name).render(text, True, color)
+        entries[key] = surface
+        
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        
+        return surface
+    
+    def clear(self):
+        """Esvazia o cache"""
+        self.entries.clear()
+
+
+# Instância global
+text_cache = TextCache()
+
+
+def render_text(text, size, color, font_name=None):
+    """Atalho para text_cache.render"""
+    return text_cache.render(text, size, color, font_name)
+
+
+class TextLabel:
+    """
+    Texto que só é re-renderizado quando o valor muda
+    
+    Para HUD: HP, minérios, setor... Cada label guarda a própria
+    superfície, fora do LRU.
+    """
+    
+    def __init__(self, size, color=COLOR_WHITE, font_name=None):
+        """
+        Inicializa o label
+        
+        Args:
+            size (int): Tamanho da fonte
+            color (tuple): Cor padrão
+            font_name (str): Arquivo da fonte (None = padrão)
+        """
+        self.font = get_font(size, font_name)
+        self.default_color = color
+        self.color = color
+        self.text = None
+        self.surface = None
+        self.renders = 0
+    
+    def render(self, text, color=None):
+        """
+        Atualiza o texto (se mudou) e retorna a superfície
+        
+        Args:
+            text (str): Texto atual
+            color (tuple): Cor atual (None = cor padrão)
+        
+        Returns:
+            pygame.Surface: Texto renderizado
+        """
+        color = color or self.default_color
+        
+        if self.surface is None or text != self.text or color != self.color:
+            self.text = text
+            self.color = color
+            self.surface = self.font.render(text, True, color)
+            self.renders += 1
+        
+        return self.surface
@@ -6,9 +6,10 @@ import pygame
 from constants import *
 from config import config
 from src.entities.player import Player
-from src.entities.projectile import Projectile
 from src.entities.enemy_kamikaze import EnemyKamikaze
-from src.systems.object_pool import ObjectPool
+from src.core.run_context import run_context
+from src.systems.enemy_ai import enemy_ai_system
+from src.systems.projectile_buffer import ProjectileBuffer
 from src.systems.collision import CollisionSystem
 
 
@@ -21,8 +22,8 @@ def main():
     # Player
     player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 200)
     
-    # Projéteis
-    projectile_pool = ObjectPool(Projectile, initial_size=50)
+    # Projéteis (arrays → process_collisions usa o kernel vetorizado)
+    projectile_pool = ProjectileBuffer(capacity=50)
     
     # Inimigos
     enemies = []
@@ -84,8 +85,11 @@ def main():
         
         # Update inimigos
         player_pos = (player.x, player.y)
+        run_context.clock.advance(dt)
+        enemy_ai_system(run_context.world, dt, player_pos, run_context.clock.get_ticks())
+        run_context.world.update(dt)
+        
         for enemy in enemies[:]:
-            enemy.update(dt, player_pos)
             if not enemy.active:
                 enemies.remove(enemy)
         
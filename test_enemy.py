@@ -6,6 +6,7 @@ import pygame
 from constants import *
 from config import config
 from src.entities.enemy import Enemy
+from src.core.run_context import run_context
 
 
 def main():
@@ -70,8 +71,7 @@ def main():
                     print(f"Matou {killed} inimigos")
         
         # Update
-        for enemy in enemies:
-            enemy.update(dt)
+        run_context.world.update(dt)
         
         # Render
         screen.fill(COLOR_BLACK)
@@ -7,6 +7,8 @@ from constants import *
 from config import config
 from src.entities.player import Player
 from src.entities.enemy_kamikaze import EnemyKamikaze
+from src.core.run_context import run_context
+from src.systems.enemy_ai import enemy_ai_system
 
 
 def main():
@@ -104,8 +106,9 @@ def main():
         player.update(dt, move_x, move_y)
         
         player_pos = (player.x, player.y)
-        for kamikaze in kamikazes:
-            kamikaze.update(dt, player_pos)
+        run_context.clock.advance(dt)
+        enemy_ai_system(run_context.world, dt, player_pos, run_context.clock.get_ticks())
+        run_context.world.update(dt)
         
         # Auto-spawn
         spawn_timer += dt
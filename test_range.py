@@ -8,6 +8,8 @@ from config import config
 from src.entities.player import Player
 from src.entities.projectile import Projectile
 from src.entities.enemy_range import EnemyRange
+from src.core.run_context import run_context
+from src.systems.enemy_ai import enemy_ai_system
 from src.systems.object_pool import ObjectPool
 from src.systems.collision import CollisionSystem
 
@@ -107,9 +109,11 @@ def main():
         
         # Update inimigos Range
         player_pos = (player.x, player.y) if player.alive else None
+        run_context.clock.advance(dt)
+        enemy_ai_system(run_context.world, dt, player_pos, run_context.clock.get_ticks())
+        run_context.world.update(dt)
+        
         for enemy in enemies[:]:
-            enemy.update(dt, player_pos)
-            
             # Inimigos Range atiram
             if enemy.can_fire():
                 enemy.shoot(projectile_pool, player_pos)